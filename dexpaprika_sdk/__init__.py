@@ -11,15 +11,25 @@ across multiple blockchain networks.
 """
 
 from .client import DexPaprikaClient
+from .async_client import AsyncDexPaprikaClient
+from .tailer import TransactionTailer, AsyncTransactionTailer
+from .candle_store import CandleStore
+from .cache_backends import CacheBackend, SQLiteCacheBackend, KeyValueCacheBackend
+from .batch import BatchCall
+from .ratelimit import RateLimiter, TokenBucket
+from .breaker import CircuitBreaker, CircuitOpenError
+from .exceptions import NotFoundError, AsyncNotFoundError
 # Import models for easier access
 from .models import (
     Network, Dex, DexesResponse,
     Token, Pool, PoolsResponse, TimeIntervalMetrics,
-    PoolDetails, OHLCVRecord, Transaction, TransactionsResponse,
+    PoolDetails, OHLCVRecord, OHLCVGap, OHLCVWindowError, OHLCVHistoryResponse,
+    Transaction, TransactionsResponse,
     FilteredPool, PoolFilterResponse,
     TokenSummary, TokenDetails,
     TopTokenTimeMetrics, TopToken, TopTokensResponse,
     FilteredToken, TokenFilterResponse, TokenPrice,
+    PriceChunkError, BulkPricesResponse,
     DexInfo, SearchResult,
     Stats
 )
@@ -27,14 +37,30 @@ from .models import (
 __version__ = "0.4.0"
 __all__ = [
     "DexPaprikaClient",
+    "AsyncDexPaprikaClient",
+    "TransactionTailer",
+    "AsyncTransactionTailer",
+    "CandleStore",
+    "CacheBackend",
+    "SQLiteCacheBackend",
+    "KeyValueCacheBackend",
+    "BatchCall",
+    "RateLimiter",
+    "TokenBucket",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "NotFoundError",
+    "AsyncNotFoundError",
     # Models
     "Network", "Dex", "DexesResponse",
     "Token", "Pool", "PoolsResponse", "TimeIntervalMetrics",
-    "PoolDetails", "OHLCVRecord", "Transaction", "TransactionsResponse",
+    "PoolDetails", "OHLCVRecord", "OHLCVGap", "OHLCVWindowError", "OHLCVHistoryResponse",
+    "Transaction", "TransactionsResponse",
     "FilteredPool", "PoolFilterResponse",
     "TokenSummary", "TokenDetails",
     "TopTokenTimeMetrics", "TopToken", "TopTokensResponse",
     "FilteredToken", "TokenFilterResponse", "TokenPrice",
+    "PriceChunkError", "BulkPricesResponse",
     "DexInfo", "SearchResult",
     "Stats",
 ]
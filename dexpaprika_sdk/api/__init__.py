@@ -1,9 +1,10 @@
-from .base import BaseAPI
-from .networks import NetworksAPI
-from .pools import PoolsAPI
-from .tokens import TokensAPI
-from .search import SearchAPI
-from .utils import UtilsAPI
+from .base import BaseAPI, AsyncBaseAPI
+from .networks import NetworksAPI, AsyncNetworksAPI
+from .pools import PoolsAPI, AsyncPoolsAPI
+from .tokens import TokensAPI, AsyncTokensAPI
+from .search import SearchAPI, AsyncSearchAPI
+from .utils import UtilsAPI, AsyncUtilsAPI
+from .dexes import DexesAPI, AsyncDexesAPI
 
 __all__ = [
     "BaseAPI",
@@ -12,4 +13,13 @@ __all__ = [
     "TokensAPI",
     "SearchAPI",
     "UtilsAPI",
+    "DexesAPI",
+    # Async
+    "AsyncBaseAPI",
+    "AsyncNetworksAPI",
+    "AsyncPoolsAPI",
+    "AsyncTokensAPI",
+    "AsyncSearchAPI",
+    "AsyncUtilsAPI",
+    "AsyncDexesAPI",
 ]
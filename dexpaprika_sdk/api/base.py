@@ -1,40 +1,32 @@
-from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING, Callable, TypeVar, Set
-import hashlib
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING, Callable, TypeVar, Set
+import asyncio
 import json
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+
+from pydantic import BaseModel
+
+from .cache import CacheEntry, CacheKey, CacheStats
+from ..breaker import CircuitOpenError
+from ..cache_backends import StoredResponse
+from ..exceptions import AsyncNotFoundError, NotFoundError
+from ..models.base import construct_model
 
 if TYPE_CHECKING:
     from ..client import DexPaprikaClient
 
 T = TypeVar('T')
-
-class CacheEntry:
-    """Class representing a cached response with an expiration time."""
-    
-    def __init__(self, data: Any, expires_at: Optional[datetime] = None):
-        """
-        Initialize a new cache entry.
-        
-        Args:
-            data: The data to cache
-            expires_at: The time when the cache entry expires
-        """
-        self.data = data
-        self.expires_at = expires_at
-        
-    def is_expired(self) -> bool:
-        """
-        Check if the cache entry has expired.
-        
-        Returns:
-            True if the cache entry has expired, False otherwise
-        """
-        return self.expires_at is not None and datetime.now() > self.expires_at
-
+M = TypeVar('M')
 
 class BaseAPI:
     """Base class for all API service classes."""
 
+    # raised by _check_not_found
+    _not_found_error = NotFoundError
+
     def __init__(self, client: "DexPaprikaClient"):
         """
         Initialize a new API service.
@@ -43,7 +35,12 @@ class BaseAPI:
             client: The DexPaprika client instance
         """
         self.client = client
-        self._cache: Dict[str, CacheEntry] = {}  # TTL-based cache
+        # the client's response cache and request coalescer, shared by all
+        # services: a URL fetched by one service is a hit for the others
+        self._cache = client._cache
+        self._inflight = client._inflight
+        # lookups made by this service
+        self.cache_stats = CacheStats()
         
         # Default TTLs for different types of data
         self._cache_ttls = {
@@ -53,8 +50,27 @@ class BaseAPI:
             "stats": timedelta(minutes=15),   # Stats change moderately
             "default": timedelta(minutes=5)   # Default TTL for other endpoints
         }
+        
+        # How long past its TTL a response may still be served, per TTL class:
+        # right away while it is refreshed in the background
+        # (stale-while-revalidate)...
+        self._stale_while_revalidate = {
+            "networks": timedelta(hours=1),
+            "pools": timedelta(minutes=1),
+            "tokens": timedelta(minutes=2),
+            "stats": timedelta(minutes=3),
+            "default": timedelta(minutes=1)
+        }
+        # ...and when fetching a fresh one fails upstream (stale-if-error)
+        self._stale_if_error = {
+            "networks": timedelta(hours=24),
+            "pools": timedelta(minutes=5),
+            "tokens": timedelta(minutes=10),
+            "stats": timedelta(minutes=15),
+            "default": timedelta(minutes=5)
+        }
     
-    def _get_cache_key(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    def _get_cache_key(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
         """
         Generate a unique cache key for the request.
         
@@ -63,16 +79,41 @@ class BaseAPI:
             params: Query parameters
             
         Returns:
-            A unique cache key as a string
+            An (endpoint, sorted params) tuple; the cache indexes entries
+            by endpoint so clear_cache can remove them by path prefix
+        """
+        if not params:
+            return (endpoint, None)
+        # Sort params to ensure consistent keys
+        items = tuple(sorted(params.items()))
+        try:
+            hash(items)
+        except TypeError:
+            # unhashable values (lists, dicts) are keyed by their JSON form
+            return (endpoint, json.dumps(params, sort_keys=True, default=str))
+        return (endpoint, items)
+    
+    def _get_ttl_class(self, endpoint: str) -> str:
         """
-        key_parts = [endpoint]
-        if params:
-            # Sort params to ensure consistent keys
-            sorted_params = json.dumps(params, sort_keys=True)
-            key_parts.append(sorted_params)
+        Get the TTL class of an endpoint: its innermost resource type.
         
-        key_string = ":".join(key_parts)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        "/networks" is the network list, but "/networks/{id}/pools/{address}"
+        is pool data and "/networks/{id}/tokens/{address}/pools" a pool list.
+        
+        Args:
+            endpoint: API endpoint
+            
+        Returns:
+            A key of _cache_ttls
+        """
+        segments = endpoint.strip("/").split("/")
+        if len(segments) > 1 and segments[0] == "networks":
+            # endpoints scoped to one network
+            segments = segments[2:]
+        for segment in reversed(segments):
+            if segment in self._cache_ttls and segment != "default":
+                return segment
+        return "default"
     
     def _get_ttl(self, endpoint: str) -> timedelta:
         """
@@ -84,10 +125,26 @@ class BaseAPI:
         Returns:
             The TTL as a timedelta
         """
-        for key, ttl in self._cache_ttls.items():
-            if key in endpoint:
-                return ttl
-        return self._cache_ttls["default"]
+        return self._cache_ttls[self._get_ttl_class(endpoint)]
+    
+    def _get_stale_windows(self, endpoint: str) -> Tuple[timedelta, timedelta]:
+        """
+        Get how long past its TTL an endpoint's response may be served stale.
+        
+        Args:
+            endpoint: API endpoint
+            
+        Returns:
+            The stale-while-revalidate and stale-if-error windows (zero when
+            the client's serve_stale is disabled)
+        """
+        if not self.client.serve_stale:
+            return timedelta(0), timedelta(0)
+        ttl_class = self._get_ttl_class(endpoint)
+        return (
+            self._stale_while_revalidate.get(ttl_class, self._stale_while_revalidate["default"]),
+            self._stale_if_error.get(ttl_class, self._stale_if_error["default"]),
+        )
     
     def _get(
         self, 
@@ -110,25 +167,392 @@ class BaseAPI:
         """
         if skip_cache:
             return self.client.get(endpoint, params=params)
+        return self._get_entry(endpoint, params, ttl).data
+    
+    def _get_entry(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[timedelta] = None,
+        cache_not_found: bool = False
+    ) -> CacheEntry:
+        """
+        Get the cache entry for a request, fetching it on a miss.
+        
+        An entry that expired less than its stale-while-revalidate window
+        ago is returned right away while a background refresh replaces it.
+        If fetching fails upstream, an entry within its stale-if-error
+        window is returned instead of the error. A cached 404 is raised
+        again (see _remember_not_found).
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            ttl: Custom TTL for this request
+            cache_not_found: Cache a 404 for the client's not_found_ttl
             
+        Returns:
+            The cache entry holding the response data
+        """
         cache_key = self._get_cache_key(endpoint, params)
-        cache_entry = self._cache.get(cache_key)
+        cache_entry = self._cache.get_stale(cache_key)
+        if cache_entry is None:
+            cache_entry = self._load_shared(cache_key, endpoint, params)
         
-        # Return cached data if valid
-        if cache_entry and not cache_entry.is_expired():
-            return cache_entry.data
+        # Return cached data if valid, or stale while it is being refreshed
+        if cache_entry is not None:
+            if not cache_entry.is_expired():
+                self.cache_stats.hit()
+                if cache_entry.error is not None:
+                    raise cache_entry.error.with_traceback(None)
+                return cache_entry
+            if cache_entry.can_revalidate():
+                if self._cache.begin_refresh(cache_entry):
+                    self._refresh_in_background(cache_key, cache_entry, endpoint, params, ttl)
+                self.cache_stats.stale_hit()
+                return cache_entry
             
-        # Get fresh data
-        result = self.client.get(endpoint, params=params)
+        # Get fresh data, sharing the fetch with concurrent identical requests
+        self.cache_stats.miss()
+        try:
+            return self._inflight.do(
+                cache_key, lambda: self._fetch(cache_key, endpoint, params, ttl, cache_not_found)
+            )
+        except Exception as e:
+            return self._stale_or_raise(cache_key, endpoint, e)
+    
+    def _refresh_in_background(
+        self,
+        cache_key: CacheKey,
+        entry: CacheEntry,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        ttl: Optional[timedelta]
+    ) -> None:
+        """Refetch an expired entry on the client's refresh workers."""
+        def refresh() -> None:
+            try:
+                self._inflight.do(cache_key, lambda: self._fetch(cache_key, endpoint, params, ttl))
+            except Exception:
+                # keep serving the stale entry; the next hit retries
+                entry.refreshing = False
         
+        self.client._submit_refresh(refresh)
+    
+    def _stale_or_raise(self, cache_key: CacheKey, endpoint: str, error: Exception) -> CacheEntry:
+        """
+        Fall back to an expired entry when fetching failed upstream, or raise ``error``.
+        
+        Upstream failures (see the client's _is_upstream_failure) may be
+        answered with an entry within its stale-if-error window; an open
+        circuit also with one within the breaker's ``stale_for``.
+        """
+        if not self.client._is_upstream_failure(error):
+            raise error
+        stale_entry = self._cache.get_stale(cache_key)
+        if stale_entry is None or stale_entry.expires_at is None:
+            raise error
+        
+        window = self._get_stale_windows(endpoint)[1].total_seconds()
+        breaker = self.client.circuit_breaker
+        if isinstance(error, CircuitOpenError) and breaker is not None and breaker.stale_for:
+            window = max(window, breaker.stale_for)
+        if time.monotonic() > stale_entry.expires_at + window:
+            raise error
+        self.cache_stats.stale_hit()
+        return stale_entry
+    
+    def _get_model(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        model: Any = None,
+        parse: Optional[Callable[[Any], M]] = None,
+        many: bool = False,
+        skip_cache: bool = False,
+        ttl: Optional[timedelta] = None,
+        cache_not_found: bool = False
+    ) -> Union[M, Any]:
+        """
+        Make a GET request and parse the response, caching the parsed result.
+        
+        The parsed model is kept on the cache entry next to the raw data,
+        so cache hits skip parsing it again. Each caller gets a shallow copy
+        (see _copy_parsed): its fields and top-level lists are private, but
+        nested models are shared and must not be mutated (use
+        ``model_copy(deep=True)`` for a fully private copy). With
+        the client's ``cache_models`` disabled, or validation="none", every
+        call parses (or returns) the cached data afresh.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            model: Model class passed to _parse (when ``parse`` is not given)
+            parse: Function turning the response data into the result; must
+                compare equal across calls (a bound method or function) for
+                its result to be reused
+            many: Parse a list response with _parse_list instead
+            skip_cache: Whether to skip the cache and force a fresh request
+            ttl: Custom TTL for this request
+            cache_not_found: Cache a 404 for the client's not_found_ttl
+                (for lookups of a single token or pool)
+            
+        Returns:
+            The parsed response
+        """
+        if parse is None:
+            parse = partial(self._parse_list if many else self._parse, model)
+            key = (model, many)
+        else:
+            key = parse
+        
+        if skip_cache:
+            return parse(self.client.get(endpoint, params=params))
+        
+        entry = self._get_entry(endpoint, params, ttl, cache_not_found)
+        return self._parse_entry(entry, key, parse)
+    
+    def _parse_entry(self, entry: CacheEntry, key: Any, parse: Callable[[Any], M]) -> Union[M, Any]:
+        """Parse a cache entry's data once per parser and validation mode."""
+        if self.client.validation == "none":
+            # raw data is the cached response itself
+            return self._copy_parsed(parse(entry.data))
+        if not self.client.cache_models:
+            return parse(entry.data)
+        key = (key, self.client.validation)
+        # threads racing on a fresh entry may each parse; either result is kept
+        parsed = entry.parsed.get(key)
+        if parsed is None:
+            parsed = entry.parsed[key] = parse(entry.data)
+        return self._copy_parsed(parsed)
+
+    @staticmethod
+    def _copy_parsed(parsed: Any) -> Any:
+        """
+        Copy a cached parse result for one caller.
+        
+        Models and raw dicts are copied with their list and dict fields, and
+        list results are copied, so reassigning fields or appending to
+        ``page.pools`` does not leak into the cache. Items are shared: a deep
+        copy would cost as much as parsing again.
+        """
+        if isinstance(parsed, list):
+            return list(parsed)
+        if isinstance(parsed, dict):
+            copied = fields = dict(parsed)
+        elif isinstance(parsed, BaseModel):
+            copied = parsed.model_copy()
+            fields = copied.__dict__
+        else:
+            return parsed
+        for name, value in list(fields.items()):
+            if isinstance(value, (list, dict)):
+                fields[name] = value.copy()
+        return copied
+    
+    def _fetch(
+        self,
+        cache_key: CacheKey,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        ttl: Optional[timedelta],
+        cache_not_found: bool = False
+    ) -> CacheEntry:
+        """
+        Fetch a response and cache it.
+        
+        Runs once per cache miss, on behalf of every concurrent caller.
+        
+        Args:
+            cache_key: Key produced by _get_cache_key
+            endpoint: API endpoint
+            params: Query parameters
+            ttl: Custom TTL for this request
+            cache_not_found: Cache a 404 (see _remember_not_found)
+            
+        Returns:
+            The new cache entry
+        """
+        # A previous leader, or another process sharing the cache backend,
+        # may have fetched it since our lookup
+        cache_entry = self._get_cached(cache_key) or self._load_shared(cache_key, endpoint, params, fresh=True)
+        if cache_entry is not None:
+            if cache_entry.error is not None:
+                raise cache_entry.error.with_traceback(None)
+            return cache_entry
+        
+        try:
+            result = self.client.get(endpoint, params=params)
+        except Exception as e:
+            if cache_not_found:
+                self._remember_not_found(cache_key, e)
+            raise
+        return self._set_cached(cache_key, endpoint, result, ttl, params)
+    
+    def _remember_not_found(self, cache_key: CacheKey, error: Exception) -> None:
+        """
+        Cache a 404 for the client's not_found_ttl, so repeated lookups fail without a request.
+        
+        Only done for requests made with ``cache_not_found`` (the
+        get_details lookups), only kept in memory, and never served stale:
+        once the TTL passes the next lookup asks the API again.
+        
+        Args:
+            cache_key: Key produced by _get_cache_key
+            error: The exception the fetch raised
+        """
+        not_found_ttl = self.client.not_found_ttl
+        if not_found_ttl and self.client._is_not_found(error):
+            self._cache.set(cache_key, CacheEntry(None, time.monotonic() + not_found_ttl, error=error))
+    
+    def _check_not_found(self, error: Exception, resource: str, network_id: str, address: str) -> None:
+        """
+        Raise NotFoundError for a lookup that failed with a 404; other errors are left to the caller.
+        
+        Args:
+            error: The exception the lookup raised
+            resource: Kind of resource looked up ("token" or "pool")
+            network_id: Network ID of the lookup
+            address: Address looked up
+            
+        Raises:
+            NotFoundError: If the error is a 404 (AsyncNotFoundError on the async client)
+        """
+        if self.client._is_not_found(error):
+            raise self._not_found_error(
+                resource, network_id, address, response=error.response, request=getattr(error, "request", None),
+            ) from error
+    
+    def _get_cached(self, cache_key: CacheKey) -> Optional[CacheEntry]:
+        """
+        Look up a cache entry that has not expired yet.
+        
+        Args:
+            cache_key: Key produced by _get_cache_key
+            
+        Returns:
+            The cache entry, or None on a miss or an expired entry
+        """
+        # expired entries are dropped by the cache on read
+        return self._cache.get(cache_key)
+    
+    def _set_cached(
+        self,
+        cache_key: CacheKey,
+        endpoint: str,
+        data: Any,
+        ttl: Optional[timedelta] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> CacheEntry:
+        """
+        Store a response in the cache, and in the client's cache backend if any.
+        
+        Args:
+            cache_key: Key produced by _get_cache_key
+            endpoint: API endpoint, used to pick the default TTL
+            data: The response data to cache
+            ttl: Custom TTL for this entry
+            params: Query parameters, part of the backend key
+            
+        Returns:
+            The stored entry
+        """
         # Cache the result with appropriate TTL
         if ttl is None:
             ttl = self._get_ttl(endpoint)
             
-        expires_at = datetime.now() + ttl
-        self._cache[cache_key] = CacheEntry(result, expires_at)
+        expires_at = time.monotonic() + ttl.total_seconds()
+        # keep entries past their TTL for as long as they may be served stale
+        revalidate_for, stale_for = (window.total_seconds() for window in self._get_stale_windows(endpoint))
+        breaker = self.client.circuit_breaker
+        if breaker is not None and breaker.stale_for:
+            stale_for = max(stale_for, breaker.stale_for)
+        entry = CacheEntry(
+            data,
+            expires_at,
+            stale_until=expires_at + max(revalidate_for, stale_for),
+            revalidate_until=expires_at + revalidate_for,
+        )
+        self._store_shared(endpoint, params, entry)
+        self._cache.set(cache_key, entry)
+        return entry
+    
+    def _shared_key(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Get the cache backend key of a request: the endpoint, then its sorted parameters.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            
+        Returns:
+            A key starting with the endpoint, so backends can clear by prefix
+        """
+        if not params:
+            return endpoint
+        return f"{endpoint}?{json.dumps(params, sort_keys=True, separators=(',', ':'), default=str)}"
+    
+    def _load_shared(
+        self,
+        cache_key: CacheKey,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        fresh: bool = False
+    ) -> Optional[CacheEntry]:
+        """
+        Look up a response in the client's cache backend and keep it in memory.
+        
+        Args:
+            cache_key: Key produced by _get_cache_key
+            endpoint: API endpoint
+            params: Query parameters
+            fresh: Ignore expired responses
             
-        return result
+        Returns:
+            The entry, possibly expired but within its stale window, or None
+        """
+        backend = self.client.cache_backend
+        if backend is None:
+            return None
+        try:
+            stored = backend.get(self._shared_key(endpoint, params))
+            if stored is None or (fresh and stored.expires_at < time.time()):
+                return None
+            data = self.client.decode_json(stored.body)
+        except Exception:
+            # a broken backend degrades to a cache miss
+            backend.errors += 1
+            return None
+        
+        # backends keep wall-clock times, shared by every process
+        offset = time.monotonic() - time.time()
+        entry = CacheEntry(
+            data,
+            stored.expires_at + offset,
+            size=len(stored.body),
+            stale_until=stored.stale_until + offset,
+            revalidate_until=stored.revalidate_until + offset,
+        )
+        self._cache.set(cache_key, entry)
+        return entry
+    
+    def _store_shared(self, endpoint: str, params: Optional[Dict[str, Any]], entry: CacheEntry) -> None:
+        """Write a fetched entry through to the client's cache backend, if any."""
+        backend = self.client.cache_backend
+        if backend is None:
+            return
+        try:
+            body = json.dumps(entry.data, separators=(",", ":")).encode()
+            entry.size = len(body)
+            offset = time.time() - time.monotonic()
+            backend.set(self._shared_key(endpoint, params), StoredResponse(
+                body,
+                entry.expires_at + offset,
+                entry.revalidate_until + offset,
+                entry.stale_until + offset,
+            ))
+        except Exception:
+            backend.errors += 1
     
     def _post(self, endpoint: str, data: Dict[str, Any], params: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
@@ -202,24 +626,527 @@ class BaseAPI:
         if max_val is not None and value > max_val:
             raise ValueError(f"{param_name} must be at most {max_val}")
     
+    def _parse(self, model: Callable[..., M], data: Any, raw: bool = True) -> Union[M, Any]:
+        """
+        Turn decoded response data into a model according to the client's validation mode.
+        
+        Args:
+            model: Model class to build
+            data: Decoded response data
+            raw: Return ``data`` unchanged when validation is "none"; pass
+                False where the SDK itself needs a model
+            
+        Returns:
+            A validated model ("full"), an unvalidated model ("trusted"),
+            or the data itself ("none")
+        """
+        validation = self.client.validation
+        if validation == "full":
+            return model(**data)
+        if validation == "none" and raw:
+            return data
+        return construct_model(model, data)
+    
+    def _parse_list(self, model: Callable[..., M], data: List[Any], raw: bool = True) -> List[Union[M, Any]]:
+        """Parse each item of a list response with _parse."""
+        if self.client.validation == "none" and raw:
+            return data
+        return [self._parse(model, item, raw) for item in data]
+    
+    @staticmethod
+    def _field(obj: Any, name: str, default: Any = None) -> Any:
+        """Read a field from a model or, with validation="none", a raw dict."""
+        if isinstance(obj, dict):
+            return obj.get(name, default)
+        return getattr(obj, name, default)
+    
+    @staticmethod
+    def _page_info(response: Any, name: str) -> Any:
+        """Read a page_info field from a model or raw dict response."""
+        return BaseAPI._field(BaseAPI._field(response, "page_info"), name)
+    
+    @staticmethod
+    def _has_next_page(response: Any, page: int, items_attr: str, base_page: int = 0) -> bool:
+        """
+        Decide whether a paginated endpoint has another page after this one.
+        
+        Args:
+            response: Parsed page response with a page_info attribute
+            page: Page number of this response
+            items_attr: Name of the attribute holding the page's items
+            base_page: Number of the endpoint's first page (0 or 1)
+            
+        Returns:
+            True if another page should be requested
+        """
+        field = BaseAPI._field
+        items = field(response, items_attr)
+        page_info = field(response, "page_info")
+        if not items or page_info is None:
+            return False
+        if field(page_info, "next_cursor"):
+            return True
+        total_pages = field(page_info, "total_pages")
+        if total_pages is not None:
+            # total_pages counts from the endpoint's first page, not from
+            # where the iteration started
+            return page < base_page + total_pages - 1
+        # no totals reported: keep going while pages come back full
+        return len(items) >= field(page_info, "limit")
+    
+    def _iter_pages(
+        self,
+        fetch_page: Callable[[int, Optional[str]], Any],
+        items_attr: str,
+        first_page: int,
+        prefetch: bool = False,
+        window: int = 1,
+        base_page: int = 0
+    ) -> Iterator[Any]:
+        """
+        Stream page responses from a paginated endpoint.
+        
+        Args:
+            fetch_page: Called with (page, cursor) and returning a parsed page
+            items_attr: Name of the attribute holding each page's items
+            first_page: Page number to start from
+            prefetch: Fetch the next page in the background while the
+                current one is being consumed
+            window: Pages to fetch concurrently once the first response
+                reports total_pages (see _sweep_pages)
+            base_page: Number of the endpoint's first page (0 or 1)
+            
+        Yields:
+            One parsed response per page
+        """
+        response = fetch_page(first_page, None)
+        total_pages = self._page_info(response, "total_pages")
+        if window > 1 and total_pages is not None and not self._page_info(response, "next_cursor"):
+            yield from self._sweep_pages(fetch_page, items_attr, first_page, response, window, base_page)
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        pending = None
+        page = first_page
+        try:
+            while True:
+                has_next = self._has_next_page(response, page, items_attr, base_page)
+                cursor = self._page_info(response, "next_cursor") if has_next else None
+                if has_next and executor is not None:
+                    pending = executor.submit(fetch_page, page + 1, cursor)
+                
+                yield response
+                
+                if not has_next:
+                    return
+                page += 1
+                response = pending.result() if pending is not None else fetch_page(page, cursor)
+                pending = None
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+    
+    def _sweep_pages(
+        self,
+        fetch_page: Callable[[int, Optional[str]], Any],
+        items_attr: str,
+        first_page: int,
+        first_response: Any,
+        window: int,
+        base_page: int = 0
+    ) -> Iterator[Any]:
+        """
+        Fetch the remaining pages concurrently within a sliding window.
+        
+        Up to ``window`` pages are in flight at once. Responses are yielded
+        in page order, and no further pages are requested once a page comes
+        back empty (total_pages may be stale by the time we get there).
+        
+        Args:
+            fetch_page: Called with (page, cursor) and returning a parsed page
+            items_attr: Name of the attribute holding each page's items
+            first_page: Page number of first_response
+            first_response: Already fetched first page, reporting total_pages
+            window: Maximum number of pages in flight
+            base_page: Number of the endpoint's first page (0 or 1)
+            
+        Yields:
+            One parsed response per page, in page order
+        """
+        yield first_response
+        
+        # total_pages counts from the endpoint's first page, not first_page
+        last_page = base_page + self._page_info(first_response, "total_pages") - 1
+        if not self._field(first_response, items_attr) or last_page <= first_page:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=window)
+        pending: Deque[Future] = deque()
+        next_page = first_page + 1
+        try:
+            while True:
+                while next_page <= last_page and len(pending) < window:
+                    pending.append(executor.submit(fetch_page, next_page, None))
+                    next_page += 1
+                if not pending:
+                    return
+                
+                response = pending.popleft().result()
+                if not self._field(response, items_attr):
+                    return
+                yield response
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    def _iter_items(
+        self,
+        fetch_page: Callable[[int, Optional[str]], Any],
+        items_attr: str,
+        first_page: int,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+        base_page: int = 0
+    ) -> Iterator[Any]:
+        """
+        Stream items across every page of a paginated endpoint.
+        
+        Only the current page (and any prefetched ones) is held in memory;
+        ``fetch_page`` should fetch with skip_cache so that a sweep doesn't
+        fill the shared cache with its pages.
+        
+        Args:
+            fetch_page: Called with (page, cursor) and returning a parsed page
+            items_attr: Name of the attribute holding each page's items
+            first_page: Page number to start from
+            max_items: Stop after yielding this many items
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages to fetch concurrently once total_pages is known
+            base_page: Number of the endpoint's first page (0 or 1)
+            
+        Returns:
+            An iterator over individual items from each page
+            
+        Raises:
+            ValueError: If window is less than 1
+        """
+        self._validate_range("window", window, min_val=1)
+        
+        def items() -> Iterator[Any]:
+            if max_items is not None and max_items <= 0:
+                return
+            count = 0
+            for response in self._iter_pages(fetch_page, items_attr, first_page, prefetch, window, base_page):
+                for item in self._field(response, items_attr):
+                    yield item
+                    count += 1
+                    if max_items is not None and count >= max_items:
+                        return
+        
+        return items()
+    
     def clear_cache(self, endpoint_prefix: Optional[str] = None) -> None:
         """
         Clear the cache, optionally only for endpoints with a specific prefix.
         
+        The cache is shared by every service of the client, so this is the
+        same as DexPaprikaClient.clear_cache.
+        
         Args:
-            endpoint_prefix: Optional prefix to filter which cache entries to clear
+            endpoint_prefix: Optional path prefix of the endpoints to clear
         """
-        if endpoint_prefix:
-            # Get cache keys from the original endpoints that contain the prefix
-            keys_to_remove = []
-            for key in list(self._cache.keys()):
-                cache_entry = self._cache[key]
-                if endpoint_prefix in key:
-                    keys_to_remove.append(key)
-                    
-            # Remove the entries
-            for key in keys_to_remove:
-                del self._cache[key]
+        self.client.clear_cache(endpoint_prefix)
+
+
+class AsyncBaseAPI(BaseAPI):
+    """
+    Base class for asyncio API service classes.
+    
+    Validation, caching and response parsing are inherited from BaseAPI;
+    only the transport methods are coroutines.
+    """
+
+    # also an httpx.HTTPStatusError, like the errors async requests raise
+    _not_found_error = AsyncNotFoundError
+
+    def __init__(self, client: "DexPaprikaClient"):
+        super().__init__(client)
+        # background stale-while-revalidate refreshes
+        self._refresh_tasks: Set["asyncio.Task[None]"] = set()
+
+    @staticmethod
+    async def _to_thread(fn: Callable[..., T], *args: Any) -> T:
+        """Run blocking I/O (SQLite stores, cache backends) on the loop's default executor."""
+        # asyncio.to_thread needs Python 3.9
+        return await asyncio.get_running_loop().run_in_executor(None, partial(fn, *args))
+
+    async def _get(
+        self, 
+        endpoint: str, 
+        params: Optional[Dict[str, Any]] = None,
+        skip_cache: bool = False,
+        ttl: Optional[timedelta] = None
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Make a GET request to the specified endpoint.
+
+        Args:
+            endpoint: API endpoint (e.g., "/networks")
+            params: Query parameters
+            skip_cache: Whether to skip the cache and force a fresh request
+            ttl: Custom TTL for this request
+
+        Returns:
+            Response data as a dictionary or list
+        """
+        if skip_cache:
+            return await self.client.get(endpoint, params=params)
+        return (await self._get_entry(endpoint, params, ttl)).data
+    
+    async def _get_entry(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[timedelta] = None,
+        cache_not_found: bool = False
+    ) -> CacheEntry:
+        """Get the cache entry for a request, fetching it on a miss (see BaseAPI._get_entry)."""
+        cache_key = self._get_cache_key(endpoint, params)
+        cache_entry = self._cache.get_stale(cache_key)
+        if cache_entry is None:
+            cache_entry = await self._load_shared(cache_key, endpoint, params)
+        if cache_entry is not None:
+            if not cache_entry.is_expired():
+                self.cache_stats.hit()
+                if cache_entry.error is not None:
+                    raise cache_entry.error.with_traceback(None)
+                return cache_entry
+            if cache_entry.can_revalidate():
+                if self._cache.begin_refresh(cache_entry):
+                    self._refresh_in_background(cache_key, cache_entry, endpoint, params, ttl)
+                self.cache_stats.stale_hit()
+                return cache_entry
+            
+        self.cache_stats.miss()
+        try:
+            return await self._inflight.do(
+                cache_key, lambda: self._fetch(cache_key, endpoint, params, ttl, cache_not_found)
+            )
+        except Exception as e:
+            return self._stale_or_raise(cache_key, endpoint, e)
+    
+    def _refresh_in_background(
+        self,
+        cache_key: CacheKey,
+        entry: CacheEntry,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        ttl: Optional[timedelta]
+    ) -> None:
+        """Refetch an expired entry in a task (see BaseAPI._refresh_in_background)."""
+        async def refresh() -> None:
+            try:
+                await self._inflight.do(cache_key, lambda: self._fetch(cache_key, endpoint, params, ttl))
+            except asyncio.CancelledError:
+                entry.refreshing = False
+                raise
+            except Exception:
+                entry.refreshing = False
+        
+        # keep a reference so the task isn't garbage collected mid-flight
+        task = asyncio.ensure_future(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+    
+    async def _get_model(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        model: Any = None,
+        parse: Optional[Callable[[Any], M]] = None,
+        many: bool = False,
+        skip_cache: bool = False,
+        ttl: Optional[timedelta] = None,
+        cache_not_found: bool = False
+    ) -> Union[M, Any]:
+        """Make a GET request and parse the response, caching the parsed result (see BaseAPI._get_model)."""
+        if parse is None:
+            parse = partial(self._parse_list if many else self._parse, model)
+            key = (model, many)
         else:
-            # Clear the entire cache
-            self._cache.clear() 
\ No newline at end of file
+            key = parse
+        
+        if skip_cache:
+            return parse(await self.client.get(endpoint, params=params))
+        
+        entry = await self._get_entry(endpoint, params, ttl, cache_not_found)
+        return self._parse_entry(entry, key, parse)
+    
+    async def _fetch(
+        self,
+        cache_key: CacheKey,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        ttl: Optional[timedelta],
+        cache_not_found: bool = False
+    ) -> CacheEntry:
+        """Fetch a response and cache it (see BaseAPI._fetch)."""
+        cache_entry = self._get_cached(cache_key) or await self._load_shared(cache_key, endpoint, params, fresh=True)
+        if cache_entry is not None:
+            if cache_entry.error is not None:
+                raise cache_entry.error.with_traceback(None)
+            return cache_entry
+        
+        try:
+            result = await self.client.get(endpoint, params=params)
+        except Exception as e:
+            if cache_not_found:
+                self._remember_not_found(cache_key, e)
+            raise
+        return await self._set_cached(cache_key, endpoint, result, ttl, params)
+
+    # cache backends (SQLite, network stores) block, so their I/O runs on
+    # worker threads; without a backend these stay on the loop
+    async def _load_shared(
+        self,
+        cache_key: CacheKey,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        fresh: bool = False
+    ) -> Optional[CacheEntry]:
+        """Look up a response in the client's cache backend (see BaseAPI._load_shared)."""
+        if self.client.cache_backend is None:
+            return None
+        return await self._to_thread(super()._load_shared, cache_key, endpoint, params, fresh)
+
+    async def _set_cached(
+        self,
+        cache_key: CacheKey,
+        endpoint: str,
+        data: Any,
+        ttl: Optional[timedelta] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> CacheEntry:
+        """Store a response in the cache and the client's cache backend (see BaseAPI._set_cached)."""
+        set_cached = super()._set_cached
+        if self.client.cache_backend is None:
+            return set_cached(cache_key, endpoint, data, ttl, params)
+        return await self._to_thread(set_cached, cache_key, endpoint, data, ttl, params)
+    
+    async def _post(self, endpoint: str, data: Dict[str, Any], params: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Make a POST request to the specified endpoint.
+
+        Args:
+            endpoint: API endpoint
+            data: Request body
+            params: Query parameters
+
+        Returns:
+            Response data as a dictionary or list
+        """
+        return await self.client.post(endpoint, data=data, params=params)
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[int, Optional[str]], Any],
+        items_attr: str,
+        first_page: int,
+        prefetch: bool = False,
+        window: int = 1,
+        base_page: int = 0
+    ) -> AsyncIterator[Any]:
+        """Stream page responses; see BaseAPI._iter_pages."""
+        response = await fetch_page(first_page, None)
+        total_pages = self._page_info(response, "total_pages")
+        if window > 1 and total_pages is not None and not self._page_info(response, "next_cursor"):
+            async for page_response in self._sweep_pages(
+                fetch_page, items_attr, first_page, response, window, base_page
+            ):
+                yield page_response
+            return
+
+        pending = None
+        page = first_page
+        try:
+            while True:
+                has_next = self._has_next_page(response, page, items_attr, base_page)
+                cursor = self._page_info(response, "next_cursor") if has_next else None
+                if has_next and prefetch:
+                    pending = asyncio.ensure_future(fetch_page(page + 1, cursor))
+
+                yield response
+
+                if not has_next:
+                    return
+                page += 1
+                response = await pending if pending is not None else await fetch_page(page, cursor)
+                pending = None
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def _sweep_pages(
+        self,
+        fetch_page: Callable[[int, Optional[str]], Any],
+        items_attr: str,
+        first_page: int,
+        first_response: Any,
+        window: int,
+        base_page: int = 0
+    ) -> AsyncIterator[Any]:
+        """Fetch remaining pages as concurrent tasks; see BaseAPI._sweep_pages."""
+        yield first_response
+
+        # total_pages counts from the endpoint's first page, not first_page
+        last_page = base_page + self._page_info(first_response, "total_pages") - 1
+        if not self._field(first_response, items_attr) or last_page <= first_page:
+            return
+
+        pending: Deque[asyncio.Future] = deque()
+        next_page = first_page + 1
+        try:
+            while True:
+                while next_page <= last_page and len(pending) < window:
+                    pending.append(asyncio.ensure_future(fetch_page(next_page, None)))
+                    next_page += 1
+                if not pending:
+                    return
+
+                response = await pending.popleft()
+                if not self._field(response, items_attr):
+                    return
+                yield response
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _iter_items(
+        self,
+        fetch_page: Callable[[int, Optional[str]], Any],
+        items_attr: str,
+        first_page: int,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+        base_page: int = 0
+    ) -> AsyncIterator[Any]:
+        """Stream items across every page; see BaseAPI._iter_items."""
+        self._validate_range("window", window, min_val=1)
+
+        async def items() -> AsyncIterator[Any]:
+            if max_items is not None and max_items <= 0:
+                return
+            count = 0
+            async for response in self._iter_pages(fetch_page, items_attr, first_page, prefetch, window, base_page):
+                for item in self._field(response, items_attr):
+                    yield item
+                    count += 1
+                    if max_items is not None and count >= max_items:
+                        return
+
+        return items()
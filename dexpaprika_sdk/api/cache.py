@@ -0,0 +1,507 @@
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# (endpoint, canonical query parameters), see BaseAPI._get_cache_key
+CacheKey = Tuple[str, Hashable]
+
+
+def path_prefixes(endpoint: str) -> List[str]:
+    """
+    List the path prefixes an endpoint falls under, itself included.
+
+    Args:
+        endpoint: Request path, e.g. "/networks/ethereum/pools"
+
+    Returns:
+        e.g. ["/networks", "/networks/ethereum", "/networks/ethereum/pools"]
+    """
+    parts = endpoint.rstrip("/").split("/")
+    return ["/".join(parts[:i]) for i in range(1, len(parts) + 1) if parts[i - 1]]
+
+
+class CacheEntry:
+    """
+    Class representing a cached response with an expiration time.
+
+    Times are ``time.monotonic()`` seconds: cheap to read on every cache
+    hit and unaffected by wall-clock changes.
+    """
+
+    __slots__ = ("data", "expires_at", "size", "stale_until", "revalidate_until", "refreshing", "parsed", "error")
+
+    def __init__(
+        self,
+        data: Any,
+        expires_at: Optional[float] = None,
+        size: int = 0,
+        stale_until: Optional[float] = None,
+        revalidate_until: Optional[float] = None,
+        error: Optional[Exception] = None,
+    ):
+        """
+        Initialize a new cache entry.
+
+        Args:
+            data: The data to cache
+            expires_at: Monotonic time when the cache entry expires
+            size: Approximate size of the data in bytes (0 if not measured)
+            stale_until: Until when the expired entry is kept to be served
+                stale (defaults to expires_at)
+            revalidate_until: Until when the expired entry is served while
+                a background refresh runs (defaults to expires_at)
+            error: For a cached "not found", the error to raise instead of
+                returning data
+        """
+        self.data = data
+        self.expires_at = expires_at
+        self.size = size
+        self.stale_until = stale_until if stale_until is not None else expires_at
+        self.revalidate_until = revalidate_until if revalidate_until is not None else expires_at
+        # set while a background refresh of this entry is scheduled
+        self.refreshing = False
+        # models parsed from data, keyed by parser (see BaseAPI._get_model)
+        self.parsed: Dict[Any, Any] = {}
+        self.error = error
+
+    def is_expired(self) -> bool:
+        """
+        Check if the cache entry has expired.
+
+        Returns:
+            True if the cache entry has expired, False otherwise
+        """
+        return self.expires_at is not None and time.monotonic() > self.expires_at
+
+    def can_revalidate(self) -> bool:
+        """
+        Check if the expired entry may be served while it is refreshed.
+
+        Returns:
+            True within the stale-while-revalidate window
+        """
+        return self.revalidate_until is not None and time.monotonic() <= self.revalidate_until
+
+    def is_dead(self) -> bool:
+        """
+        Check if the cache entry is past the point where it may be served stale.
+
+        Returns:
+            True if the entry can be dropped
+        """
+        return self.stale_until is not None and time.monotonic() > self.stale_until
+
+
+def estimate_size(data: Any) -> int:
+    """
+    Approximate the memory footprint of a response by its JSON length.
+
+    Args:
+        data: Decoded response data
+
+    Returns:
+        Approximate size in bytes
+    """
+    try:
+        return len(json.dumps(data, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class ResponseCache:
+    """
+    Bounded LRU store for CacheEntry objects.
+
+    Entries are evicted least-recently-used first once either ``max_entries``
+    or the approximate ``max_bytes`` budget is exceeded. Expired entries are
+    dropped when they are read, and swept from the whole store at most once
+    every ``purge_interval`` seconds while writing, so the cost of purging is
+    amortized over inserts instead of paid on every call. Entries with a
+    stale window (``CacheEntry.stale_until``) are kept, hidden from get(),
+    until that window has passed too, so get_stale() can still serve them.
+
+    Keys are ``(endpoint, ...)`` tuples (see CacheKey). Every path prefix
+    of a key's endpoint is indexed, so clear_prefix() removes the entries
+    under a path without scanning the others.
+
+    All operations are guarded by one lock, so a cache can be shared by
+    many threads. Each operation is O(1) (a sweep aside) and the lock is
+    never held across I/O.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        purge_interval: float = 60.0,
+    ):
+        """
+        Initialize a new response cache.
+
+        Args:
+            max_entries: Maximum number of entries (None for no limit)
+            max_bytes: Approximate maximum total size in bytes (None for no limit)
+            purge_interval: Minimum seconds between full sweeps of expired entries
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.purge_interval = purge_interval
+        self.evictions = 0
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        # path prefix -> keys of the entries under it
+        self._prefixes: Dict[str, Set[CacheKey]] = {}
+        self._total_bytes = 0
+        self._last_purge = time.monotonic()
+        self._lock = threading.RLock()
+
+    @property
+    def total_bytes(self) -> int:
+        """Approximate size of all cached data in bytes."""
+        return self._total_bytes
+
+    def get(self, key: CacheKey, default: Optional[CacheEntry] = None) -> Optional[CacheEntry]:
+        """
+        Get an entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            The cache entry, or ``default`` if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry.is_expired():
+                if entry.is_dead():
+                    self._remove(key)
+                return default
+            self._entries.move_to_end(key)
+            return entry
+
+    def get_stale(self, key: CacheKey, default: Optional[CacheEntry] = None) -> Optional[CacheEntry]:
+        """
+        Get an entry even if it has expired, as long as it is within its stale window.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            The cache entry, or ``default`` if missing or past its stale window
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry.is_dead():
+                self._remove(key)
+                return default
+            self._entries.move_to_end(key)
+            return entry
+
+    def begin_refresh(self, entry: CacheEntry) -> bool:
+        """
+        Claim the background refresh of an expired entry.
+
+        Args:
+            entry: Entry about to be refreshed
+
+        Returns:
+            True for the first caller, False while a refresh is already scheduled
+        """
+        with self._lock:
+            if entry.refreshing:
+                return False
+            entry.refreshing = True
+            return True
+
+    def set(self, key: CacheKey, entry: CacheEntry) -> None:
+        """
+        Store an entry, evicting old ones if the cache is over budget.
+
+        Args:
+            key: Cache key
+            entry: The entry to store
+        """
+        # measured outside the lock, it serializes the whole response
+        if self.max_bytes is not None and not entry.size:
+            entry.size = estimate_size(entry.data)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._total_bytes += entry.size
+            self._index(key)
+
+            if time.monotonic() - self._last_purge >= self.purge_interval:
+                self.purge_expired()
+            self._evict()
+
+    def purge_expired(self) -> int:
+        """
+        Remove every expired entry past its stale window.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if entry.is_dead()]
+            for key in expired:
+                self._remove(key)
+            self._last_purge = time.monotonic()
+            return len(expired)
+
+    def _evict(self) -> None:
+        # drop least recently used entries until within budget
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size
+        for prefix in path_prefixes(key[0]):
+            keys = self._prefixes[prefix]
+            keys.discard(key)
+            if not keys:
+                del self._prefixes[prefix]
+
+    def _index(self, key: CacheKey) -> None:
+        for prefix in path_prefixes(key[0]):
+            keys = self._prefixes.get(prefix)
+            if keys is None:
+                keys = self._prefixes[prefix] = set()
+            keys.add(key)
+
+    def clear_prefix(self, prefix: str) -> int:
+        """
+        Remove the entries of an endpoint and every endpoint under it.
+
+        Prefixes match whole path segments: "/networks/ethereum" covers
+        "/networks/ethereum" and "/networks/ethereum/pools", but not
+        "/networks/ethereum-classic". Takes time in the number of entries
+        removed, not the size of the cache.
+
+        Args:
+            prefix: Endpoint path prefix ("" or "/" for everything)
+
+        Returns:
+            Number of entries removed
+        """
+        prefix = prefix.rstrip("/")
+        with self._lock:
+            if not prefix:
+                removed = len(self._entries)
+                self.clear()
+                return removed
+            keys = list(self._prefixes.get(prefix, ()))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def discard(self, key: CacheKey) -> bool:
+        """
+        Remove an entry if present.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._prefixes.clear()
+            self._total_bytes = 0
+
+    def keys(self) -> List[CacheKey]:
+        with self._lock:
+            return list(self._entries.keys())
+
+    def __getitem__(self, key: CacheKey) -> CacheEntry:
+        with self._lock:
+            return self._entries[key]
+
+    def __setitem__(self, key: CacheKey, entry: CacheEntry) -> None:
+        self.set(key, entry)
+
+    def __delitem__(self, key: CacheKey) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[CacheKey]:
+        return iter(self.keys())
+
+
+class CacheStats:
+    """
+    Cache counters of one service; the cache itself is shared by all services.
+
+    ``hits`` counts lookups answered with a fresh cached response,
+    ``stale_hits`` expired responses served (while they are revalidated,
+    or because fetching failed upstream) and ``misses`` lookups that went
+    to the API, including failed ones.
+    """
+
+    __slots__ = ("hits", "stale_hits", "misses", "_lock")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def stale_hit(self) -> None:
+        with self._lock:
+            self.stale_hits += 1
+
+    def miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Get the counters.
+
+        Returns:
+            A dict with hits, stale_hits and misses
+        """
+        with self._lock:
+            return {"hits": self.hits, "stale_hits": self.stale_hits, "misses": self.misses}
+
+    def reset(self) -> None:
+        """Set every counter back to zero."""
+        with self._lock:
+            self.hits = self.stale_hits = self.misses = 0
+
+
+class _Call:
+    """An in-flight call shared by every caller with the same key."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls with the same key into a single execution.
+
+    The first thread to ask for a key runs the function; threads asking for
+    the same key while it is running wait for it and receive the same result,
+    or the same exception.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Run ``fn`` once for all concurrent callers of ``key``.
+
+        Args:
+            key: Deduplication key (the cache key)
+            fn: Function performing the fetch
+
+        Returns:
+            The result of ``fn``
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of SingleFlight, sharing one task's result per key.
+
+    The fetch runs in a task owned by the flight, and every caller (the
+    first one included) awaits it through ``asyncio.shield``: cancelling
+    one caller, e.g. with ``asyncio.wait_for``, leaves the fetch running
+    for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``fn`` once for all concurrent callers of ``key``.
+
+        Args:
+            key: Deduplication key (the cache key)
+            fn: Coroutine function performing the fetch
+
+        Returns:
+            The result of ``fn``
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(partial(self._done, key))
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # mark retrieved, every caller may have been cancelled
+        if not task.cancelled():
+            task.exception()
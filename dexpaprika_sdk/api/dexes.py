@@ -1,7 +1,7 @@
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
 
-from .base import BaseAPI
-from ..models.networks import DexesResponse
+from .base import BaseAPI, AsyncBaseAPI
+from ..models.networks import Dex, DexesResponse
 
 
 class DexesAPI(BaseAPI):
@@ -22,6 +22,11 @@ class DexesAPI(BaseAPI):
         Raises:
             ValueError: If any parameter is invalid
         """
+        endpoint, params = self._list_request(network, page, limit)
+        return self._get_model(endpoint, params, DexesResponse)
+    
+    def _list_request(self, network: str, page: int, limit: int) -> Tuple[str, Dict[str, Any]]:
+        """Validate list arguments and build its endpoint and params."""
         # Validate parameters
         self._validate_required("network", network)
         self._validate_range("page", page, min_val=0)
@@ -31,5 +36,96 @@ class DexesAPI(BaseAPI):
             "page": page,
             "limit": limit
         }
-        data = self._get(f"/networks/{network}/dexes", params=params)
-        return DexesResponse(**data) 
\ No newline at end of file
+        return f"/networks/{network}/dexes", params
+    
+    def iter_list(
+        self,
+        network: str,
+        limit: int = 100,
+        start_page: int = 0,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+    ) -> Iterator[Dex]:
+        """
+        Stream every DEX on a network, fetching pages lazily.
+        
+        Args:
+            network: Network ID (e.g., "ethereum", "solana")
+            limit: Number of items per page request
+            start_page: Page number to start from
+            max_items: Stop after this many DEXes
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+            
+        Returns:
+            An iterator of DEXes
+            
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._list_request(network, start_page, limit)
+        
+        def fetch(page: int, cursor: Optional[str]) -> DexesResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._list_request(network, page, limit)
+            return self._get_model(endpoint, params, DexesResponse, skip_cache=True)
+        
+        return self._iter_items(fetch, "dexes", start_page, max_items, prefetch, window)
+
+
+class AsyncDexesAPI(AsyncBaseAPI, DexesAPI):
+    """Asyncio counterpart of DexesAPI."""
+    
+    async def list(self, network: str, page: int = 0, limit: int = 10) -> DexesResponse:
+        """
+        Get a list of available decentralized exchanges on a specific network.
+        
+        Args:
+            network: Network ID (e.g., "ethereum", "solana")
+            page: Page number for pagination
+            limit: Number of items per page
+            
+        Returns:
+            Response containing list of DEXes
+            
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        endpoint, params = self._list_request(network, page, limit)
+        return await self._get_model(endpoint, params, DexesResponse)
+    
+    def iter_list(
+        self,
+        network: str,
+        limit: int = 100,
+        start_page: int = 0,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+    ) -> AsyncIterator[Dex]:
+        """
+        Stream every DEX on a network, fetching pages lazily.
+        
+        Args:
+            network: Network ID (e.g., "ethereum", "solana")
+            limit: Number of items per page request
+            start_page: Page number to start from
+            max_items: Stop after this many DEXes
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+            
+        Returns:
+            An async iterator of DEXes
+            
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._list_request(network, start_page, limit)
+        
+        async def fetch(page: int, cursor: Optional[str]) -> DexesResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._list_request(network, page, limit)
+            return await self._get_model(endpoint, params, DexesResponse, skip_cache=True)
+        
+        return self._iter_items(fetch, "dexes", start_page, max_items, prefetch, window)
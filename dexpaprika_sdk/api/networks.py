@@ -1,6 +1,6 @@
-from typing import List, Optional, Set
+from typing import Any, Dict, List, Tuple
 
-from .base import BaseAPI
+from .base import BaseAPI, AsyncBaseAPI
 from ..models.networks import Network, DexesResponse
 
 
@@ -14,8 +14,7 @@ class NetworksAPI(BaseAPI):
         Returns:
             List of Network objects
         """
-        data = self._get("/networks")
-        return [Network(**item) for item in data]
+        return self._get_model("/networks", model=Network, many=True)
     
     def list_dexes(self, network_id: str, page: int = 0, limit: int = 10) -> DexesResponse:
         """
@@ -32,6 +31,11 @@ class NetworksAPI(BaseAPI):
         Raises:
             ValueError: If any parameter is invalid
         """
+        endpoint, params = self._list_dexes_request(network_id, page, limit)
+        return self._get_model(endpoint, params, DexesResponse)
+    
+    def _list_dexes_request(self, network_id: str, page: int, limit: int) -> Tuple[str, Dict[str, Any]]:
+        """Validate list_dexes arguments and build its endpoint and params."""
         # Validate parameters
         self._validate_required("network_id", network_id)
         self._validate_range("page", page, min_val=0)
@@ -41,5 +45,35 @@ class NetworksAPI(BaseAPI):
             "page": page,
             "limit": limit,
         }
-        data = self._get(f"/networks/{network_id}/dexes", params=params)
-        return DexesResponse(**data) 
\ No newline at end of file
+        return f"/networks/{network_id}/dexes", params
+
+
+class AsyncNetworksAPI(AsyncBaseAPI, NetworksAPI):
+    """Asyncio counterpart of NetworksAPI."""
+    
+    async def list(self) -> List[Network]:
+        """
+        Retrieve a list of all supported blockchain networks.
+        
+        Returns:
+            List of Network objects
+        """
+        return await self._get_model("/networks", model=Network, many=True)
+    
+    async def list_dexes(self, network_id: str, page: int = 0, limit: int = 10) -> DexesResponse:
+        """
+        Get a list of all available dexes on a specific network.
+        
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            page: Page number for pagination
+            limit: Number of items per page
+            
+        Returns:
+            Response containing a list of DEXes
+            
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        endpoint, params = self._list_dexes_request(network_id, page, limit)
+        return await self._get_model(endpoint, params, DexesResponse)
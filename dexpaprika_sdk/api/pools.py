@@ -1,11 +1,52 @@
-from typing import List, Optional, Dict, Any, Set, Union
+from typing import AsyncIterator, Iterator, List, Optional, Dict, Any, Set, Tuple, Union
+import asyncio
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
-from .base import BaseAPI
+from .base import BaseAPI, AsyncBaseAPI
 from ..models.pools import (
-    PoolsResponse, PoolDetails, OHLCVRecord, TransactionsResponse,
-    PoolFilterResponse,
+    Pool, PoolsResponse, PoolDetails, OHLCVRecord, Transaction, TransactionsResponse,
+    FilteredPool, PoolFilterResponse,
+    OHLCVGap, OHLCVWindowError, OHLCVHistoryResponse,
 )
+from ..models.base import PageInfo
+from ..tailer import AsyncTransactionTailer, TransactionTailer
+from ..columnar import ohlcv_arrays, transaction_arrays
+
+
+_LIST_DEPRECATION_MESSAGE = (
+    "The pools.list() method is deprecated. The global /pools endpoint has been "
+    "removed in API v1.3.0. Use pools.list_by_network(network_id) instead. "
+    "This method now defaults to Ethereum network for backward compatibility. "
+    "Examples: client.pools.list_by_network('ethereum'), "
+    "client.pools.list_by_network('solana')"
+)
+
+# Candle length of each OHLCV interval
+_INTERVAL_SECONDS: Dict[str, int] = {
+    "1m": 60, "5m": 300, "10m": 600, "15m": 900, "30m": 1800,
+    "1h": 3600, "6h": 21600, "12h": 43200, "24h": 86400,
+}
+# Server limits for a single OHLCV request
+_MAX_OHLCV_POINTS = 366
+_MAX_OHLCV_SPAN = timedelta(days=365)
+
+OHLCVWindow = Tuple[datetime, datetime, int]
+
+
+def _parse_time(value: Union[str, int, float, datetime]) -> datetime:
+    """Parse an ISO-8601 string, yyyy-mm-dd date, Unix timestamp or datetime as UTC."""
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if isinstance(value, (int, float)) or str(value).isdigit():
+        return datetime.fromtimestamp(int(value), tz=timezone.utc)
+    parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _format_time(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 class PoolsAPI(BaseAPI):
@@ -52,44 +93,48 @@ class PoolsAPI(BaseAPI):
             pools = client.pools.list_by_network('solana')
         """
         # Issue deprecation warning
-        warnings.warn(
-            "The pools.list() method is deprecated. The global /pools endpoint has been "
-            "removed in API v1.3.0. Use pools.list_by_network(network_id) instead. "
-            "This method now defaults to Ethereum network for backward compatibility. "
-            "Examples: client.pools.list_by_network('ethereum'), "
-            "client.pools.list_by_network('solana')",
-            DeprecationWarning,
-            stacklevel=2
-        )
+        warnings.warn(_LIST_DEPRECATION_MESSAGE, DeprecationWarning, stacklevel=2)
         
-        # Validate parameters
-        self._validate_range("page", page, min_val=0)
-        self._validate_range("limit", limit, min_val=1, max_val=100)
-        self._validate_enum("sort", sort, self.VALID_SORT_VALUES)
-        self._validate_enum("order_by", order_by, self.VALID_ORDER_BY_VALUES)
+        endpoint, params = self._list_request(page, limit, sort, order_by)
         
         try:
             # Attempt to call the deprecated endpoint first for debugging/testing
-            params = {"page": page, "limit": limit, "sort": sort, "order_by": order_by}
-            data = self._get("/pools", params=params)
-            
-            # ensure pools exists
-            if 'pools' not in data: data['pools'] = []
-                
-            return PoolsResponse(**data)
+            return self._get_model(endpoint, params, parse=self._parse_pools)
             
         except Exception as e:
             # If we get a 410 Gone or any other error, fall back to Ethereum
-            # Check if it's a 410 Gone status specifically
-            if hasattr(e, 'response') and hasattr(e.response, 'status_code') and e.response.status_code == 410:
-                # Provide a more specific error message for 410 Gone
-                print("WARNING: The global /pools endpoint has been permanently removed (410 Gone). "
-                      "Falling back to Ethereum network. Please update your code to use "
-                      "pools.list_by_network(network_id) instead.")
+            self._report_list_fallback(e)
             
             # Fall back to Ethereum network for backward compatibility
             return self.list_by_network("ethereum", page=page, limit=limit, sort=sort, order_by=order_by)
     
+    def _list_request(self, page: int, limit: int, sort: str, order_by: str) -> Tuple[str, Dict[str, Any]]:
+        """Validate the deprecated list arguments and build its endpoint and params."""
+        # Validate parameters
+        self._validate_range("page", page, min_val=0)
+        self._validate_range("limit", limit, min_val=1, max_val=100)
+        self._validate_enum("sort", sort, self.VALID_SORT_VALUES)
+        self._validate_enum("order_by", order_by, self.VALID_ORDER_BY_VALUES)
+        
+        return "/pools", {"page": page, "limit": limit, "sort": sort, "order_by": order_by}
+    
+    @staticmethod
+    def _report_list_fallback(e: Exception) -> None:
+        """Explain why the deprecated list call is falling back to Ethereum."""
+        # Check if it's a 410 Gone status specifically
+        if hasattr(e, 'response') and hasattr(e.response, 'status_code') and e.response.status_code == 410:
+            # Provide a more specific error message for 410 Gone
+            print("WARNING: The global /pools endpoint has been permanently removed (410 Gone). "
+                  "Falling back to Ethereum network. Please update your code to use "
+                  "pools.list_by_network(network_id) instead.")
+    
+    def _parse_pools(self, data: Dict[str, Any]) -> PoolsResponse:
+        """Build a PoolsResponse, tolerating a missing pools key."""
+        # ensure pools exists (on a copy, data may be the cached response)
+        if 'pools' not in data: data = {**data, 'pools': []}
+            
+        return self._parse(PoolsResponse, data)
+    
     def list_by_network(
         self, 
         network_id: str, 
@@ -114,6 +159,18 @@ class PoolsAPI(BaseAPI):
         Raises:
             ValueError: If any parameter is invalid
         """
+        endpoint, params = self._list_by_network_request(network_id, page, limit, sort, order_by)
+        return self._get_model(endpoint, params, parse=self._parse_pools)
+    
+    def _list_by_network_request(
+        self, 
+        network_id: str, 
+        page: int, 
+        limit: int, 
+        sort: str, 
+        order_by: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Validate list_by_network arguments and build its endpoint and params."""
         # Validate parameters
         self._validate_required("network_id", network_id)
         self._validate_range("page", page, min_val=0)
@@ -123,12 +180,7 @@ class PoolsAPI(BaseAPI):
         
         # Get network pools
         params = {"page": page, "limit": limit, "sort": sort, "order_by": order_by}
-        data = self._get(f"/networks/{network_id}/pools", params=params)
-        
-        # ensure pools exists
-        if 'pools' not in data: data['pools'] = []
-            
-        return PoolsResponse(**data)
+        return f"/networks/{network_id}/pools", params
     
     def list_by_dex(
         self, 
@@ -156,6 +208,19 @@ class PoolsAPI(BaseAPI):
         Raises:
             ValueError: If any parameter is invalid
         """
+        endpoint, params = self._list_by_dex_request(network_id, dex_id, page, limit, sort, order_by)
+        return self._get_model(endpoint, params, parse=self._parse_pools)
+    
+    def _list_by_dex_request(
+        self, 
+        network_id: str, 
+        dex_id: str, 
+        page: int, 
+        limit: int, 
+        sort: str, 
+        order_by: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Validate list_by_dex arguments and build its endpoint and params."""
         # Validate parameters
         self._validate_required("network_id", network_id)
         self._validate_required("dex_id", dex_id)
@@ -166,12 +231,7 @@ class PoolsAPI(BaseAPI):
         
         # Get dex pools
         params = {"page": page, "limit": limit, "sort": sort, "order_by": order_by}
-        data = self._get(f"/networks/{network_id}/dexes/{dex_id}/pools", params=params)
-        
-        # ensure pools exists
-        if 'pools' not in data: data['pools'] = []
-            
-        return PoolsResponse(**data)
+        return f"/networks/{network_id}/dexes/{dex_id}/pools", params
     
     def get_details(
         self, 
@@ -192,7 +252,22 @@ class PoolsAPI(BaseAPI):
             
         Raises:
             ValueError: If any parameter is invalid
+            NotFoundError: If there is no such pool on the network
         """
+        endpoint, params = self._get_details_request(network_id, pool_address, inversed)
+        try:
+            return self._get_model(endpoint, params, PoolDetails, cache_not_found=True)
+        except Exception as e:
+            self._check_not_found(e, "pool", network_id, pool_address)
+            raise
+    
+    def _get_details_request(
+        self, 
+        network_id: str, 
+        pool_address: str, 
+        inversed: bool
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Validate get_details arguments and build its endpoint and params."""
         # Validate parameters
         self._validate_required("network_id", network_id)
         self._validate_required("pool_address", pool_address)
@@ -201,8 +276,7 @@ class PoolsAPI(BaseAPI):
         params = {"inversed": "true" if inversed else None}
         params = self._clean_params(params)
         
-        data = self._get(f"/networks/{network_id}/pools/{pool_address}", params=params)
-        return PoolDetails(**data)
+        return f"/networks/{network_id}/pools/{pool_address}", params
     
     def get_ohlcv(
         self, 
@@ -232,6 +306,104 @@ class PoolsAPI(BaseAPI):
         Raises:
             ValueError: If any parameter is invalid
         """
+        return self._get_ohlcv(network_id, pool_address, start, end, limit, interval, inversed)
+
+    def _get_ohlcv(
+        self,
+        network_id: str,
+        pool_address: str,
+        start: str,
+        end: Optional[str],
+        limit: int,
+        interval: str,
+        inversed: bool,
+        skip_cache: bool = False,
+    ) -> List[OHLCVRecord]:
+        """get_ohlcv, optionally bypassing the response cache (for one-off bulk reads)."""
+        endpoint, params = self._get_ohlcv_request(
+            network_id, pool_address, start, end, limit, interval, inversed
+        )
+        if self.client.candle_store is not None:
+            plan, spans = self._plan_stored_ohlcv(network_id, pool_address, start, end, limit, interval, inversed)
+            fetched = [
+                self._get(span_endpoint, params=span_params, skip_cache=skip_cache)
+                for span_endpoint, span_params in spans
+            ]
+            return self._finish_stored_ohlcv(plan, fetched)
+
+        return self._get_model(endpoint, params, OHLCVRecord, many=True, skip_cache=skip_cache)
+
+    def _plan_stored_ohlcv(
+        self,
+        network_id: str,
+        pool_address: str,
+        start: str,
+        end: Optional[str],
+        limit: int,
+        interval: str,
+        inversed: bool,
+    ) -> Tuple[Dict[str, Any], List[Tuple[str, Dict[str, Any]]]]:
+        """Work out which spans of a get_ohlcv call the candle store is missing."""
+        step = _INTERVAL_SECONDS[interval]
+        range_start = int(_parse_time(start).timestamp())
+        range_end = range_start + limit * step
+        if end is not None:
+            range_end = min(range_end, int(_parse_time(end).timestamp()))
+
+        plan = {
+            "series": (network_id, pool_address, interval, inversed),
+            "range": (range_start, range_end),
+            "limit": limit,
+            # candles opening after this may still change, so they are never stored
+            "closed_until": int(datetime.now(timezone.utc).timestamp()) - step,
+        }
+        plan["missing"] = self.client.candle_store.missing(plan["series"], range_start, range_end)
+
+        spans = []
+        for span_start, span_end in plan["missing"]:
+            spans.append(self._get_ohlcv_request(
+                network_id, pool_address,
+                _format_time(datetime.fromtimestamp(span_start, tz=timezone.utc)),
+                _format_time(datetime.fromtimestamp(span_end, tz=timezone.utc)),
+                -(-(span_end - span_start) // step), interval, inversed,
+            ))
+        return plan, spans
+
+    def _finish_stored_ohlcv(self, plan: Dict[str, Any], fetched: List[Any]) -> List[OHLCVRecord]:
+        """Store the fetched spans and answer the call from the candle store."""
+        store = self.client.candle_store
+        series, closed_until = plan["series"], plan["closed_until"]
+        range_start, range_end = plan["range"]
+
+        still_open = {}
+        for (span_start, span_end), data in zip(plan["missing"], fetched):
+            records = [
+                (int(_parse_time(item["time_open"]).timestamp()), self._parse(OHLCVRecord, item, raw=False))
+                for item in data
+            ]
+            store.add(series, records, span_start, min(span_end, closed_until))
+            for open_ts, record in records:
+                if max(range_start, closed_until) <= open_ts < range_end:
+                    still_open[open_ts] = record
+
+        result = store.get(series, range_start, min(range_end, closed_until), limit=plan["limit"])
+        result.extend(still_open[open_ts] for open_ts in sorted(still_open))
+        result = result[:plan["limit"]]
+        if self.client.validation == "none":
+            return [record.model_dump() for record in result]
+        return result
+    
+    def _get_ohlcv_request(
+        self, 
+        network_id: str, 
+        pool_address: str, 
+        start: str, 
+        end: Optional[str], 
+        limit: int, 
+        interval: str, 
+        inversed: bool
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Validate get_ohlcv arguments and build its endpoint and params."""
         # Validate parameters
         self._validate_required("network_id", network_id)
         self._validate_required("pool_address", pool_address)
@@ -249,8 +421,160 @@ class PoolsAPI(BaseAPI):
         }
         params = self._clean_params(params)
         
-        data = self._get(f"/networks/{network_id}/pools/{pool_address}/ohlcv", params=params)
-        return [OHLCVRecord(**item) for item in data]
+        return f"/networks/{network_id}/pools/{pool_address}/ohlcv", params
+    
+    def get_ohlcv_arrays(
+        self,
+        network_id: str,
+        pool_address: str,
+        start: str,
+        end: Optional[str] = None,
+        limit: int = 1,
+        interval: str = "24h",
+        inversed: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Get OHLCV data as columnar NumPy arrays instead of OHLCVRecord models.
+
+        Takes the same arguments as get_ohlcv. Requires numpy.
+
+        Returns:
+            Dict of arrays: time_open/time_close (datetime64[s]),
+            open/high/low/close (float64) and volume (int64)
+
+        Raises:
+            ValueError: If any parameter is invalid
+            ImportError: If numpy is not installed
+        """
+        if self.client.candle_store is not None:
+            return ohlcv_arrays(self.get_ohlcv(network_id, pool_address, start, end, limit, interval, inversed))
+        endpoint, params = self._get_ohlcv_request(
+            network_id, pool_address, start, end, limit, interval, inversed
+        )
+        return ohlcv_arrays(self._get(endpoint, params=params))
+
+    def get_ohlcv_history(
+        self,
+        network_id: str,
+        pool_address: str,
+        start: Union[str, int, datetime],
+        end: Optional[Union[str, int, datetime]] = None,
+        interval: str = "24h",
+        inversed: bool = False,
+        max_concurrency: int = 4,
+    ) -> OHLCVHistoryResponse:
+        """
+        Get OHLCV data for an arbitrary time range.
+
+        The range is split into the largest windows a single request allows
+        (366 candles, one year), fetched concurrently, and stitched back into
+        one series deduplicated on time_open. Spans with no candles are
+        reported in ``gaps``; a failing window is reported in ``errors``
+        without failing the others.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            pool_address: Pool address or identifier
+            start: Start of the range (ISO-8601, yyyy-mm-dd, Unix timestamp or datetime)
+            end: End of the range, exclusive (defaults to now)
+            interval: Interval granularity for OHLCV data (1m, 5m, 10m, 15m, 30m, 1h, 6h, 12h, 24h)
+            inversed: Whether to invert the price ratio in OHLCV calculations
+            max_concurrency: Maximum number of windows in flight at once
+
+        Returns:
+            Candles sorted by time_open, plus gaps and per-window errors
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        windows = self._ohlcv_windows(network_id, pool_address, start, end, interval, max_concurrency)
+
+        def fetch(window: OHLCVWindow) -> Union[List[OHLCVRecord], Exception]:
+            window_start, window_end, limit = window
+            try:
+                # a backfill reads each window once: keep it out of the response cache
+                return self._get_ohlcv(
+                    network_id, pool_address, _format_time(window_start), _format_time(window_end),
+                    limit, interval, inversed, skip_cache=True,
+                )
+            except Exception as e:
+                return e
+
+        if max_concurrency == 1 or len(windows) == 1:
+            outcomes = [fetch(window) for window in windows]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(windows))) as executor:
+                outcomes = list(executor.map(fetch, windows))
+
+        return self._stitch_ohlcv(windows, outcomes, interval)
+
+    def _ohlcv_windows(
+        self,
+        network_id: str,
+        pool_address: str,
+        start: Union[str, int, datetime],
+        end: Optional[Union[str, int, datetime]],
+        interval: str,
+        max_concurrency: int,
+    ) -> List[OHLCVWindow]:
+        """Validate get_ohlcv_history arguments and split the range into legal windows."""
+        self._validate_required("network_id", network_id)
+        self._validate_required("pool_address", pool_address)
+        self._validate_required("start", start)
+        self._validate_enum("interval", interval, self.VALID_INTERVAL_VALUES)
+        self._validate_range("max_concurrency", max_concurrency, min_val=1)
+
+        range_start = _parse_time(start)
+        range_end = _parse_time(end) if end is not None else datetime.now(timezone.utc)
+        if range_end <= range_start:
+            raise ValueError("end must be after start")
+
+        step = timedelta(seconds=_INTERVAL_SECONDS[interval])
+        points = min(_MAX_OHLCV_POINTS, _MAX_OHLCV_SPAN // step)
+
+        windows = []
+        window_start = range_start
+        while window_start < range_end:
+            window_end = min(window_start + points * step, range_end)
+            limit = -(-(window_end - window_start) // step)
+            windows.append((window_start, window_end, limit))
+            window_start = window_end
+        return windows
+
+    @staticmethod
+    def _stitch_ohlcv(
+        windows: List[OHLCVWindow],
+        outcomes: List[Union[List[OHLCVRecord], Exception]],
+        interval: str,
+    ) -> OHLCVHistoryResponse:
+        """Merge window outcomes into one deduplicated series and find its gaps."""
+        by_open: Dict[datetime, OHLCVRecord] = {}
+        errors = []
+        for (window_start, window_end, _), outcome in zip(windows, outcomes):
+            if isinstance(outcome, Exception):
+                errors.append(OHLCVWindowError(
+                    start=_format_time(window_start), end=_format_time(window_end), error=outcome,
+                ))
+                continue
+            for record in outcome:
+                by_open.setdefault(_parse_time(BaseAPI._field(record, "time_open")), record)
+
+        range_start, range_end = windows[0][0], windows[-1][1]
+        step = timedelta(seconds=_INTERVAL_SECONDS[interval])
+        opens = sorted(t for t in by_open if range_start <= t < range_end)
+
+        gaps = []
+        # an expected candle is missing wherever consecutive opens are more than a step apart
+        previous_end = range_start
+        for boundary in opens + [range_end]:
+            missing = (boundary - previous_end) // step
+            if missing > 0:
+                gaps.append(OHLCVGap(
+                    time_start=_format_time(previous_end), time_end=_format_time(boundary), missing=missing,
+                ))
+            previous_end = boundary + step
+
+        return OHLCVHistoryResponse(records=[by_open[t] for t in opens], gaps=gaps, errors=errors)
     
     def get_transactions(
         self,
@@ -280,6 +604,57 @@ class PoolsAPI(BaseAPI):
         Raises:
             ValueError: If any parameter is invalid
         """
+        endpoint, params = self._get_transactions_request(
+            network_id, pool_address, page, limit, cursor, from_timestamp, to_timestamp
+        )
+        return self._get_model(endpoint, params, TransactionsResponse)
+
+    def get_transactions_arrays(
+        self,
+        network_id: str,
+        pool_address: str,
+        page: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        from_timestamp: Optional[int] = None,
+        to_timestamp: Optional[int] = None
+    ) -> Tuple[Dict[str, Any], PageInfo]:
+        """
+        Get a page of transactions as columnar NumPy arrays instead of Transaction models.
+
+        Takes the same arguments as get_transactions. Requires numpy.
+
+        Returns:
+            Dict of arrays (see columnar.transaction_arrays) and the page info,
+            whose next_cursor continues the walk
+
+        Raises:
+            ValueError: If any parameter is invalid
+            ImportError: If numpy is not installed
+        """
+        endpoint, params = self._get_transactions_request(
+            network_id, pool_address, page, limit, cursor, from_timestamp, to_timestamp
+        )
+        data = self._get(endpoint, params=params)
+        return transaction_arrays(data["transactions"]), self._transactions_page_info(data, page, limit)
+
+    @staticmethod
+    def _transactions_page_info(data: Dict[str, Any], page: int, limit: int) -> PageInfo:
+        """Build a transactions page's PageInfo, falling back to the requested page and limit."""
+        # the API may omit page_info (e.g. on the last page)
+        return PageInfo(**{"page": page, "limit": limit, **(data.get("page_info") or {})})
+
+    def _get_transactions_request(
+        self,
+        network_id: str,
+        pool_address: str,
+        page: int,
+        limit: int,
+        cursor: Optional[str],
+        from_timestamp: Optional[int],
+        to_timestamp: Optional[int]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Validate get_transactions arguments and build its endpoint and params."""
         # Validate parameters
         self._validate_required("network_id", network_id)
         self._validate_required("pool_address", pool_address)
@@ -290,8 +665,7 @@ class PoolsAPI(BaseAPI):
         params = {"page": page, "limit": limit, "cursor": cursor, "from": from_timestamp, "to": to_timestamp}
         params = self._clean_params(params)
 
-        data = self._get(f"/networks/{network_id}/pools/{pool_address}/transactions", params=params)
-        return TransactionsResponse(**data)
+        return f"/networks/{network_id}/pools/{pool_address}/transactions", params
 
     def filter(
         self,
@@ -335,6 +709,32 @@ class PoolsAPI(BaseAPI):
         Raises:
             ValueError: If any parameter is invalid
         """
+        endpoint, params = self._filter_request(
+            network_id, page, limit, sort_by, sort_dir,
+            volume_24h_min, volume_24h_max, volume_7d_min, volume_7d_max,
+            liquidity_usd_min, liquidity_usd_max, txns_24h_min,
+            created_after, created_before,
+        )
+        return self._get_model(endpoint, params, parse=self._parse_filter)
+
+    def _filter_request(
+        self,
+        network_id: str,
+        page: int,
+        limit: int,
+        sort_by: str = "volume_24h",
+        sort_dir: str = "desc",
+        volume_24h_min: Optional[float] = None,
+        volume_24h_max: Optional[float] = None,
+        volume_7d_min: Optional[float] = None,
+        volume_7d_max: Optional[float] = None,
+        liquidity_usd_min: Optional[float] = None,
+        liquidity_usd_max: Optional[float] = None,
+        txns_24h_min: Optional[int] = None,
+        created_after: Optional[Union[int, str]] = None,
+        created_before: Optional[Union[int, str]] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Validate filter arguments and build its endpoint and params."""
         self._validate_required("network_id", network_id)
         self._validate_range("page", page, min_val=1)
         self._validate_range("limit", limit, min_val=1, max_val=100)
@@ -357,9 +757,739 @@ class PoolsAPI(BaseAPI):
         }
         params = self._clean_params(params)
 
-        data = self._get(f"/networks/{network_id}/pools/filter", params=params)
+        return f"/networks/{network_id}/pools/filter", params
 
+    def _parse_filter(self, data: Dict[str, Any]) -> PoolFilterResponse:
+        """Build a PoolFilterResponse, tolerating a missing results key."""
         if 'results' not in data:
-            data['results'] = []
+            data = {**data, 'results': []}
+
+        return self._parse(PoolFilterResponse, data)
+
+    def iter_list_by_network(
+        self,
+        network_id: str,
+        limit: int = 100,
+        sort: str = "desc",
+        order_by: str = "volume_usd",
+        start_page: int = 0,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+    ) -> Iterator[Pool]:
+        """
+        Stream every pool on a network, fetching pages lazily.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            limit: Number of items per page request
+            sort: Sort order ("asc" or "desc")
+            order_by: Field to order by ("volume_usd", "price_usd", etc.)
+            start_page: Page number to start from
+            max_items: Stop after this many pools
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+
+        Returns:
+            An iterator of pools
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._list_by_network_request(network_id, start_page, limit, sort, order_by)
+
+        def fetch(page: int, cursor: Optional[str]) -> PoolsResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._list_by_network_request(network_id, page, limit, sort, order_by)
+            return self._get_model(endpoint, params, parse=self._parse_pools, skip_cache=True)
+
+        return self._iter_items(fetch, "pools", start_page, max_items, prefetch, window)
+
+    def iter_list_by_dex(
+        self,
+        network_id: str,
+        dex_id: str,
+        limit: int = 100,
+        sort: str = "desc",
+        order_by: str = "volume_usd",
+        start_page: int = 0,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+    ) -> Iterator[Pool]:
+        """
+        Stream every pool of a DEX on a network, fetching pages lazily.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            dex_id: DEX ID (e.g., "uniswap_v3")
+            limit: Number of items per page request
+            sort: Sort order ("asc" or "desc")
+            order_by: Field to order by ("volume_usd", "price_usd", etc.)
+            start_page: Page number to start from
+            max_items: Stop after this many pools
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+
+        Returns:
+            An iterator of pools
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._list_by_dex_request(network_id, dex_id, start_page, limit, sort, order_by)
+
+        def fetch(page: int, cursor: Optional[str]) -> PoolsResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._list_by_dex_request(network_id, dex_id, page, limit, sort, order_by)
+            return self._get_model(endpoint, params, parse=self._parse_pools, skip_cache=True)
+
+        return self._iter_items(fetch, "pools", start_page, max_items, prefetch, window)
+
+    def iter_transactions(
+        self,
+        network_id: str,
+        pool_address: str,
+        limit: int = 100,
+        from_timestamp: Optional[int] = None,
+        to_timestamp: Optional[int] = None,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Transaction]:
+        """
+        Stream a pool's transactions, following next_cursor between pages.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            pool_address: Pool address or identifier
+            limit: Number of items per page request
+            from_timestamp: Only transactions from this UNIX timestamp (inclusive)
+            to_timestamp: Only transactions before this UNIX timestamp (exclusive)
+            max_items: Stop after this many transactions
+            prefetch: Fetch the next page while the current one is consumed
+
+        Returns:
+            An iterator of transactions
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._get_transactions_request(network_id, pool_address, 0, limit, None, from_timestamp, to_timestamp)
+
+        def fetch(page: int, cursor: Optional[str]) -> TransactionsResponse:
+            # the cursor already encodes the position, so only send page without one;
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._get_transactions_request(
+                network_id, pool_address, 0 if cursor else page, limit, cursor, from_timestamp, to_timestamp,
+            )
+            return self._get_model(endpoint, params, TransactionsResponse, skip_cache=True)
+
+        return self._iter_items(fetch, "transactions", 0, max_items, prefetch)
+
+    def iter_filter(
+        self,
+        network_id: str,
+        limit: int = 100,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+        **filters: Any,
+    ) -> Iterator[FilteredPool]:
+        """
+        Stream every pool matching a filter, fetching pages lazily.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            limit: Number of items per page request
+            start_page: Page number to start from (1-indexed)
+            max_items: Stop after this many pools
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+            **filters: Any other argument accepted by filter() (sort_by,
+                sort_dir, volume_24h_min, liquidity_usd_min, ...)
+
+        Returns:
+            An iterator of filtered pools
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._validate_required("network_id", network_id)
+        self._validate_range("page", start_page, min_val=1)
+        self._validate_range("limit", limit, min_val=1, max_val=100)
+
+        def fetch(page: int, cursor: Optional[str]) -> PoolFilterResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._filter_request(network_id, page, limit, **filters)
+            return self._get_model(endpoint, params, parse=self._parse_filter, skip_cache=True)
+
+        return self._iter_items(fetch, "results", start_page, max_items, prefetch, window, base_page=1)
+
+    def tail_transactions(
+        self,
+        pools: List[Tuple[str, str]],
+        **options: Any,
+    ) -> TransactionTailer:
+        """
+        Follow new transactions on one or more pools.
+
+        Args:
+            pools: (network_id, pool_address) pairs to follow
+            **options: Any other argument accepted by TransactionTailer
+                (min_interval, max_interval, page_limit, include_existing, ...)
+
+        Returns:
+            A tailer; iterate it, or call poll() from your own loop
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        for network_id, pool_address in pools:
+            self._validate_required("network_id", network_id)
+            self._validate_required("pool_address", pool_address)
+        return TransactionTailer(self, pools, **options)
+
+    def _poll_transactions(
+        self,
+        network_id: str,
+        pool_address: str,
+        limit: int,
+        cursor: Optional[str],
+        from_timestamp: Optional[int],
+    ) -> TransactionsResponse:
+        """Fetch a page of the newest transactions, bypassing the cache."""
+        endpoint, params = self._get_transactions_request(
+            network_id, pool_address, 0, limit, cursor, from_timestamp, None
+        )
+        data = self._get(endpoint, params=params, skip_cache=True)
+        return self._parse(TransactionsResponse, data, raw=False)
+
+
+class AsyncPoolsAPI(AsyncBaseAPI, PoolsAPI):
+    """Asyncio counterpart of PoolsAPI."""
+
+    async def list(
+        self, 
+        page: int = 0, 
+        limit: int = 10, 
+        sort: str = "desc", 
+        order_by: str = "volume_usd"
+    ) -> PoolsResponse:
+        """
+        DEPRECATED: Get a list of top pools across all networks.
+
+        See PoolsAPI.list; use list_by_network(network_id, ...) instead.
+        """
+        warnings.warn(_LIST_DEPRECATION_MESSAGE, DeprecationWarning, stacklevel=2)
+
+        endpoint, params = self._list_request(page, limit, sort, order_by)
 
-        return PoolFilterResponse(**data)
\ No newline at end of file
+        try:
+            return await self._get_model(endpoint, params, parse=self._parse_pools)
+
+        except Exception as e:
+            self._report_list_fallback(e)
+            return await self.list_by_network("ethereum", page=page, limit=limit, sort=sort, order_by=order_by)
+
+    async def list_by_network(
+        self, 
+        network_id: str, 
+        page: int = 0, 
+        limit: int = 10, 
+        sort: str = "desc", 
+        order_by: str = "volume_usd"
+    ) -> PoolsResponse:
+        """
+        Get a list of pools on a specific network.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            page: Page number for pagination
+            limit: Number of items per page
+            sort: Sort order ("asc" or "desc")
+            order_by: Field to order by ("volume_usd", "price_usd", etc.)
+
+        Returns:
+            Response containing a list of pools
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        endpoint, params = self._list_by_network_request(network_id, page, limit, sort, order_by)
+        return await self._get_model(endpoint, params, parse=self._parse_pools)
+
+    async def list_by_dex(
+        self, 
+        network_id: str, 
+        dex_id: str, 
+        page: int = 0, 
+        limit: int = 10, 
+        sort: str = "desc", 
+        order_by: str = "volume_usd"
+    ) -> PoolsResponse:
+        """
+        Get a list of pools for a specific DEX on a network.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            dex_id: DEX ID (e.g., "uniswap_v3")
+            page: Page number for pagination
+            limit: Number of items per page
+            sort: Sort order ("asc" or "desc")
+            order_by: Field to order by ("volume_usd", "price_usd", etc.)
+
+        Returns:
+            Response containing a list of pools
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        endpoint, params = self._list_by_dex_request(network_id, dex_id, page, limit, sort, order_by)
+        return await self._get_model(endpoint, params, parse=self._parse_pools)
+
+    async def get_details(
+        self, 
+        network_id: str, 
+        pool_address: str, 
+        inversed: bool = False
+    ) -> PoolDetails:
+        """
+        Get detailed information about a specific pool.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            pool_address: Pool address or identifier
+            inversed: Whether to invert the price ratio
+
+        Returns:
+            Detailed pool information
+
+        Raises:
+            ValueError: If any parameter is invalid
+            NotFoundError: If there is no such pool on the network
+        """
+        endpoint, params = self._get_details_request(network_id, pool_address, inversed)
+        try:
+            return await self._get_model(endpoint, params, PoolDetails, cache_not_found=True)
+        except Exception as e:
+            self._check_not_found(e, "pool", network_id, pool_address)
+            raise
+
+    async def get_ohlcv(
+        self, 
+        network_id: str, 
+        pool_address: str, 
+        start: str, 
+        end: Optional[str] = None, 
+        limit: int = 1, 
+        interval: str = "24h", 
+        inversed: bool = False
+    ) -> List[OHLCVRecord]:
+        """
+        Get OHLCV (Open-High-Low-Close-Volume) data for a specific pool.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            pool_address: Pool address or identifier
+            start: Start time for historical data (ISO-8601, yyyy-mm-dd, or Unix timestamp)
+            end: End time for historical data (max 1 year from start)
+            limit: Number of data points to retrieve (max 366)
+            interval: Interval granularity for OHLCV data (1m, 5m, 10m, 15m, 30m, 1h, 6h, 12h, 24h)
+            inversed: Whether to invert the price ratio in OHLCV calculations
+
+        Returns:
+            List of OHLCV records
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        return await self._get_ohlcv(network_id, pool_address, start, end, limit, interval, inversed)
+
+    async def _get_ohlcv(
+        self,
+        network_id: str,
+        pool_address: str,
+        start: str,
+        end: Optional[str],
+        limit: int,
+        interval: str,
+        inversed: bool,
+        skip_cache: bool = False,
+    ) -> List[OHLCVRecord]:
+        """get_ohlcv, optionally bypassing the response cache (see PoolsAPI._get_ohlcv)."""
+        endpoint, params = self._get_ohlcv_request(
+            network_id, pool_address, start, end, limit, interval, inversed
+        )
+        if self.client.candle_store is not None:
+            # the store is SQLite: keep its I/O off the event loop, and
+            # fetch the missing spans concurrently
+            plan, spans = await self._to_thread(
+                self._plan_stored_ohlcv, network_id, pool_address, start, end, limit, interval, inversed,
+            )
+            fetched = await asyncio.gather(*(
+                self._get(span_endpoint, params=span_params, skip_cache=skip_cache)
+                for span_endpoint, span_params in spans
+            ))
+            return await self._to_thread(self._finish_stored_ohlcv, plan, list(fetched))
+
+        return await self._get_model(endpoint, params, OHLCVRecord, many=True, skip_cache=skip_cache)
+
+    async def get_ohlcv_arrays(
+        self,
+        network_id: str,
+        pool_address: str,
+        start: str,
+        end: Optional[str] = None,
+        limit: int = 1,
+        interval: str = "24h",
+        inversed: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Get OHLCV data as columnar NumPy arrays instead of OHLCVRecord models.
+
+        See PoolsAPI.get_ohlcv_arrays.
+
+        Raises:
+            ValueError: If any parameter is invalid
+            ImportError: If numpy is not installed
+        """
+        if self.client.candle_store is not None:
+            return ohlcv_arrays(await self.get_ohlcv(network_id, pool_address, start, end, limit, interval, inversed))
+        endpoint, params = self._get_ohlcv_request(
+            network_id, pool_address, start, end, limit, interval, inversed
+        )
+        return ohlcv_arrays(await self._get(endpoint, params=params))
+
+    async def get_ohlcv_history(
+        self,
+        network_id: str,
+        pool_address: str,
+        start: Union[str, int, datetime],
+        end: Optional[Union[str, int, datetime]] = None,
+        interval: str = "24h",
+        inversed: bool = False,
+        max_concurrency: int = 4,
+    ) -> OHLCVHistoryResponse:
+        """
+        Get OHLCV data for an arbitrary time range.
+
+        See PoolsAPI.get_ohlcv_history; windows run as concurrent tasks
+        bounded by ``max_concurrency``.
+
+        Returns:
+            Candles sorted by time_open, plus gaps and per-window errors
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        windows = self._ohlcv_windows(network_id, pool_address, start, end, interval, max_concurrency)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(window: OHLCVWindow) -> Union[List[OHLCVRecord], Exception]:
+            window_start, window_end, limit = window
+            async with semaphore:
+                try:
+                    return await self._get_ohlcv(
+                        network_id, pool_address, _format_time(window_start), _format_time(window_end),
+                        limit, interval, inversed, skip_cache=True,
+                    )
+                except Exception as e:
+                    return e
+
+        outcomes = await asyncio.gather(*(fetch(window) for window in windows))
+        return self._stitch_ohlcv(windows, list(outcomes), interval)
+
+    async def get_transactions(
+        self,
+        network_id: str,
+        pool_address: str,
+        page: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        from_timestamp: Optional[int] = None,
+        to_timestamp: Optional[int] = None
+    ) -> TransactionsResponse:
+        """
+        Get transactions of a pool on a network.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            pool_address: Pool address or identifier
+            page: Page number for pagination
+            limit: Number of items per page
+            cursor: Transaction ID used for cursor-based pagination
+            from_timestamp: Filter transactions starting from this UNIX timestamp (inclusive). Results capped to last 7 days.
+            to_timestamp: Filter transactions up to this UNIX timestamp (exclusive). Must be after from_timestamp.
+
+        Returns:
+            Response containing a list of transactions
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        endpoint, params = self._get_transactions_request(
+            network_id, pool_address, page, limit, cursor, from_timestamp, to_timestamp
+        )
+        return await self._get_model(endpoint, params, TransactionsResponse)
+
+    async def get_transactions_arrays(
+        self,
+        network_id: str,
+        pool_address: str,
+        page: int = 0,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        from_timestamp: Optional[int] = None,
+        to_timestamp: Optional[int] = None
+    ) -> Tuple[Dict[str, Any], PageInfo]:
+        """
+        Get a page of transactions as columnar NumPy arrays instead of Transaction models.
+
+        See PoolsAPI.get_transactions_arrays.
+
+        Raises:
+            ValueError: If any parameter is invalid
+            ImportError: If numpy is not installed
+        """
+        endpoint, params = self._get_transactions_request(
+            network_id, pool_address, page, limit, cursor, from_timestamp, to_timestamp
+        )
+        data = await self._get(endpoint, params=params)
+        return transaction_arrays(data["transactions"]), self._transactions_page_info(data, page, limit)
+
+    async def filter(
+        self,
+        network_id: str,
+        page: int = 1,
+        limit: int = 10,
+        sort_by: str = "volume_24h",
+        sort_dir: str = "desc",
+        volume_24h_min: Optional[float] = None,
+        volume_24h_max: Optional[float] = None,
+        volume_7d_min: Optional[float] = None,
+        volume_7d_max: Optional[float] = None,
+        liquidity_usd_min: Optional[float] = None,
+        liquidity_usd_max: Optional[float] = None,
+        txns_24h_min: Optional[int] = None,
+        created_after: Optional[Union[int, str]] = None,
+        created_before: Optional[Union[int, str]] = None,
+    ) -> PoolFilterResponse:
+        """
+        Filter pools on a network by volume, liquidity, transactions, and creation date.
+
+        See PoolsAPI.filter for the meaning of each argument.
+
+        Returns:
+            Filtered pools with pagination info
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        endpoint, params = self._filter_request(
+            network_id, page, limit, sort_by, sort_dir,
+            volume_24h_min, volume_24h_max, volume_7d_min, volume_7d_max,
+            liquidity_usd_min, liquidity_usd_max, txns_24h_min,
+            created_after, created_before,
+        )
+        return await self._get_model(endpoint, params, parse=self._parse_filter)
+
+    def iter_list_by_network(
+        self,
+        network_id: str,
+        limit: int = 100,
+        sort: str = "desc",
+        order_by: str = "volume_usd",
+        start_page: int = 0,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+    ) -> AsyncIterator[Pool]:
+        """
+        Stream every pool on a network, fetching pages lazily.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            limit: Number of items per page request
+            sort: Sort order ("asc" or "desc")
+            order_by: Field to order by ("volume_usd", "price_usd", etc.)
+            start_page: Page number to start from
+            max_items: Stop after this many pools
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+
+        Returns:
+            An async iterator of pools
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._list_by_network_request(network_id, start_page, limit, sort, order_by)
+
+        async def fetch(page: int, cursor: Optional[str]) -> PoolsResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._list_by_network_request(network_id, page, limit, sort, order_by)
+            return await self._get_model(endpoint, params, parse=self._parse_pools, skip_cache=True)
+
+        return self._iter_items(fetch, "pools", start_page, max_items, prefetch, window)
+
+    def iter_list_by_dex(
+        self,
+        network_id: str,
+        dex_id: str,
+        limit: int = 100,
+        sort: str = "desc",
+        order_by: str = "volume_usd",
+        start_page: int = 0,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+    ) -> AsyncIterator[Pool]:
+        """
+        Stream every pool of a DEX on a network, fetching pages lazily.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            dex_id: DEX ID (e.g., "uniswap_v3")
+            limit: Number of items per page request
+            sort: Sort order ("asc" or "desc")
+            order_by: Field to order by ("volume_usd", "price_usd", etc.)
+            start_page: Page number to start from
+            max_items: Stop after this many pools
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+
+        Returns:
+            An async iterator of pools
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._list_by_dex_request(network_id, dex_id, start_page, limit, sort, order_by)
+
+        async def fetch(page: int, cursor: Optional[str]) -> PoolsResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._list_by_dex_request(network_id, dex_id, page, limit, sort, order_by)
+            return await self._get_model(endpoint, params, parse=self._parse_pools, skip_cache=True)
+
+        return self._iter_items(fetch, "pools", start_page, max_items, prefetch, window)
+
+    def iter_transactions(
+        self,
+        network_id: str,
+        pool_address: str,
+        limit: int = 100,
+        from_timestamp: Optional[int] = None,
+        to_timestamp: Optional[int] = None,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Transaction]:
+        """
+        Stream a pool's transactions, following next_cursor between pages.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            pool_address: Pool address or identifier
+            limit: Number of items per page request
+            from_timestamp: Only transactions from this UNIX timestamp (inclusive)
+            to_timestamp: Only transactions before this UNIX timestamp (exclusive)
+            max_items: Stop after this many transactions
+            prefetch: Fetch the next page while the current one is consumed
+
+        Returns:
+            An async iterator of transactions
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._get_transactions_request(network_id, pool_address, 0, limit, None, from_timestamp, to_timestamp)
+
+        async def fetch(page: int, cursor: Optional[str]) -> TransactionsResponse:
+            # the cursor already encodes the position, so only send page without one;
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._get_transactions_request(
+                network_id, pool_address, 0 if cursor else page, limit, cursor, from_timestamp, to_timestamp,
+            )
+            return await self._get_model(endpoint, params, TransactionsResponse, skip_cache=True)
+
+        return self._iter_items(fetch, "transactions", 0, max_items, prefetch)
+
+    def iter_filter(
+        self,
+        network_id: str,
+        limit: int = 100,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+        **filters: Any,
+    ) -> AsyncIterator[FilteredPool]:
+        """
+        Stream every pool matching a filter, fetching pages lazily.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            limit: Number of items per page request
+            start_page: Page number to start from (1-indexed)
+            max_items: Stop after this many pools
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+            **filters: Any other argument accepted by filter() (sort_by,
+                sort_dir, volume_24h_min, liquidity_usd_min, ...)
+
+        Returns:
+            An async iterator of filtered pools
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._validate_required("network_id", network_id)
+        self._validate_range("page", start_page, min_val=1)
+        self._validate_range("limit", limit, min_val=1, max_val=100)
+
+        async def fetch(page: int, cursor: Optional[str]) -> PoolFilterResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._filter_request(network_id, page, limit, **filters)
+            return await self._get_model(endpoint, params, parse=self._parse_filter, skip_cache=True)
+
+        return self._iter_items(fetch, "results", start_page, max_items, prefetch, window, base_page=1)
+
+    def tail_transactions(
+        self,
+        pools: List[Tuple[str, str]],
+        **options: Any,
+    ) -> AsyncTransactionTailer:
+        """
+        Follow new transactions on one or more pools.
+
+        Args:
+            pools: (network_id, pool_address) pairs to follow
+            **options: Any other argument accepted by AsyncTransactionTailer
+                (min_interval, max_interval, page_limit, include_existing, ...)
+
+        Returns:
+            An async tailer; iterate it with ``async for``, or await poll()
+            from your own loop
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        for network_id, pool_address in pools:
+            self._validate_required("network_id", network_id)
+            self._validate_required("pool_address", pool_address)
+        return AsyncTransactionTailer(self, pools, **options)
+
+    async def _poll_transactions(
+        self,
+        network_id: str,
+        pool_address: str,
+        limit: int,
+        cursor: Optional[str],
+        from_timestamp: Optional[int],
+    ) -> TransactionsResponse:
+        """Fetch a page of the newest transactions, bypassing the cache."""
+        endpoint, params = self._get_transactions_request(
+            network_id, pool_address, 0, limit, cursor, from_timestamp, None
+        )
+        data = await self._get(endpoint, params=params, skip_cache=True)
+        return self._parse(TransactionsResponse, data, raw=False)
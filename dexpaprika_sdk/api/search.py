@@ -1,6 +1,6 @@
 from urllib.parse import quote
 
-from .base import BaseAPI
+from .base import BaseAPI, AsyncBaseAPI
 from ..models.search import SearchResult
 
 
@@ -24,5 +24,25 @@ class SearchAPI(BaseAPI):
         self._validate_required("query", query)
         
         params = {"query": query}
-        data = self._get("/search", params=params)
-        return SearchResult(**data) 
\ No newline at end of file
+        return self._get_model("/search", params, SearchResult)
+
+
+class AsyncSearchAPI(AsyncBaseAPI, SearchAPI):
+    """Asyncio counterpart of SearchAPI."""
+    
+    async def search(self, query: str) -> SearchResult:
+        """
+        Search for tokens, pools, and DEXes by name or identifier.
+        
+        Args:
+            query: Search term (e.g., "uniswap", "bitcoin", or a token address)
+            
+        Returns:
+            Search results across tokens, pools, and DEXes
+            
+        Raises:
+            ValueError: If the query parameter is invalid
+        """
+        self._validate_required("query", query)
+        
+        return await self._get_model("/search", {"query": query}, SearchResult)
@@ -1,10 +1,13 @@
-from typing import Optional, Dict, Any, Set, List, Union
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterator, Optional, Dict, Any, Set, List, Tuple, Union
 
-from .base import BaseAPI
+from .base import BaseAPI, AsyncBaseAPI
 from ..models.tokens import (
-    TokenDetails, TopTokensResponse, TokenFilterResponse, TokenPrice,
+    TokenDetails, TopToken, TopTokensResponse, FilteredToken, TokenFilterResponse, TokenPrice,
+    PriceChunkError, BulkPricesResponse,
 )
-from ..models.pools import PoolsResponse
+from ..models.pools import Pool, PoolsResponse
 from ..utils.perf import track_perf
 
 
@@ -15,6 +18,9 @@ class TokensAPI(BaseAPI):
     VALID_SORT_VALUES: Set[str] = {"asc", "desc"}
     VALID_ORDER_BY_VALUES: Set[str] = {"volume_usd", "price_usd", "transactions", "last_price_change_usd_24h", "created_at"}
     
+    # Most addresses the multi-prices endpoint accepts per request
+    MAX_MULTI_PRICE_TOKENS: int = 10
+    
     @track_perf
     def get_details(self, network_id: str, token_address: str) -> TokenDetails:
         """
@@ -29,13 +35,22 @@ class TokensAPI(BaseAPI):
             
         Raises:
             ValueError: If any parameter is invalid
+            NotFoundError: If there is no such token on the network
         """
+        endpoint = self._get_details_request(network_id, token_address)
+        try:
+            return self._get_model(endpoint, model=TokenDetails, cache_not_found=True)
+        except Exception as e:
+            self._check_not_found(e, "token", network_id, token_address)
+            raise
+    
+    def _get_details_request(self, network_id: str, token_address: str) -> str:
+        """Validate get_details arguments and build its endpoint."""
         # Validate parameters
         self._validate_required("network_id", network_id)
         self._validate_required("token_address", token_address)
         
-        data = self._get(f"/networks/{network_id}/tokens/{token_address}")
-        return TokenDetails(**data)
+        return f"/networks/{network_id}/tokens/{token_address}"
     
     @track_perf
     def get_pools(
@@ -71,6 +86,23 @@ class TokensAPI(BaseAPI):
         Raises:
             ValueError: If any parameter is invalid
         """
+        endpoint, params = self._get_pools_request(
+            network_id, token_address, page, limit, sort, order_by, address, reorder
+        )
+        return self._get_model(endpoint, params, parse=self._parse_pools)
+    
+    def _get_pools_request(
+        self, 
+        network_id: str, 
+        token_address: str, 
+        page: int, 
+        limit: int, 
+        sort: str, 
+        order_by: str,
+        address: Optional[str],
+        reorder: Optional[bool],
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Validate get_pools arguments and build its endpoint and params."""
         # Validate parameters
         self._validate_required("network_id", network_id)
         self._validate_required("token_address", token_address)
@@ -89,12 +121,14 @@ class TokensAPI(BaseAPI):
         }
         params = self._clean_params(params)
         
-        data = self._get(f"/networks/{network_id}/tokens/{token_address}/pools", params=params)
+        return f"/networks/{network_id}/tokens/{token_address}/pools", params
 
-        # ensure pools exists
-        if 'pools' not in data: data['pools'] = []
+    def _parse_pools(self, data: Dict[str, Any]) -> PoolsResponse:
+        """Build a PoolsResponse, tolerating a missing pools key."""
+        # ensure pools exists (on a copy, data may be the cached response)
+        if 'pools' not in data: data = {**data, 'pools': []}
 
-        return PoolsResponse(**data)
+        return self._parse(PoolsResponse, data)
 
     @track_perf
     def get_top(
@@ -121,6 +155,18 @@ class TokensAPI(BaseAPI):
         Raises:
             ValueError: If any parameter is invalid
         """
+        endpoint, params = self._get_top_request(network_id, page, limit, order_by, sort)
+        return self._get_model(endpoint, params, parse=self._parse_top)
+
+    def _get_top_request(
+        self,
+        network_id: str,
+        page: int,
+        limit: int,
+        order_by: str,
+        sort: str,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Validate get_top arguments and build its endpoint and params."""
         self._validate_required("network_id", network_id)
         self._validate_range("page", page, min_val=1)
         self._validate_range("limit", limit, min_val=1, max_val=100)
@@ -134,12 +180,14 @@ class TokensAPI(BaseAPI):
         }
         params = self._clean_params(params)
 
-        data = self._get(f"/networks/{network_id}/tokens/top", params=params)
+        return f"/networks/{network_id}/tokens/top", params
 
+    def _parse_top(self, data: Dict[str, Any]) -> TopTokensResponse:
+        """Build a TopTokensResponse, tolerating a missing tokens key."""
         if 'tokens' not in data:
-            data['tokens'] = []
+            data = {**data, 'tokens': []}
 
-        return TopTokensResponse(**data)
+        return self._parse(TopTokensResponse, data)
 
     @track_perf
     def filter(
@@ -182,6 +230,30 @@ class TokensAPI(BaseAPI):
         Raises:
             ValueError: If any parameter is invalid
         """
+        endpoint, params = self._filter_request(
+            network_id, page, limit, sort_by, sort_dir,
+            volume_24h_min, volume_24h_max, liquidity_usd_min,
+            fdv_min, fdv_max, txns_24h_min, created_after, created_before,
+        )
+        return self._get_model(endpoint, params, parse=self._parse_filter)
+
+    def _filter_request(
+        self,
+        network_id: str,
+        page: int,
+        limit: int,
+        sort_by: str = "volume_24h",
+        sort_dir: str = "desc",
+        volume_24h_min: Optional[float] = None,
+        volume_24h_max: Optional[float] = None,
+        liquidity_usd_min: Optional[float] = None,
+        fdv_min: Optional[float] = None,
+        fdv_max: Optional[float] = None,
+        txns_24h_min: Optional[int] = None,
+        created_after: Optional[Union[int, str]] = None,
+        created_before: Optional[Union[int, str]] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Validate filter arguments and build its endpoint and params."""
         self._validate_required("network_id", network_id)
         self._validate_range("page", page, min_val=1)
         self._validate_range("limit", limit, min_val=1, max_val=100)
@@ -203,15 +275,18 @@ class TokensAPI(BaseAPI):
         }
         params = self._clean_params(params)
 
-        data = self._get(f"/networks/{network_id}/tokens/filter", params=params)
+        return f"/networks/{network_id}/tokens/filter", params
 
+    def _parse_filter(self, data: Dict[str, Any]) -> TokenFilterResponse:
+        """Build a TokenFilterResponse from the filter endpoint payload."""
         # The token filter endpoint returns rows under a "data" key, not "results".
         # Map it across (falling back to an empty list) so callers get a consistent
-        # ``results`` field regardless of the wire key.
+        # ``results`` field regardless of the wire key. The cached response
+        # is left untouched.
         if 'results' not in data:
-            data['results'] = data.get('data', [])
+            data = {**data, 'results': data.get('data', [])}
 
-        return TokenFilterResponse(**data)
+        return self._parse(TokenFilterResponse, data)
 
     @track_perf
     def get_multi_prices(
@@ -232,13 +307,536 @@ class TokensAPI(BaseAPI):
         Raises:
             ValueError: If any parameter is invalid
         """
+        endpoint, params = self._get_multi_prices_request(network_id, tokens)
+        return self._get_model(endpoint, params, TokenPrice, many=True)
+
+    def _get_multi_prices_request(self, network_id: str, tokens: List[str]) -> Tuple[str, Dict[str, Any]]:
+        """Validate get_multi_prices arguments and build its endpoint and params."""
         self._validate_required("network_id", network_id)
         if not tokens or len(tokens) == 0:
             raise ValueError("tokens list is required and must not be empty")
-        if len(tokens) > 10:
-            raise ValueError("tokens list must contain at most 10 addresses")
+        if len(tokens) > self.MAX_MULTI_PRICE_TOKENS:
+            raise ValueError(f"tokens list must contain at most {self.MAX_MULTI_PRICE_TOKENS} addresses")
 
         params = {"tokens": ",".join(tokens)}
 
-        data = self._get(f"/networks/{network_id}/multi/prices", params=params)
-        return [TokenPrice(**item) for item in data]
\ No newline at end of file
+        return f"/networks/{network_id}/multi/prices", params
+
+    @track_perf
+    def get_multi_prices_bulk(
+        self,
+        network_id: str,
+        tokens: List[str],
+        max_concurrency: int = 8,
+    ) -> BulkPricesResponse:
+        """
+        Get prices for any number of tokens, batching multi-prices requests.
+
+        Addresses are deduplicated, split into batches of up to 10 and fetched
+        concurrently. A failing batch does not fail the whole call; it is
+        reported in ``errors`` while the other batches still return prices.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            tokens: List of token addresses (any length)
+            max_concurrency: Maximum number of batches in flight at once
+
+        Returns:
+            Prices in input order, plus per-batch errors and missing addresses
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        unique, chunks = self._chunk_multi_prices(network_id, tokens, max_concurrency)
+
+        if max_concurrency == 1 or len(chunks) == 1:
+            outcomes = [self._fetch_price_chunk(network_id, chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(chunks))) as executor:
+                outcomes = list(executor.map(lambda chunk: self._fetch_price_chunk(network_id, chunk), chunks))
+
+        return self._merge_price_chunks(unique, chunks, outcomes)
+
+    def _chunk_multi_prices(
+        self,
+        network_id: str,
+        tokens: List[str],
+        max_concurrency: int,
+    ) -> Tuple[List[str], List[List[str]]]:
+        """Validate bulk price arguments and split unique addresses into batches."""
+        self._validate_required("network_id", network_id)
+        if not tokens:
+            raise ValueError("tokens list is required and must not be empty")
+        self._validate_range("max_concurrency", max_concurrency, min_val=1)
+
+        # dict keeps first-seen order while dropping duplicates
+        unique = list(dict.fromkeys(tokens))
+        size = self.MAX_MULTI_PRICE_TOKENS
+        chunks = [unique[i:i + size] for i in range(0, len(unique), size)]
+        return unique, chunks
+
+    def _fetch_price_chunk(self, network_id: str, chunk: List[str]) -> Union[List[TokenPrice], Exception]:
+        """Fetch one batch, returning the exception instead of raising it."""
+        try:
+            return self.get_multi_prices(network_id, chunk)
+        except Exception as e:
+            return e
+
+    @staticmethod
+    def _merge_price_chunks(
+        unique: List[str],
+        chunks: List[List[str]],
+        outcomes: List[Union[List[TokenPrice], Exception]],
+    ) -> BulkPricesResponse:
+        """Combine batch outcomes into a single response in input order."""
+        by_id: Dict[str, TokenPrice] = {}
+        errors = []
+        failed = set()
+        for chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, Exception):
+                errors.append(PriceChunkError(tokens=chunk, error=outcome))
+                failed.update(chunk)
+                continue
+            for price in outcome:
+                price_id = BaseAPI._field(price, "id")
+                if not price_id:
+                    # unvalidated rows may lack an id; nothing to match them to
+                    continue
+                by_id[price_id] = price
+                # EVM addresses may come back with different casing
+                by_id.setdefault(price_id.lower(), price)
+
+        prices = []
+        missing = []
+        for address in unique:
+            price = by_id.get(address) or by_id.get(address.lower())
+            if price is not None:
+                prices.append(price)
+            elif address not in failed:
+                missing.append(address)
+
+        return BulkPricesResponse(prices=prices, errors=errors, missing=missing)
+
+    def iter_pools(
+        self,
+        network_id: str,
+        token_address: str,
+        limit: int = 100,
+        sort: str = "desc",
+        order_by: str = "volume_usd",
+        address: Optional[str] = None,
+        reorder: Optional[bool] = None,
+        start_page: int = 0,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+    ) -> Iterator[Pool]:
+        """
+        Stream every pool containing a token, fetching pages lazily.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            token_address: Token address or identifier
+            limit: Number of items per page request
+            sort: Sort order ("asc" or "desc")
+            order_by: Field to order by (see get_pools)
+            address: Filter pools that contain this additional token address
+            reorder: Make the specified token primary for all metrics
+            start_page: Page number to start from
+            max_items: Stop after this many pools
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+
+        Returns:
+            An iterator of pools
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._get_pools_request(network_id, token_address, start_page, limit, sort, order_by, address, reorder)
+
+        def fetch(page: int, cursor: Optional[str]) -> PoolsResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._get_pools_request(
+                network_id, token_address, page, limit, sort, order_by, address, reorder,
+            )
+            return self._get_model(endpoint, params, parse=self._parse_pools, skip_cache=True)
+
+        return self._iter_items(fetch, "pools", start_page, max_items, prefetch, window)
+
+    def iter_top(
+        self,
+        network_id: str,
+        limit: int = 100,
+        order_by: str = "volume_24h",
+        sort: str = "desc",
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+    ) -> Iterator[TopToken]:
+        """
+        Stream top tokens on a network, fetching pages lazily.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            limit: Number of items per page request
+            order_by: Field to order by (e.g., "volume_24h", "price_usd")
+            sort: Sort direction ("asc" or "desc")
+            start_page: Page number to start from (1-indexed)
+            max_items: Stop after this many tokens
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+
+        Returns:
+            An iterator of top tokens
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._get_top_request(network_id, start_page, limit, order_by, sort)
+
+        def fetch(page: int, cursor: Optional[str]) -> TopTokensResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._get_top_request(network_id, page, limit, order_by, sort)
+            return self._get_model(endpoint, params, parse=self._parse_top, skip_cache=True)
+
+        return self._iter_items(fetch, "tokens", start_page, max_items, prefetch, window, base_page=1)
+
+    def iter_filter(
+        self,
+        network_id: str,
+        limit: int = 100,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+        **filters: Any,
+    ) -> Iterator[FilteredToken]:
+        """
+        Stream every token matching a filter, fetching pages lazily.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            limit: Number of items per page request
+            start_page: Page number to start from (1-indexed)
+            max_items: Stop after this many tokens
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+            **filters: Any other argument accepted by filter() (sort_by,
+                sort_dir, volume_24h_min, fdv_min, ...)
+
+        Returns:
+            An iterator of filtered tokens
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._validate_required("network_id", network_id)
+        self._validate_range("page", start_page, min_val=1)
+        self._validate_range("limit", limit, min_val=1, max_val=100)
+
+        def fetch(page: int, cursor: Optional[str]) -> TokenFilterResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._filter_request(network_id, page, limit, **filters)
+            return self._get_model(endpoint, params, parse=self._parse_filter, skip_cache=True)
+
+        return self._iter_items(fetch, "results", start_page, max_items, prefetch, window, base_page=1)
+
+
+class AsyncTokensAPI(AsyncBaseAPI, TokensAPI):
+    """Asyncio counterpart of TokensAPI."""
+
+    @track_perf
+    async def get_details(self, network_id: str, token_address: str) -> TokenDetails:
+        """
+        Get detailed information about a specific token on a network.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            token_address: Token address or identifier
+
+        Returns:
+            Detailed information about the token
+
+        Raises:
+            ValueError: If any parameter is invalid
+            NotFoundError: If there is no such token on the network
+        """
+        endpoint = self._get_details_request(network_id, token_address)
+        try:
+            return await self._get_model(endpoint, model=TokenDetails, cache_not_found=True)
+        except Exception as e:
+            self._check_not_found(e, "token", network_id, token_address)
+            raise
+
+    @track_perf
+    async def get_pools(
+        self, 
+        network_id: str, 
+        token_address: str, 
+        page: int = 0, 
+        limit: int = 10, 
+        sort: str = "desc", 
+        order_by: str = "volume_usd",
+        address: Optional[str] = None,
+        reorder: Optional[bool] = None,
+    ) -> PoolsResponse:
+        """
+        Get a list of top liquidity pools for a specific token on a network.
+
+        See TokensAPI.get_pools for the meaning of each argument.
+
+        Returns:
+            Response containing a list of pools for the given token
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        endpoint, params = self._get_pools_request(
+            network_id, token_address, page, limit, sort, order_by, address, reorder
+        )
+        return await self._get_model(endpoint, params, parse=self._parse_pools)
+
+    @track_perf
+    async def get_top(
+        self,
+        network_id: str,
+        page: int = 1,
+        limit: int = 10,
+        order_by: str = "volume_24h",
+        sort: str = "desc",
+    ) -> TopTokensResponse:
+        """
+        Get top tokens on a network ranked by volume, price, liquidity, or other metrics.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            page: Page number for pagination (1-indexed)
+            limit: Number of items per page (max 100)
+            order_by: Field to order by (e.g., "volume_24h", "price_usd", "liquidity_usd", "txns_24h")
+            sort: Sort direction ("asc" or "desc")
+
+        Returns:
+            Top tokens with pagination info
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        endpoint, params = self._get_top_request(network_id, page, limit, order_by, sort)
+        return await self._get_model(endpoint, params, parse=self._parse_top)
+
+    @track_perf
+    async def filter(
+        self,
+        network_id: str,
+        page: int = 1,
+        limit: int = 10,
+        sort_by: str = "volume_24h",
+        sort_dir: str = "desc",
+        volume_24h_min: Optional[float] = None,
+        volume_24h_max: Optional[float] = None,
+        liquidity_usd_min: Optional[float] = None,
+        fdv_min: Optional[float] = None,
+        fdv_max: Optional[float] = None,
+        txns_24h_min: Optional[int] = None,
+        created_after: Optional[Union[int, str]] = None,
+        created_before: Optional[Union[int, str]] = None,
+    ) -> TokenFilterResponse:
+        """
+        Filter tokens on a network by volume, liquidity, FDV, transactions, and creation date.
+
+        See TokensAPI.filter for the meaning of each argument.
+
+        Returns:
+            Filtered tokens with pagination info
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        endpoint, params = self._filter_request(
+            network_id, page, limit, sort_by, sort_dir,
+            volume_24h_min, volume_24h_max, liquidity_usd_min,
+            fdv_min, fdv_max, txns_24h_min, created_after, created_before,
+        )
+        return await self._get_model(endpoint, params, parse=self._parse_filter)
+
+    @track_perf
+    async def get_multi_prices(
+        self,
+        network_id: str,
+        tokens: List[str],
+    ) -> List[TokenPrice]:
+        """
+        Get batch prices for multiple tokens on a network.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            tokens: List of token addresses (max 10)
+
+        Returns:
+            List of token prices
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        endpoint, params = self._get_multi_prices_request(network_id, tokens)
+        return await self._get_model(endpoint, params, TokenPrice, many=True)
+
+    @track_perf
+    async def get_multi_prices_bulk(
+        self,
+        network_id: str,
+        tokens: List[str],
+        max_concurrency: int = 8,
+    ) -> BulkPricesResponse:
+        """
+        Get prices for any number of tokens, batching multi-prices requests.
+
+        See TokensAPI.get_multi_prices_bulk; batches run as concurrent tasks
+        bounded by ``max_concurrency``.
+
+        Returns:
+            Prices in input order, plus per-batch errors and missing addresses
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        unique, chunks = self._chunk_multi_prices(network_id, tokens, max_concurrency)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(chunk: List[str]) -> Union[List[TokenPrice], Exception]:
+            async with semaphore:
+                try:
+                    return await self.get_multi_prices(network_id, chunk)
+                except Exception as e:
+                    return e
+
+        outcomes = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return self._merge_price_chunks(unique, chunks, list(outcomes))
+
+    def iter_pools(
+        self,
+        network_id: str,
+        token_address: str,
+        limit: int = 100,
+        sort: str = "desc",
+        order_by: str = "volume_usd",
+        address: Optional[str] = None,
+        reorder: Optional[bool] = None,
+        start_page: int = 0,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+    ) -> AsyncIterator[Pool]:
+        """
+        Stream every pool containing a token, fetching pages lazily.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            token_address: Token address or identifier
+            limit: Number of items per page request
+            sort: Sort order ("asc" or "desc")
+            order_by: Field to order by (see get_pools)
+            address: Filter pools that contain this additional token address
+            reorder: Make the specified token primary for all metrics
+            start_page: Page number to start from
+            max_items: Stop after this many pools
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+
+        Returns:
+            An async iterator of pools
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._get_pools_request(network_id, token_address, start_page, limit, sort, order_by, address, reorder)
+
+        async def fetch(page: int, cursor: Optional[str]) -> PoolsResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._get_pools_request(
+                network_id, token_address, page, limit, sort, order_by, address, reorder,
+            )
+            return await self._get_model(endpoint, params, parse=self._parse_pools, skip_cache=True)
+
+        return self._iter_items(fetch, "pools", start_page, max_items, prefetch, window)
+
+    def iter_top(
+        self,
+        network_id: str,
+        limit: int = 100,
+        order_by: str = "volume_24h",
+        sort: str = "desc",
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+    ) -> AsyncIterator[TopToken]:
+        """
+        Stream top tokens on a network, fetching pages lazily.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            limit: Number of items per page request
+            order_by: Field to order by (e.g., "volume_24h", "price_usd")
+            sort: Sort direction ("asc" or "desc")
+            start_page: Page number to start from (1-indexed)
+            max_items: Stop after this many tokens
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+
+        Returns:
+            An async iterator of top tokens
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._get_top_request(network_id, start_page, limit, order_by, sort)
+
+        async def fetch(page: int, cursor: Optional[str]) -> TopTokensResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._get_top_request(network_id, page, limit, order_by, sort)
+            return await self._get_model(endpoint, params, parse=self._parse_top, skip_cache=True)
+
+        return self._iter_items(fetch, "tokens", start_page, max_items, prefetch, window, base_page=1)
+
+    def iter_filter(
+        self,
+        network_id: str,
+        limit: int = 100,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        window: int = 1,
+        **filters: Any,
+    ) -> AsyncIterator[FilteredToken]:
+        """
+        Stream every token matching a filter, fetching pages lazily.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            limit: Number of items per page request
+            start_page: Page number to start from (1-indexed)
+            max_items: Stop after this many tokens
+            prefetch: Fetch the next page while the current one is consumed
+            window: Pages fetched concurrently once total_pages is known
+            **filters: Any other argument accepted by filter() (sort_by,
+                sort_dir, volume_24h_min, fdv_min, ...)
+
+        Returns:
+            An async iterator of filtered tokens
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        self._validate_required("network_id", network_id)
+        self._validate_range("page", start_page, min_val=1)
+        self._validate_range("limit", limit, min_val=1, max_val=100)
+
+        async def fetch(page: int, cursor: Optional[str]) -> TokenFilterResponse:
+            # sweeps don't keep their pages in the shared cache
+            endpoint, params = self._filter_request(network_id, page, limit, **filters)
+            return await self._get_model(endpoint, params, parse=self._parse_filter, skip_cache=True)
+
+        return self._iter_items(fetch, "results", start_page, max_items, prefetch, window, base_page=1)
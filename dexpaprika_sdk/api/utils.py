@@ -1,4 +1,4 @@
-from .base import BaseAPI
+from .base import BaseAPI, AsyncBaseAPI
 from ..models.utils import Stats
 
 
@@ -12,5 +12,17 @@ class UtilsAPI(BaseAPI):
         Returns:
             Statistics about the DexPaprika ecosystem
         """
-        data = self._get("/stats")
-        return Stats(**data) 
\ No newline at end of file
+        return self._get_model("/stats", model=Stats)
+
+
+class AsyncUtilsAPI(AsyncBaseAPI, UtilsAPI):
+    """Asyncio counterpart of UtilsAPI."""
+    
+    async def get_stats(self) -> Stats:
+        """
+        Get high-level statistics about the DexPaprika ecosystem.
+        
+        Returns:
+            Statistics about the DexPaprika ecosystem
+        """
+        return await self._get_model("/stats", model=Stats)
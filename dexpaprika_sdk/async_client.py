@@ -0,0 +1,293 @@
+import asyncio
+import inspect
+import time
+from typing import Optional, Dict, Any, Union, List, Sequence, Tuple
+
+from .client import DexPaprikaClient, TimeoutSpec
+from .batch import BatchSpec, prepare_batch
+from .breaker import CircuitBreaker
+from .api.cache import AsyncSingleFlight
+from .cache_backends import CacheBackend
+from .candle_store import CandleStore
+from .ratelimit import RateLimiter
+from .utils.decoding import JSONDecoder
+from .api.networks import AsyncNetworksAPI
+from .api.pools import AsyncPoolsAPI
+from .api.tokens import AsyncTokensAPI
+from .api.search import AsyncSearchAPI
+from .api.utils import AsyncUtilsAPI
+from .api.dexes import AsyncDexesAPI
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+
+class AsyncDexPaprikaClient(DexPaprikaClient):
+    """
+    Asyncio client for the DexPaprika API.
+
+    Exposes the same services as DexPaprikaClient (networks, pools, tokens,
+    search, utils, dexes) with coroutine methods. Validation, caching and
+    model parsing are shared with the sync client; requests go through an
+    ``httpx.AsyncClient`` and retries back off with ``asyncio.sleep``, so a
+    single event loop can keep thousands of lookups in flight.
+
+    Requires the ``async`` extra: ``pip install dexpaprika-sdk[async]``.
+
+    Example:
+        async with AsyncDexPaprikaClient() as client:
+            pools = await asyncio.gather(
+                *(client.pools.get_details("ethereum", a) for a in addresses)
+            )
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://api.dexpaprika.com",
+        session: Optional["httpx.AsyncClient"] = None,
+        user_agent: str = "DexPaprika-SDK-Python/0.4.0",
+        max_retries: Optional[int] = 4,
+        backoff_times: List[float] = None,
+        deadline: Optional[float] = None,
+        timeout: TimeoutSpec = (10.0, 30.0),
+        max_connections: int = 100,
+        cache_max_entries: Optional[int] = 10000,
+        cache_max_bytes: Optional[int] = None,
+        candle_store: Optional[Union[str, CandleStore]] = None,
+        json_decoder: Union[str, JSONDecoder] = "auto",
+        validation: str = "full",
+        cache_models: bool = True,
+        rate_limit: Optional[Union[float, RateLimiter]] = None,
+        circuit_breaker: Optional[Union[bool, CircuitBreaker]] = None,
+        serve_stale: bool = True,
+        cache_backend: Optional[Union[str, CacheBackend]] = None,
+        not_found_ttl: Optional[float] = 60.0,
+    ):
+        """
+        Initialize a new async client.
+
+        Args:
+            base_url: API base URL
+            session: Optional preconfigured httpx.AsyncClient
+            user_agent: User-Agent header sent with every request
+            max_retries: Number of retry attempts for retryable failures (None to retry until the deadline)
+            backoff_times: Backoff schedule in seconds
+            deadline: Seconds a call may take across all retries (None for no limit)
+            timeout: Seconds, or (connect, read), for each attempt (None for no timeout)
+            max_connections: Connection pool size for the default session
+            cache_max_entries: Maximum cached responses (None for no limit)
+            cache_max_bytes: Approximate cache size budget in bytes
+            candle_store: CandleStore (or SQLite path) consulted by pools.get_ohlcv
+            json_decoder: JSON backend ("auto", "orjson", "msgspec", "json") or callable
+            validation: "full", "trusted" (build models without validation) or "none" (raw dicts)
+            cache_models: Cache parsed models alongside responses (nested models shared, read-only)
+            rate_limit: Requests per second, or a RateLimiter (shareable with other clients)
+            circuit_breaker: True or a CircuitBreaker to fail fast on failing endpoint families
+            serve_stale: Serve expired responses while refreshing them in the
+                background, and when the upstream fails (per TTL class)
+            cache_backend: CacheBackend (or SQLite path) shared with other
+                clients and processes, behind the in-memory cache
+            not_found_ttl: Seconds a 404 is cached, so repeated lookups of
+                missing tokens and pools fail without a request (None or 0
+                to disable)
+        """
+        super().__init__(
+            base_url=base_url,
+            session=session,
+            user_agent=user_agent,
+            max_retries=max_retries,
+            backoff_times=backoff_times,
+            deadline=deadline,
+            timeout=timeout,
+            max_connections=max_connections,
+            cache_max_entries=cache_max_entries,
+            cache_max_bytes=cache_max_bytes,
+            candle_store=candle_store,
+            json_decoder=json_decoder,
+            validation=validation,
+            cache_models=cache_models,
+            rate_limit=rate_limit,
+            circuit_breaker=circuit_breaker,
+            serve_stale=serve_stale,
+            cache_backend=cache_backend,
+            not_found_ttl=not_found_ttl,
+        )
+
+    def _create_session(self) -> "httpx.AsyncClient":
+        if httpx is None:
+            raise ImportError(
+                "AsyncDexPaprikaClient requires httpx. "
+                "Install it with: pip install dexpaprika-sdk[async]"
+            )
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+        )
+        return httpx.AsyncClient(limits=limits)
+
+    def _create_inflight(self) -> AsyncSingleFlight:
+        # request coalescer for cache misses, awaited by concurrent tasks
+        return AsyncSingleFlight()
+
+    def _create_services(self) -> None:
+        # async services
+        self.networks = AsyncNetworksAPI(self)
+        self.pools = AsyncPoolsAPI(self)
+        self.tokens = AsyncTokensAPI(self)
+        self.search = AsyncSearchAPI(self)
+        self.utils = AsyncUtilsAPI(self)
+        self.dexes = AsyncDexesAPI(self)
+
+    def _should_retry(self, exception: Exception) -> bool:
+        """
+        Determine if a request should be retried based on the exception.
+
+        Args:
+            exception: The exception that was raised
+
+        Returns:
+            True if the request should be retried, False otherwise
+        """
+        if httpx is not None:
+            if isinstance(exception, httpx.TransportError):
+                # Connection errors and timeouts
+                return True
+            if isinstance(exception, httpx.HTTPStatusError):
+                # Retry throttling (429) and server errors (5xx), not other client errors
+                status = exception.response.status_code
+                return status == 429 or 500 <= status < 600
+        return super()._should_retry(exception)
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: TimeoutSpec = None,
+        deadline: Optional[float] = None,
+    ) -> Union[Dict[str, Any], list]:
+        # make request to api
+        url = f"{self.base_url}{endpoint}"
+
+        # headers
+        request_headers = {"User-Agent": self.user_agent}
+        if headers: request_headers.update(headers)
+
+        timeout, deadline = self._request_settings(timeout, deadline)
+        last_exception = None
+        retries = 0
+        started = time.monotonic()
+
+        while True:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.allow(endpoint)
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(endpoint)
+
+            remaining = None if deadline is None else deadline - (time.monotonic() - started)
+            if remaining is not None and remaining <= 0:
+                if last_exception is None:
+                    raise TimeoutError(f"Deadline of {deadline}s exceeded before {method} {endpoint} was sent")
+                break
+
+            try:
+                response = await self.session.request(
+                    method, url, params=params, json=data, headers=request_headers,
+                    timeout=self._httpx_timeout(self._attempt_timeout(timeout, remaining)),
+                )
+                response.raise_for_status()
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(endpoint, True)
+                return self.decode_json(response.content) if response.content else {}
+
+            except Exception as e:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(endpoint, not self._is_outage(e))
+                last_exception = e
+                retries += 1
+
+                delay = self._next_delay(e, retries, endpoint, started, deadline)
+                if delay is None:
+                    break
+
+                await asyncio.sleep(delay)
+
+        if last_exception:
+            raise last_exception
+
+        raise Exception("Request failed but no exception was raised")
+
+    @staticmethod
+    def _httpx_timeout(timeout: Optional[Tuple[Optional[float], Optional[float]]]) -> "httpx.Timeout":
+        """Convert a (connect, read) timeout for httpx (write and pool waits use the read value)."""
+        if timeout is None:
+            return httpx.Timeout(None)
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], list]:
+        # get req
+        return await self.request("GET", endpoint, params=params)
+
+    async def post(self, endpoint: str, data: Dict[str, Any], params: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], list]:
+        # post req
+        return await self.request("POST", endpoint, params=params, data=data)
+
+    async def batch(self, calls: Sequence[BatchSpec], max_concurrency: int = 8) -> List[Any]:
+        """
+        Run many service calls as concurrent tasks.
+
+        See DexPaprikaClient.batch; calls run as tasks bounded by
+        ``max_concurrency`` and a failing call's exception is returned in
+        its place.
+
+        Returns:
+            One result (or exception) per call, in input order
+
+        Raises:
+            ValueError: If a call spec or max_concurrency is invalid
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        prepared = prepare_batch(self, calls)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(call):
+            fn, args, kwargs = call
+            async with semaphore:
+                try:
+                    result = fn(*args, **kwargs)
+                    if inspect.isawaitable(result):
+                        result = await result
+                    return result
+                except Exception as e:
+                    return e
+
+        return list(await asyncio.gather(*(run(call) for call in prepared)))
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool and stop the refresh workers."""
+        # don't block the loop on refreshes still running in worker threads
+        self._shutdown_refresher(wait=False)
+        # background revalidations would otherwise hit the closed session
+        tasks = [task for service in self._services for task in service._refresh_tasks]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.session.aclose()
+
+    def close(self) -> None:
+        raise TypeError("AsyncDexPaprikaClient is closed with 'await client.aclose()' or 'async with'")
+
+    def __enter__(self) -> "AsyncDexPaprikaClient":
+        raise TypeError("use 'async with AsyncDexPaprikaClient()' instead of 'with'")
+
+    async def __aenter__(self) -> "AsyncDexPaprikaClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
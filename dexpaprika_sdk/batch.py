@@ -0,0 +1,115 @@
+from typing import Any, Callable, Dict, Sequence, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import DexPaprikaClient
+
+
+class BatchCall:
+    """
+    One call in a client batch: a service method and its arguments.
+
+    The method is either a ``"service.method"`` name resolved on the client
+    running the batch (e.g. ``"pools.get_details"``) or any callable.
+
+    Example:
+        BatchCall("pools.get_details", "ethereum", "0x88e6...", inversed=True)
+    """
+
+    __slots__ = ("method", "args", "kwargs")
+
+    def __init__(self, method: Union[str, Callable[..., Any]], *args: Any, **kwargs: Any):
+        """
+        Initialize a new batch call.
+
+        Args:
+            method: "service.method" name or callable
+            *args: Positional arguments for the call
+            **kwargs: Keyword arguments for the call
+        """
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+
+    def resolve(self, client: "DexPaprikaClient") -> Callable[..., Any]:
+        """
+        Look up the method on a client.
+
+        Args:
+            client: Client whose services run the call
+
+        Returns:
+            The callable to invoke with ``args`` and ``kwargs``
+
+        Raises:
+            ValueError: If the method name is not a public service method
+        """
+        if callable(self.method):
+            return self.method
+
+        service_name, _, method_name = str(self.method).partition(".")
+        service = getattr(client, service_name, None)
+        if (
+            service not in client._services
+            or not method_name
+            or method_name.startswith("_")
+            or not callable(getattr(service, method_name, None))
+        ):
+            raise ValueError(
+                f"Unknown batch method {self.method!r}, expected 'service.method' "
+                "such as 'pools.get_details'"
+            )
+        return getattr(service, method_name)
+
+    def __repr__(self) -> str:
+        arguments = [repr(arg) for arg in self.args]
+        arguments += [f"{name}={value!r}" for name, value in self.kwargs.items()]
+        method = self.method if isinstance(self.method, str) else getattr(self.method, "__qualname__", self.method)
+        return f"BatchCall({method}({', '.join(arguments)}))"
+
+
+BatchSpec = Union[BatchCall, Tuple[Any, ...]]
+
+
+def as_batch_call(spec: BatchSpec) -> BatchCall:
+    """
+    Normalize a batch call spec.
+
+    Args:
+        spec: A BatchCall, or a tuple ``(method, args)`` or
+            ``(method, args, kwargs)``
+
+    Returns:
+        The spec as a BatchCall
+
+    Raises:
+        ValueError: If the spec has another shape
+    """
+    if isinstance(spec, BatchCall):
+        return spec
+    if isinstance(spec, tuple) and 2 <= len(spec) <= 3:
+        method, args = spec[0], spec[1]
+        kwargs: Dict[str, Any] = spec[2] if len(spec) == 3 else {}
+        if isinstance(args, (list, tuple)) and isinstance(kwargs, dict):
+            return BatchCall(method, *args, **kwargs)
+    raise ValueError(
+        f"Invalid batch call {spec!r}, expected a BatchCall or a "
+        "(method, args) / (method, args, kwargs) tuple"
+    )
+
+
+def prepare_batch(client: "DexPaprikaClient", calls: Sequence[BatchSpec]) -> list:
+    """
+    Resolve every call of a batch up front so a bad spec fails before any request.
+
+    Args:
+        client: Client running the batch
+        calls: Call specs
+
+    Returns:
+        A list of (callable, args, kwargs) tuples in input order
+    """
+    prepared = []
+    for spec in calls:
+        call = as_batch_call(spec)
+        prepared.append((call.resolve(client), call.args, call.kwargs))
+    return prepared
@@ -0,0 +1,273 @@
+import re
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Pattern, Tuple
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while its endpoint family's circuit is open."""
+
+    def __init__(self, family: str, retry_in: float):
+        """
+        Initialize a new circuit open error.
+
+        Args:
+            family: Endpoint family whose circuit is open
+            retry_in: Seconds until the circuit lets a probe request through
+        """
+        super().__init__(f"Circuit for {family!r} endpoints is open, retry in {retry_in:.1f}s")
+        self.family = family
+        self.retry_in = retry_in
+
+
+def _compile_family(pattern: str) -> Pattern[str]:
+    """Compile a family path glob: ``*`` matches within one path segment, ``**`` across segments."""
+    parts = (re.escape(part).replace(r"\*", "[^/]*") for part in pattern.split("**"))
+    return re.compile(".*".join(parts) + r"\Z")
+
+
+class _Circuit:
+    """Outcomes and state of one endpoint family."""
+
+    __slots__ = ("state", "outcomes", "failures", "opened_at", "probes", "probe_started")
+
+    def __init__(self):
+        self.state = CircuitBreaker.CLOSED
+        self.outcomes: Deque[Tuple[float, bool]] = deque()
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_started = 0.0
+
+
+class CircuitBreaker:
+    """
+    Per endpoint family circuit breaker.
+
+    Each family (e.g. all OHLCV endpoints) tracks the outcome of its
+    requests over a sliding ``window``. Once at least ``min_calls`` requests
+    were made and the share of failures reaches ``failure_rate``, the
+    circuit opens and requests fail fast with CircuitOpenError for
+    ``open_for`` seconds. It then half-opens: up to ``half_open_probes``
+    requests are let through, and the first probe's outcome closes the
+    circuit again or re-opens it. Other families are unaffected.
+
+    Only signs of an upstream outage count as failures (connection errors,
+    timeouts, 5xx); the client decides which exceptions those are.
+
+    Families are glob patterns matched against the request path, first
+    match wins; unmatched paths form a family per leading path segment.
+    ``*`` matches within a single path segment and ``**`` across segments,
+    so ``/networks/*/pools**`` does not claim ``/networks/x/tokens/y/pools``.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    DEFAULT_FAMILIES: Dict[str, str] = {
+        "ohlcv": "/networks/*/pools/*/ohlcv",
+        "transactions": "/networks/*/pools/*/transactions",
+        "pools": "/networks/*/pools**",
+        "tokens": "/networks/*/tokens**",
+        "dexes": "/networks/*/dexes**",
+        "networks": "/networks**",
+        "search": "/search**",
+        "stats": "/stats**",
+    }
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        window: float = 60.0,
+        open_for: float = 30.0,
+        half_open_probes: int = 1,
+        stale_for: Optional[float] = None,
+        families: Optional[Dict[str, str]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a new circuit breaker.
+
+        Args:
+            failure_rate: Share of failed requests (0-1] that opens a circuit
+            min_calls: Requests needed in the window before it can open
+            window: Seconds of outcomes considered
+            open_for: Seconds a circuit stays open before probing
+            half_open_probes: Concurrent probe requests while half-open
+            stale_for: Serve cached responses up to this many seconds past
+                their TTL while a circuit is open (None to fail instead)
+            families: Family name -> path glob (``*`` within a segment,
+                ``**`` across segments), tried in order (defaults to
+                DEFAULT_FAMILIES)
+            clock: Monotonic time source
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be greater than 0 and at most 1")
+        if min_calls < 1:
+            raise ValueError("min_calls must be at least 1")
+        if half_open_probes < 1:
+            raise ValueError("half_open_probes must be at least 1")
+
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.open_for = open_for
+        self.half_open_probes = half_open_probes
+        self.stale_for = stale_for
+        self.families = dict(self.DEFAULT_FAMILIES if families is None else families)
+        self._patterns: List[Tuple[str, Pattern[str]]] = [
+            (name, _compile_family(pattern)) for name, pattern in self.families.items()
+        ]
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+        self._family_of: Dict[str, str] = {}
+
+    def family(self, endpoint: str) -> str:
+        """
+        Get the family an endpoint belongs to.
+
+        Args:
+            endpoint: Request path
+
+        Returns:
+            The family name
+        """
+        family = self._family_of.get(endpoint)
+        if family is None:
+            family = next(
+                (name for name, pattern in self._patterns if pattern.match(endpoint)),
+                endpoint.strip("/").split("/", 1)[0],
+            )
+            if len(self._family_of) < 10000:
+                self._family_of[endpoint] = family
+        return family
+
+    def state(self, family: str) -> str:
+        """
+        Get the state of a family's circuit.
+
+        Args:
+            family: Family name (see family())
+
+        Returns:
+            CLOSED, OPEN or HALF_OPEN
+        """
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None:
+                return self.CLOSED
+            self._advance(circuit, self._clock())
+            return circuit.state
+
+    def allow(self, endpoint: str) -> None:
+        """
+        Check whether a request may be sent; call record() with its outcome.
+
+        Args:
+            endpoint: Request path
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open, or half-open
+                with all probe slots taken
+        """
+        family = self.family(endpoint)
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None:
+                return
+            now = self._clock()
+            self._advance(circuit, now)
+            if circuit.state == self.CLOSED:
+                return
+            if circuit.state == self.HALF_OPEN:
+                # probes that never reported back don't block probing forever
+                if circuit.probes and now - circuit.probe_started >= self.open_for:
+                    circuit.probes = 0
+                if circuit.probes < self.half_open_probes:
+                    if circuit.probes == 0:
+                        circuit.probe_started = now
+                    circuit.probes += 1
+                    return
+                retry_in = circuit.probe_started + self.open_for - now
+            else:
+                retry_in = circuit.opened_at + self.open_for - now
+            raise CircuitOpenError(family, max(0.0, retry_in))
+
+    def record(self, endpoint: str, success: bool) -> None:
+        """
+        Record the outcome of a request let through by allow().
+
+        Args:
+            endpoint: Request path
+            success: False if the request failed because of the upstream
+        """
+        family = self.family(endpoint)
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None:
+                circuit = self._circuits[family] = _Circuit()
+            now = self._clock()
+            self._advance(circuit, now)
+
+            if circuit.state == self.HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                if success:
+                    self._close(circuit)
+                else:
+                    self._open(circuit, now)
+                return
+            if circuit.state == self.OPEN:
+                # late result of a request sent before the circuit opened
+                return
+
+            circuit.outcomes.append((now, success))
+            if not success:
+                circuit.failures += 1
+            self._prune(circuit, now)
+            calls = len(circuit.outcomes)
+            if calls >= self.min_calls and circuit.failures >= self.failure_rate * calls:
+                self._open(circuit, now)
+
+    def reset(self, family: Optional[str] = None) -> None:
+        """
+        Close circuits and forget their outcomes.
+
+        Args:
+            family: Family to reset (None for all)
+        """
+        with self._lock:
+            if family is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(family, None)
+
+    def _advance(self, circuit: _Circuit, now: float) -> None:
+        # an open circuit half-opens once open_for has passed
+        if circuit.state == self.OPEN and now - circuit.opened_at >= self.open_for:
+            circuit.state = self.HALF_OPEN
+            circuit.probes = 0
+
+    def _prune(self, circuit: _Circuit, now: float) -> None:
+        while circuit.outcomes and now - circuit.outcomes[0][0] > self.window:
+            _, ok = circuit.outcomes.popleft()
+            if not ok:
+                circuit.failures -= 1
+
+    def _open(self, circuit: _Circuit, now: float) -> None:
+        circuit.state = self.OPEN
+        circuit.opened_at = now
+        circuit.outcomes.clear()
+        circuit.failures = 0
+
+    def _close(self, circuit: _Circuit) -> None:
+        circuit.state = self.CLOSED
+        circuit.outcomes.clear()
+        circuit.failures = 0
+        circuit.probes = 0
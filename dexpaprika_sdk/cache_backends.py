@@ -0,0 +1,284 @@
+import math
+import os
+import sqlite3
+import struct
+import threading
+import time
+from typing import Any, Iterable, NamedTuple, Optional, Protocol
+
+
+class StoredResponse(NamedTuple):
+    """A response body as kept by a CacheBackend, with wall-clock (Unix) timestamps."""
+
+    body: bytes
+    expires_at: float
+    revalidate_until: float
+    stale_until: float
+
+    def is_dead(self, now: Optional[float] = None) -> bool:
+        """Check if the response is past the point where it may be served stale."""
+        return (time.time() if now is None else now) > self.stale_until
+
+
+class CacheBackend:
+    """
+    Interface of shared response stores behind the in-process caches.
+
+    The client keeps recently used responses (and their parsed models)
+    in memory; a backend is a second, shared tier consulted on a memory
+    miss and written on every fetch, so processes using the same backend
+    fetch a response once between them and keep it across restarts.
+
+    Backends store opaque JSON bodies under string keys that start with
+    the endpoint path. Expiry times are absolute Unix timestamps, so an
+    entry expires at the same moment for every process, exactly as it
+    would have in the process that fetched it.
+
+    Backend errors never fail a request: the client treats them as misses
+    (or skips the write) and counts them in ``errors``.
+    """
+
+    errors = 0
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        """
+        Look up a response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The stored response, or None if missing or past its stale window
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, response: StoredResponse) -> None:
+        """
+        Store a response, replacing any previous one.
+
+        Args:
+            key: Cache key
+            response: Body and expiry times
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a response if present.
+
+        Args:
+            key: Cache key
+        """
+        raise NotImplementedError
+
+    def clear(self, prefix: Optional[str] = None) -> None:
+        """
+        Remove every response, or those of an endpoint and the endpoints under it.
+
+        Prefixes match whole path segments (see ResponseCache.clear_prefix):
+        a key matches if it is ``prefix`` or continues it with "/" or "?".
+
+        Args:
+            prefix: Endpoint path prefix, None for all
+        """
+        raise NotImplementedError
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    revalidate_until REAL NOT NULL,
+    stale_until REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Persistent response cache in a SQLite database, shareable by processes on one host.
+
+    The database runs in WAL mode, so any number of processes (e.g. the
+    workers of a web server) read concurrently while one writes, and
+    responses survive restarts. Each process opens its own connection,
+    also after a fork. Responses past their stale window are purged at
+    most once every ``purge_interval`` seconds while writing.
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 5.0, purge_interval: float = 60.0):
+        """
+        Open (or create) a cache database.
+
+        Args:
+            path: SQLite database file
+            busy_timeout: Seconds to wait for another process's write lock
+            purge_interval: Minimum seconds between sweeps of dead responses
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.purge_interval = purge_interval
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = 0
+        self._last_purge = time.monotonic()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # connections must not cross a fork; reopen in the child
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT body, expires_at, revalidate_until, stale_until FROM responses WHERE key = ?", (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        response = StoredResponse(bytes(row[0]), row[1], row[2], row[3])
+        return None if response.is_dead() else response
+
+    def set(self, key: str, response: StoredResponse) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, response.body, response.expires_at, response.revalidate_until, response.stale_until),
+            )
+            if time.monotonic() - self._last_purge >= self.purge_interval:
+                self._purge(conn)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self, prefix: Optional[str] = None) -> None:
+        prefix = (prefix or "").rstrip("/")
+        with self._lock:
+            if not prefix:
+                self._connection().execute("DELETE FROM responses")
+            else:
+                # primary key ranges, not a pattern match: the endpoint
+                # itself, "prefix/..." and "prefix?params"
+                self._connection().execute(
+                    "DELETE FROM responses WHERE key = ? OR (key >= ? AND key < ?) OR (key >= ? AND key < ?)",
+                    (prefix, prefix + "/", prefix + "0", prefix + "?", prefix + "@"),
+                )
+
+    def purge_expired(self) -> int:
+        """
+        Remove every response past its stale window.
+
+        Returns:
+            Number of responses removed
+        """
+        with self._lock:
+            return self._purge(self._connection())
+
+    def _purge(self, conn: sqlite3.Connection) -> int:
+        removed = conn.execute("DELETE FROM responses WHERE stale_until < ?", (time.time(),)).rowcount
+        self._last_purge = time.monotonic()
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        """Close this process's connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class KeyValueStore(Protocol):
+    """
+    The subset of a key-value client used by KeyValueCacheBackend.
+
+    redis-py's ``Redis`` (and compatible clients, such as valkey's)
+    satisfies it as is.
+    """
+
+    def get(self, name: str) -> Optional[bytes]: ...
+
+    def set(self, name: str, value: bytes, ex: Optional[int] = None) -> Any: ...
+
+    def delete(self, *names: str) -> Any: ...
+
+    def scan_iter(self, match: Optional[str] = None) -> Iterable[Any]: ...
+
+
+# expires_at, revalidate_until, stale_until ahead of the body
+_HEADER = struct.Struct("!ddd")
+
+
+class KeyValueCacheBackend(CacheBackend):
+    """
+    Response cache in a networked key-value store such as Redis.
+
+    Works with any client providing ``get``, ``set(name, value, ex=...)``,
+    ``delete`` and ``scan_iter(match=...)``. Keys are namespaced, and each
+    value expires in the store once its stale window has passed.
+
+    Example:
+        import redis
+        backend = KeyValueCacheBackend(redis.Redis(host="cache"), namespace="dexpaprika:")
+        client = DexPaprikaClient(cache_backend=backend)
+    """
+
+    def __init__(self, store: KeyValueStore, namespace: str = "dexpaprika:"):
+        """
+        Initialize a new key-value backend.
+
+        Args:
+            store: Key-value client
+            namespace: Prefix added to every key
+        """
+        self.store = store
+        self.namespace = namespace
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        value = self.store.get(self.namespace + key)
+        if value is None or len(value) < _HEADER.size:
+            return None
+        response = StoredResponse(bytes(value[_HEADER.size:]), *_HEADER.unpack_from(value))
+        return None if response.is_dead() else response
+
+    def set(self, key: str, response: StoredResponse) -> None:
+        ttl = math.ceil(response.stale_until - time.time())
+        if ttl <= 0:
+            return
+        value = _HEADER.pack(response.expires_at, response.revalidate_until, response.stale_until) + response.body
+        self.store.set(self.namespace + key, value, ex=ttl)
+
+    def delete(self, key: str) -> None:
+        self.store.delete(self.namespace + key)
+
+    def clear(self, prefix: Optional[str] = None) -> None:
+        prefix = (prefix or "").rstrip("/")
+        keys = []
+        for key in self.store.scan_iter(match=_glob_escape(self.namespace + prefix) + "*"):
+            name = (key.decode() if isinstance(key, bytes) else key)[len(self.namespace):]
+            # whole path segments only: the endpoint, "prefix/..." or "prefix?params"
+            if not prefix or name[len(prefix):len(prefix) + 1] in ("", "/", "?"):
+                keys.append(key)
+        if keys:
+            self.store.delete(*keys)
+
+
+def _glob_escape(text: str) -> str:
+    # escape Redis MATCH pattern characters
+    return "".join("\\" + char if char in "*?[]\\" else char for char in text)
@@ -0,0 +1,196 @@
+import sqlite3
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+from .models.pools import OHLCVRecord
+
+# (network_id, pool_address, interval, inversed)
+SeriesKey = Tuple[str, str, str, bool]
+Span = Tuple[int, int]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    network TEXT NOT NULL,
+    pool TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    inversed INTEGER NOT NULL,
+    open_ts INTEGER NOT NULL,
+    time_open TEXT NOT NULL,
+    time_close TEXT NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume INTEGER NOT NULL,
+    PRIMARY KEY (network, pool, interval, inversed, open_ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS synced (
+    network TEXT NOT NULL,
+    pool TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    inversed INTEGER NOT NULL,
+    start_ts INTEGER NOT NULL,
+    end_ts INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS synced_series ON synced (network, pool, interval, inversed);
+"""
+
+
+class CandleStore:
+    """
+    Append-only SQLite store of closed OHLCV candles.
+
+    Candles are keyed by network, pool, interval and price direction, and the
+    store also records which time spans have been synced from the API, so an
+    empty span (no trades) is not fetched again. Closed candles never change,
+    so once a span is synced only newer data has to be requested.
+
+    Pass a store (or a database path) as ``candle_store`` to
+    DexPaprikaClient and ``pools.get_ohlcv`` / ``pools.get_ohlcv_history``
+    will read from it first and fetch only the spans it is missing.
+
+    All timestamps are Unix seconds; spans are half-open ``[start, end)``
+    ranges of candle open times.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Open (or create) a candle store.
+
+        Args:
+            path: SQLite database file, or ":memory:" for a process-local store
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def missing(self, series: SeriesKey, start: int, end: int) -> List[Span]:
+        """
+        Get the parts of a span that have not been synced yet.
+
+        Args:
+            series: (network_id, pool_address, interval, inversed)
+            start: Span start (inclusive)
+            end: Span end (exclusive)
+
+        Returns:
+            Unsynced sub-spans in time order
+        """
+        gaps = []
+        cursor = start
+        for synced_start, synced_end in self._synced(series):
+            if synced_end <= cursor:
+                continue
+            if synced_start >= end:
+                break
+            if synced_start > cursor:
+                gaps.append((cursor, synced_start))
+            cursor = max(cursor, synced_end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def add(self, series: SeriesKey, records: Iterable[Tuple[int, OHLCVRecord]], start: int, end: int) -> None:
+        """
+        Store candles fetched for a span and mark the span as synced.
+
+        Only candles opening inside the span are stored; existing candles are
+        kept as they are.
+
+        Args:
+            series: (network_id, pool_address, interval, inversed)
+            records: (open timestamp, record) pairs
+            start: Span start (inclusive)
+            end: Span end (exclusive); every closed candle before it must be in records
+        """
+        network, pool, interval, inversed = series
+        rows = [
+            (network, pool, interval, int(inversed), open_ts, r.time_open, r.time_close,
+             r.open, r.high, r.low, r.close, r.volume)
+            for open_ts, r in records if start <= open_ts < end
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO candles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows,
+            )
+            if start < end:
+                self._mark_synced(series, start, end)
+
+    def get(self, series: SeriesKey, start: int, end: int, limit: Optional[int] = None) -> List[OHLCVRecord]:
+        """
+        Get stored candles opening within a span.
+
+        Args:
+            series: (network_id, pool_address, interval, inversed)
+            start: Span start (inclusive)
+            end: Span end (exclusive)
+            limit: Maximum number of candles
+
+        Returns:
+            Candles sorted by open time
+        """
+        network, pool, interval, inversed = series
+        query = (
+            "SELECT time_open, time_close, open, high, low, close, volume FROM candles "
+            "WHERE network = ? AND pool = ? AND interval = ? AND inversed = ? "
+            "AND open_ts >= ? AND open_ts < ? ORDER BY open_ts LIMIT ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(
+                query, (network, pool, interval, int(inversed), start, end, -1 if limit is None else limit),
+            ).fetchall()
+        return [
+            OHLCVRecord(time_open=row[0], time_close=row[1], open=row[2], high=row[3],
+                        low=row[4], close=row[5], volume=row[6])
+            for row in rows
+        ]
+
+    def clear(self, network_id: Optional[str] = None, pool_address: Optional[str] = None) -> None:
+        """
+        Delete stored candles and sync state.
+
+        Args:
+            network_id: Only clear this network (None for every network)
+            pool_address: Only clear this pool (requires network_id)
+        """
+        where, params = "", []
+        if network_id is not None:
+            where, params = " WHERE network = ?", [network_id]
+            if pool_address is not None:
+                where += " AND pool = ?"
+                params.append(pool_address)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM candles" + where, params)
+            self._conn.execute("DELETE FROM synced" + where, params)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _synced(self, series: SeriesKey) -> List[Span]:
+        network, pool, interval, inversed = series
+        with self._lock:
+            return self._conn.execute(
+                "SELECT start_ts, end_ts FROM synced WHERE network = ? AND pool = ? AND interval = ? "
+                "AND inversed = ? ORDER BY start_ts",
+                (network, pool, interval, int(inversed)),
+            ).fetchall()
+
+    def _mark_synced(self, series: SeriesKey, start: int, end: int) -> None:
+        # replace the spans the new one overlaps or touches with their union
+        network, pool, interval, inversed = series
+        where = (
+            " FROM synced WHERE network = ? AND pool = ? AND interval = ? "
+            "AND inversed = ? AND start_ts <= ? AND end_ts >= ?"
+        )
+        params = (network, pool, interval, int(inversed), end, start)
+        for synced_start, synced_end in self._conn.execute("SELECT start_ts, end_ts" + where, params).fetchall():
+            start, end = min(start, synced_start), max(end, synced_end)
+        self._conn.execute("DELETE" + where, params)
+        self._conn.execute(
+            "INSERT INTO synced VALUES (?, ?, ?, ?, ?, ?)",
+            (network, pool, interval, int(inversed), start, end),
+        )
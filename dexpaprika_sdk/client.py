@@ -1,7 +1,14 @@
 import requests
+import threading
 import time
 import random
-from typing import Optional, Dict, Any, Union, List
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, Iterator, Union, List, Sequence, Tuple
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, HTTPError, ConnectionError, Timeout
 
 from .api.networks import NetworksAPI
@@ -10,25 +17,143 @@ from .api.tokens import TokensAPI
 from .api.search import SearchAPI
 from .api.utils import UtilsAPI
 from .api.dexes import DexesAPI
+from .api.cache import ResponseCache, SingleFlight
+from .batch import BatchSpec, prepare_batch
+from .breaker import CircuitBreaker, CircuitOpenError
+from .cache_backends import CacheBackend, SQLiteCacheBackend
+from .candle_store import CandleStore
+from .ratelimit import RateLimiter
+from .utils.decoding import JSONDecoder, get_decoder
+
+# seconds for both phases, or (connect, read); None disables a timeout
+TimeoutSpec = Optional[Union[float, Tuple[Optional[float], Optional[float]]]]
 
 
 class DexPaprikaClient:
     # client for api
 
+    VALID_VALIDATION_MODES = {"full", "trusted", "none"}
+
     def __init__(
         self,
         base_url: str = "https://api.dexpaprika.com",
         session: Optional[requests.Session] = None,
         user_agent: str = "DexPaprika-SDK-Python/0.4.0",
-        max_retries: int = 4,
+        max_retries: Optional[int] = 4,
         backoff_times: List[float] = None,
+        deadline: Optional[float] = None,
+        timeout: TimeoutSpec = (10.0, 30.0),
+        max_connections: int = 100,
+        cache_max_entries: Optional[int] = 10000,
+        cache_max_bytes: Optional[int] = None,
+        candle_store: Optional[Union[str, CandleStore]] = None,
+        json_decoder: Union[str, JSONDecoder] = "auto",
+        validation: str = "full",
+        cache_models: bool = True,
+        rate_limit: Optional[Union[float, RateLimiter]] = None,
+        circuit_breaker: Optional[Union[bool, CircuitBreaker]] = None,
+        serve_stale: bool = True,
+        cache_backend: Optional[Union[str, CacheBackend]] = None,
+        not_found_ttl: Optional[float] = 60.0,
     ):
+        if validation not in self.VALID_VALIDATION_MODES:
+            raise ValueError(
+                f"validation must be one of: {', '.join(sorted(self.VALID_VALIDATION_MODES))}"
+            )
+
         self.base_url = base_url.rstrip("/")
-        self.session = session or requests.Session()
+        self.max_connections = max_connections
+        self.session = session or self._create_session()
         self.user_agent = user_agent
         self.max_retries = max_retries
         self.backoff_times = backoff_times or [0.1, 0.5, 1.0, 5.0]  # 100ms, 500ms, 1s, 5s
+        
+        # seconds a call may spend across all attempts and retry waits;
+        # with max_retries=None retries are bounded by the deadline alone
+        if max_retries is None and deadline is None:
+            raise ValueError("max_retries=None requires a deadline")
+        self.deadline = deadline
+        
+        # connect/read timeout of each attempt, cut to what is left of the deadline
+        self.timeout = timeout
+        # per-call overrides, see call_options
+        self._call_options: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+            f"dexpaprika_call_options_{id(self)}", default=None
+        )
+        
+        # response cache limits (None disables a limit)
+        self.cache_max_entries = cache_max_entries
+        self.cache_max_bytes = cache_max_bytes
+        # one response cache for all services, keyed by path and params:
+        # endpoints reachable from several services are fetched once
+        self._cache = ResponseCache(max_entries=cache_max_entries, max_bytes=cache_max_bytes)
+        # concurrent misses on the same key share one request
+        self._inflight = self._create_inflight()
+
+        # persistent store for closed OHLCV candles (path or CandleStore)
+        if isinstance(candle_store, str):
+            candle_store = CandleStore(candle_store)
+        self.candle_store = candle_store
+
+        # response body decoder (orjson/msgspec when installed)
+        self.decode_json = get_decoder(json_decoder)
+
+        # "full" validates responses, "trusted" builds models without
+        # validation, "none" returns the decoded JSON as-is
+        self.validation = validation
+
+        # keep parsed models with cached responses so cache hits skip
+        # parsing; callers get shallow copies whose nested models are
+        # shared and must be treated as read-only
+        self.cache_models = cache_models
+
+        # proactive throttling: requests per second, or a (shareable)
+        # RateLimiter with per-endpoint budgets
+        if rate_limit is not None and not isinstance(rate_limit, RateLimiter):
+            rate_limit = RateLimiter(rate_limit)
+        self.rate_limiter = rate_limit
+
+        # fail fast on endpoint families with an upstream outage
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        self.circuit_breaker = circuit_breaker or None
+
+        # serve expired responses within their stale windows: while they
+        # are refreshed in the background, or when the upstream fails
+        self.serve_stale = serve_stale
+        self._refresher: Optional[ThreadPoolExecutor] = None
+        self._refresher_lock = threading.Lock()
+
+        # shared second cache tier (SQLite path or CacheBackend), consulted
+        # on in-memory misses and written on every fetch
+        if isinstance(cache_backend, str):
+            cache_backend = SQLiteCacheBackend(cache_backend)
+        self.cache_backend = cache_backend
+
+        # seconds a 404 is cached, so lookups of missing tokens and pools
+        # aren't repeated against the API (None or 0 to disable)
+        self.not_found_ttl = not_found_ttl
+
+        self._create_services()
 
+    def _create_session(self) -> requests.Session:
+        # default http session, shared by every thread using this client;
+        # urllib3 keeps up to max_connections pooled connections per host
+        # so concurrent workers don't queue for (or reopen) connections
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.max_connections,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _create_inflight(self) -> SingleFlight:
+        # request coalescer for cache misses
+        return SingleFlight()
+
+    def _create_services(self) -> None:
         # services
         self.networks = NetworksAPI(self)
         self.pools = PoolsAPI(self)
@@ -37,6 +162,12 @@ class DexPaprikaClient:
         self.utils = UtilsAPI(self)
         self.dexes = DexesAPI(self)
 
+    _service_names = ("networks", "pools", "tokens", "search", "utils", "dexes")
+
+    @property
+    def _services(self) -> list:
+        return [getattr(self, name) for name in self._service_names]
+
     def _should_retry(self, exception: Exception) -> bool:
         """
         Determine if a request should be retried based on the exception.
@@ -51,10 +182,207 @@ class DexPaprikaClient:
             # Always retry connection errors and timeouts
             return True
         elif isinstance(exception, HTTPError):
-            # Retry server errors (5xx) but not client errors (4xx)
-            return 500 <= exception.response.status_code < 600
+            # Retry throttling (429) and server errors (5xx), not other client errors
+            status = exception.response.status_code
+            return status == 429 or 500 <= status < 600
         return False
 
+    def _is_outage(self, exception: Exception) -> bool:
+        """
+        Determine if a failure counts against the endpoint's circuit breaker.
+        
+        Args:
+            exception: The exception that was raised
+            
+        Returns:
+            True for connection errors, timeouts and 5xx; throttling (429) and
+            other client errors say nothing about the upstream's health
+        """
+        status = getattr(getattr(exception, "response", None), "status_code", None)
+        return status != 429 and self._should_retry(exception)
+
+    def _is_upstream_failure(self, exception: Exception) -> bool:
+        """
+        Determine if a failed request may be answered with a stale cached response.
+        
+        Args:
+            exception: The exception that was raised
+            
+        Returns:
+            True when the upstream could not answer: retryable failures
+            (connection errors, timeouts, 429, 5xx), an exhausted deadline
+            or an open circuit
+        """
+        return isinstance(exception, (CircuitOpenError, TimeoutError)) or self._should_retry(exception)
+
+    @staticmethod
+    def _is_not_found(exception: Exception) -> bool:
+        """
+        Determine if a request failed because the API has nothing at the path.
+        
+        Args:
+            exception: The exception that was raised
+            
+        Returns:
+            True for HTTP 404 responses, from either transport
+        """
+        return getattr(getattr(exception, "response", None), "status_code", None) == 404
+
+    @staticmethod
+    def _retry_after(exception: Exception) -> Optional[float]:
+        """
+        Read the Retry-After header of a failed response.
+        
+        Args:
+            exception: The exception that was raised
+            
+        Returns:
+            Seconds to wait, or None if the header is missing or malformed
+        """
+        response = getattr(exception, "response", None)
+        headers = getattr(response, "headers", None)
+        value = headers.get("Retry-After") if headers is not None else None
+        if not isinstance(value, str):
+            return None
+        try:
+            # delay-seconds
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            # HTTP-date
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def _next_delay(
+        self,
+        exception: Exception,
+        retries: int,
+        endpoint: str,
+        started: float,
+        deadline: Optional[float],
+    ) -> Optional[float]:
+        """
+        Decide whether and after how long a failed attempt is retried.
+        
+        The backoff is truncated to half of the time left before the
+        deadline, so the retry still has time to run. The server's
+        Retry-After is never cut short: if it would overrun the deadline
+        the call gives up instead. Retry-After also pauses the shared rate
+        limiter, so other requests hold off too.
+        
+        Args:
+            exception: The exception that was raised
+            retries: Number of attempts made so far (1 for the first retry)
+            endpoint: Request path
+            started: time.monotonic() when the call started
+            deadline: Seconds the call may take in total (None for no limit)
+            
+        Returns:
+            Sleep time in seconds, or None to give up
+        """
+        if not self._should_retry(exception):
+            return None
+        if self.max_retries is not None and retries > self.max_retries:
+            return None
+        
+        delay = self._backoff_delay(retries)
+        retry_after = self._retry_after(exception)
+        if retry_after is not None and self.rate_limiter is not None:
+            self.rate_limiter.pause(endpoint, max(delay, retry_after))
+        
+        if deadline is not None:
+            remaining = deadline - (time.monotonic() - started)
+            delay = min(delay, remaining / 2)
+            if retry_after is not None and retry_after >= remaining or remaining <= 0:
+                return None
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _request_settings(self, timeout: TimeoutSpec, deadline: Optional[float]) -> Tuple[TimeoutSpec, Optional[float]]:
+        """Resolve a call's timeout and deadline: arguments, then call_options, then client defaults."""
+        options = self._call_options.get() or {}
+        if timeout is None:
+            timeout = options.get("timeout", self.timeout)
+        if deadline is None:
+            deadline = options.get("deadline", self.deadline)
+        return timeout, deadline
+
+    @staticmethod
+    def _attempt_timeout(
+        timeout: TimeoutSpec,
+        remaining: Optional[float],
+    ) -> Optional[Tuple[Optional[float], Optional[float]]]:
+        """
+        Compute the (connect, read) timeout of one attempt.
+        
+        Args:
+            timeout: Configured timeout
+            remaining: Seconds left before the deadline (None for no deadline)
+            
+        Returns:
+            A (connect, read) tuple, or None for no timeout at all
+        """
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        if remaining is not None:
+            connect = remaining if connect is None else min(connect, remaining)
+            read = remaining if read is None else min(read, remaining)
+        if connect is None and read is None:
+            return None
+        return connect, read
+
+    @contextmanager
+    def call_options(self, timeout: TimeoutSpec = None, deadline: Optional[float] = None) -> Iterator[None]:
+        """
+        Override the timeout and deadline of requests made inside a block.
+        
+        Applies to requests this client makes from the current thread or
+        asyncio task (including batches started there), e.g. through
+        service methods that take no such arguments. The deadline bounds
+        each request, retries included.
+        
+        Args:
+            timeout: Seconds, or (connect, read), for each attempt
+            deadline: Seconds each request may take across all retries
+        
+        Example:
+            with client.call_options(timeout=(2, 5), deadline=10):
+                details = client.pools.get_details("ethereum", pool_address)
+        """
+        options = dict(self._call_options.get() or {})
+        if timeout is not None:
+            options["timeout"] = timeout
+        if deadline is not None:
+            options["deadline"] = deadline
+        token = self._call_options.set(options)
+        try:
+            yield
+        finally:
+            self._call_options.reset(token)
+
+    def _backoff_delay(self, retries: int) -> float:
+        """
+        Compute how long to sleep before the given retry attempt.
+        
+        Args:
+            retries: Number of attempts made so far (1 for the first retry)
+            
+        Returns:
+            Sleep time in seconds, never negative
+        """
+        # Get backoff time (use the last one if we've exhausted the list)
+        backoff_index = min(retries - 1, len(self.backoff_times) - 1)
+        backoff_time = self.backoff_times[backoff_index]
+        
+        # Add some jitter (±10% of the backoff time)
+        jitter = random.uniform(-0.1 * backoff_time, 0.1 * backoff_time)
+        return max(0, backoff_time + jitter)
+
     def request(
         self,
         method: str,
@@ -62,6 +390,8 @@ class DexPaprikaClient:
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        timeout: TimeoutSpec = None,
+        deadline: Optional[float] = None,
     ) -> Union[Dict[str, Any], list]:
         # make request to api
         url = f"{self.base_url}{endpoint}"
@@ -70,39 +400,54 @@ class DexPaprikaClient:
         request_headers = {"User-Agent": self.user_agent}
         if headers: request_headers.update(headers)
 
+        timeout, deadline = self._request_settings(timeout, deadline)
         last_exception = None
         retries = 0
+        started = time.monotonic()
         
-        while retries <= self.max_retries:
+        while True:
+            # fail fast while the endpoint's circuit is open
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.allow(endpoint)
+
+            # wait for a slot under the rate limit (every attempt counts)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint)
+
+            remaining = None if deadline is None else deadline - (time.monotonic() - started)
+            if remaining is not None and remaining <= 0:
+                # the wait used up the budget; report the last failure, if any
+                if last_exception is None:
+                    raise TimeoutError(f"Deadline of {deadline}s exceeded before {method} {endpoint} was sent")
+                break
+
             try:
                 # req
                 response = self.session.request(
                     method=method, url=url, params=params, json=data, headers=request_headers,
+                    timeout=self._attempt_timeout(timeout, remaining),
                 )
 
                 # err check
                 response.raise_for_status()
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(endpoint, True)
 
                 # return data
-                return response.json() if response.content else {}
+                return self.decode_json(response.content) if response.content else {}
                 
             except Exception as e:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(endpoint, not self._is_outage(e))
                 last_exception = e
                 retries += 1
                 
-                if retries > self.max_retries or not self._should_retry(e):
+                delay = self._next_delay(e, retries, endpoint, started, deadline)
+                if delay is None:
                     break
                 
-                # Get backoff time (use the last one if we've exhausted the list)
-                backoff_index = min(retries - 1, len(self.backoff_times) - 1)
-                backoff_time = self.backoff_times[backoff_index]
-                
-                # Add some jitter (±10% of the backoff time)
-                jitter = random.uniform(-0.1 * backoff_time, 0.1 * backoff_time)
-                sleep_time = backoff_time + jitter
-                
                 # Sleep before retrying
-                time.sleep(max(0, sleep_time))
+                time.sleep(delay)
         
         # If we get here, all retries failed
         if last_exception:
@@ -119,12 +464,120 @@ class DexPaprikaClient:
         # post req
         return self.request("POST", endpoint, params=params, data=data)
         
+    def batch(self, calls: Sequence[BatchSpec], max_concurrency: int = 8) -> List[Any]:
+        """
+        Run many service calls concurrently over this client's session and caches.
+        
+        Calls go through the normal request path, so they share the cache,
+        coalesce identical requests and are retried like any other call.
+        A failing call does not fail the batch: its exception is returned
+        in its place.
+        
+        Args:
+            calls: BatchCall objects, or (method, args) / (method, args, kwargs)
+                tuples, where method is a "service.method" name such as
+                "pools.get_details" or a callable
+            max_concurrency: Maximum number of calls in flight at once
+            
+        Returns:
+            One result (or exception) per call, in input order
+            
+        Raises:
+            ValueError: If a call spec or max_concurrency is invalid
+        
+        Example:
+            results = client.batch(
+                [BatchCall("pools.get_details", "ethereum", pool) for pool in pools]
+                + [BatchCall("tokens.get_details", "ethereum", token) for token in tokens]
+            )
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        prepared = prepare_batch(self, calls)
+        
+        def run(call):
+            fn, args, kwargs = call
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                return e
+        
+        if max_concurrency == 1 or len(prepared) <= 1:
+            return [run(call) for call in prepared]
+        # workers see the caller's call_options
+        context = copy_context()
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(prepared))) as executor:
+            return list(executor.map(lambda call: context.copy().run(run, call), prepared))
+    
+    def _submit_refresh(self, refresh: Callable[[], None]) -> None:
+        """
+        Run a background cache refresh (stale-while-revalidate).
+        
+        Refreshes run on a small worker pool created on first use, with the
+        client's default timeout and deadline rather than the caller's.
+        
+        Args:
+            refresh: Function refetching a stale response
+        """
+        with self._refresher_lock:
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dexpaprika-refresh")
+        self._refresher.submit(refresh)
+    
+    def _shutdown_refresher(self, wait: bool) -> None:
+        """Stop the background refresh workers, if any were started."""
+        with self._refresher_lock:
+            refresher, self._refresher = self._refresher, None
+        if refresher is not None:
+            refresher.shutdown(wait=wait)
+    
+    def close(self) -> None:
+        """Close the HTTP session and stop the background refresh workers."""
+        # let running refreshes finish so they don't write after close
+        self._shutdown_refresher(wait=True)
+        self.session.close()
+    
+    def __enter__(self) -> "DexPaprikaClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def clear_cache(self, endpoint_prefix: Optional[str] = None) -> None:
         """
-        Clear the cache for all API services.
+        Clear the response cache, optionally only for endpoints with a specific prefix.
+        
+        Prefixes match whole path segments, so "/networks/ethereum" clears
+        "/networks/ethereum/pools" but not "/networks/ethereum-classic".
+        Also clears the cache backend, for every process sharing it.
         
         Args:
             endpoint_prefix: Optional prefix to filter which cache entries to clear
         """
-        for service in [self.networks, self.pools, self.tokens, self.search, self.utils, self.dexes]:
-            service.clear_cache(endpoint_prefix) 
\ No newline at end of file
+        if endpoint_prefix:
+            # removes only the indexed entries under the prefix
+            self._cache.clear_prefix(endpoint_prefix)
+        else:
+            self._cache.clear()
+        
+        backend = self.cache_backend
+        if backend is not None:
+            try:
+                backend.clear(endpoint_prefix)
+            except Exception:
+                backend.errors += 1
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get the size of the response cache and each service's hit counts.
+        
+        Returns:
+            A dict with the cache's entries, bytes and evictions, and under
+            "services" the hits, stale_hits and misses of each service
+        """
+        return {
+            "entries": len(self._cache),
+            "bytes": self._cache.total_bytes,
+            "evictions": self._cache.evictions,
+            "services": {name: getattr(self, name).cache_stats.snapshot() for name in self._service_names},
+        }
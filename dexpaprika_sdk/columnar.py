@@ -0,0 +1,107 @@
+"""
+Columnar NumPy views of OHLCV and transaction data.
+
+These helpers turn API rows (decoded JSON dicts, or the equivalent models)
+into one array per field without building a model per row, which keeps
+large histories compact and ready for vectorized analysis or
+``pandas.DataFrame(columns)``.
+
+Requires the ``numpy`` extra: ``pip install dexpaprika-sdk[numpy]``.
+"""
+
+from typing import Any, Dict, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+OHLCV_FLOAT_FIELDS = ("open", "high", "low", "close")
+TRANSACTION_INT_FIELDS = ("log_index", "transaction_index", "created_at_block_number")
+TRANSACTION_FLOAT_FIELDS = ("amount_0", "amount_1")
+TRANSACTION_STR_FIELDS = ("id", "pool_id", "sender", "recipient", "token_0", "token_1")
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "Columnar output requires numpy. "
+            "Install it with: pip install dexpaprika-sdk[numpy]"
+        )
+
+
+def _field(row: Any, name: str) -> Any:
+    # rows may be decoded JSON dicts or models
+    return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+def _column(rows: Sequence[Any], name: str, dtype: Any) -> "np.ndarray":
+    return np.fromiter((_field(row, name) for row in rows), dtype=dtype, count=len(rows))
+
+
+def _utc(value: str) -> str:
+    # numpy datetime64 has no timezone, so drop the UTC designator
+    if value.endswith("Z"):
+        return value[:-1]
+    if value.endswith("+00:00"):
+        return value[:-6]
+    return value
+
+
+def _times(rows: Sequence[Any], name: str) -> "np.ndarray":
+    return np.array([_utc(_field(row, name)) for row in rows], dtype="datetime64[ms]").astype("datetime64[s]")
+
+
+def ohlcv_arrays(rows: Sequence[Any]) -> Dict[str, "np.ndarray"]:
+    """
+    Convert OHLCV rows into columnar arrays.
+
+    Args:
+        rows: OHLCV rows as decoded JSON dicts or OHLCVRecord models
+
+    Returns:
+        Dict with ``time_open``/``time_close`` (datetime64[s], UTC),
+        ``open``/``high``/``low``/``close`` (float64) and ``volume`` (int64)
+
+    Raises:
+        ImportError: If numpy is not installed
+    """
+    _require_numpy()
+    columns = {
+        "time_open": _times(rows, "time_open"),
+        "time_close": _times(rows, "time_close"),
+    }
+    for name in OHLCV_FLOAT_FIELDS:
+        columns[name] = _column(rows, name, np.float64)
+    columns["volume"] = _column(rows, "volume", np.int64)
+    return columns
+
+
+def transaction_arrays(rows: Sequence[Any]) -> Dict[str, "np.ndarray"]:
+    """
+    Convert transaction rows into columnar arrays.
+
+    Amounts are converted to float64, so very large raw token amounts lose
+    precision beyond ~15 significant digits.
+
+    Args:
+        rows: Transaction rows as decoded JSON dicts or Transaction models
+
+    Returns:
+        Dict with ``log_index``/``transaction_index``/``created_at_block_number``
+        (int64), ``amount_0``/``amount_1`` (float64) and the string fields
+        (``id``, ``pool_id``, ``sender``, ``recipient``, ``token_0``, ``token_1``)
+        as object arrays
+
+    Raises:
+        ImportError: If numpy is not installed
+    """
+    _require_numpy()
+    columns = {}
+    for name in TRANSACTION_STR_FIELDS:
+        columns[name] = _column(rows, name, object)
+    for name in TRANSACTION_INT_FIELDS:
+        columns[name] = _column(rows, name, np.int64)
+    for name in TRANSACTION_FLOAT_FIELDS:
+        columns[name] = _column(rows, name, np.float64)
+    return columns
@@ -0,0 +1,51 @@
+from typing import Any
+
+from requests.exceptions import HTTPError
+
+try:
+    from httpx import HTTPStatusError
+except ImportError:  # pragma: no cover - optional dependency
+    # no async client without httpx, so AsyncNotFoundError is never raised
+    HTTPStatusError = HTTPError
+
+
+class NotFoundError(HTTPError):
+    """
+    Raised when a token or pool lookup finds nothing at the address (HTTP 404).
+
+    Subclasses requests' HTTPError, so existing ``except HTTPError``
+    handlers keep catching it. ``response`` is the 404 response and
+    ``__cause__`` the original error. The async client raises
+    AsyncNotFoundError, which is also an ``httpx.HTTPStatusError``.
+    Missing addresses are remembered for the client's ``not_found_ttl``,
+    so repeating a lookup within it raises again without a request.
+    """
+
+    def __init__(self, resource: str, network_id: str, address: str, response: Any = None, request: Any = None):
+        """
+        Initialize a new not found error.
+
+        Args:
+            resource: Kind of resource looked up ("token" or "pool")
+            network_id: Network ID of the lookup
+            address: Address that was not found
+            response: The 404 response
+            request: The request that got it
+        """
+        super().__init__(f"{resource.capitalize()} {address!r} not found on network {network_id!r}", request=request)
+        # not passed to requests' constructor, which reads response.request:
+        # httpx responses raise on that when built without a request
+        self.response = response
+        self.resource = resource
+        self.network_id = network_id
+        self.address = address
+
+
+class AsyncNotFoundError(NotFoundError, HTTPStatusError):
+    """
+    NotFoundError raised by the async client.
+
+    Also subclasses ``httpx.HTTPStatusError``, so ``except
+    httpx.HTTPStatusError`` handlers written for the async client keep
+    catching 404s. ``response`` and ``request`` are httpx objects.
+    """
@@ -2,12 +2,14 @@ from .base import PageInfo, PaginatedResponse
 from .networks import Network, Dex, DexesResponse
 from .pools import (
     Token, Pool, PoolsResponse, TimeIntervalMetrics,
-    PoolDetails, OHLCVRecord, Transaction, TransactionsResponse,
+    PoolDetails, OHLCVRecord, OHLCVGap, OHLCVWindowError, OHLCVHistoryResponse,
+    Transaction, TransactionsResponse,
     FilteredPool, PoolFilterResponse,
 )
 from .tokens import (
     TokenSummary, TokenDetails, TopTokenTimeMetrics, TopToken,
     TopTokensResponse, FilteredToken, TokenFilterResponse, TokenPrice,
+    PriceChunkError, BulkPricesResponse,
 )
 from .search import DexInfo, SearchResult
 from .utils import Stats
@@ -21,13 +23,15 @@ __all__ = [
 
     # Pools
     "Token", "Pool", "PoolsResponse", "TimeIntervalMetrics",
-    "PoolDetails", "OHLCVRecord", "Transaction", "TransactionsResponse",
+    "PoolDetails", "OHLCVRecord", "OHLCVGap", "OHLCVWindowError", "OHLCVHistoryResponse",
+    "Transaction", "TransactionsResponse",
     "FilteredPool", "PoolFilterResponse",
 
     # Tokens
     "TokenSummary", "TokenDetails",
     "TopTokenTimeMetrics", "TopToken", "TopTokensResponse",
     "FilteredToken", "TokenFilterResponse", "TokenPrice",
+    "PriceChunkError", "BulkPricesResponse",
 
     # Search
     "DexInfo", "SearchResult",
@@ -1,7 +1,8 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any, Generic, TypeVar
+from typing import Optional, List, Dict, Any, Callable, Generic, Type, TypeVar, Union, get_args, get_origin
 
 T = TypeVar('T')
+M = TypeVar('M', bound=BaseModel)
 
 class PageInfo(BaseModel):
     """Page information for paginated results."""
@@ -15,4 +16,137 @@ class PageInfo(BaseModel):
 class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response."""
     
-    page_info: PageInfo = Field(..., description="Pagination information") 
\ No newline at end of file
+    page_info: PageInfo = Field(..., description="Pagination information") 
+
+
+# per-model constructors built by _builder, keyed by model class
+_BUILDERS: Dict[type, Callable[[Dict[str, Any]], Any]] = {}
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str, tuple, frozenset)
+# BaseModel's slot setters, called directly: cheaper than object.__setattr__ by name
+_set_dict = BaseModel.__dict__["__dict__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+def _converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Build a function turning raw values of ``annotation`` into models, or None if nothing to convert."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        model = annotation
+
+        def convert(value: Any) -> Any:
+            return _get_builder(model)(value) if isinstance(value, dict) else value
+        return convert
+
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin in (list, List) and args:
+        if isinstance(args[0], type) and issubclass(args[0], BaseModel):
+            # the hot case (pages of models): look the item builder up once per list
+            model = args[0]
+
+            def convert_list(value: Any) -> Any:
+                if not isinstance(value, list):
+                    return value
+                build = _get_builder(model)
+                return [build(v) if isinstance(v, dict) else v for v in value]
+            return convert_list
+        item = _converter(args[0])
+        if item is not None:
+            return lambda value: [item(v) for v in value] if isinstance(value, list) else value
+    elif origin in (dict, Dict) and len(args) == 2:
+        item = _converter(args[1])
+        if item is not None:
+            return lambda value: {k: item(v) for k, v in value.items()} if isinstance(value, dict) else value
+    elif origin is Union:
+        # Optional[Model] and friends: convert with the first arm that needs it
+        for arg in args:
+            converter = _converter(arg)
+            if converter is not None:
+                return converter
+    return None
+
+
+def _builder(model: type) -> Callable[[Dict[str, Any]], Any]:
+    """Build the constructor construct_model uses for ``model``."""
+    aliases = []
+    converters = []
+    defaults = {}
+    fresh = []
+    for name, field in model.model_fields.items():
+        if field.alias and field.alias != name:
+            aliases.append((field.alias, name))
+        converter = _converter(field.annotation)
+        if converter is not None:
+            converters.append((name, converter))
+        if field.default_factory is None and isinstance(field.default, _IMMUTABLE_DEFAULTS):
+            defaults[name] = field.default
+        else:
+            # mutable defaults and factories need a fresh value per instance;
+            # required fields keep their position and are filled from data
+            defaults[name] = None
+            if not field.is_required():
+                fresh.append((name, field))
+    names = defaults.keys()
+    size = len(defaults)
+
+    def build(data: Dict[str, Any]) -> Any:
+        # merge whole dicts rather than walking keys in Python
+        values = {**defaults, **data}
+        fields_set = set(data)
+        # defaults hold every field, so any other size means aliased or unknown keys
+        if len(values) != size:
+            for alias, name in aliases:
+                if alias in values:
+                    values[name] = values.pop(alias)
+                    fields_set.discard(alias)
+                    fields_set.add(name)
+            if len(values) != size:
+                unknown = values.keys() - names
+                for key in unknown:
+                    del values[key]
+                fields_set -= unknown
+        for name, converter in converters:
+            value = values[name]
+            if value is not None:
+                values[name] = converter(value)
+        for name, field in fresh:
+            if name not in fields_set:
+                values[name] = field.get_default(call_default_factory=True)
+
+        # what model_construct does, minus its per-call bookkeeping
+        instance = object.__new__(model)
+        _set_dict(instance, values)
+        _set_fields_set(instance, fields_set)
+        _set_extra(instance, None)
+        _set_private(instance, None)
+        return instance
+
+    return build
+
+
+def _get_builder(model: type) -> Callable[[Dict[str, Any]], Any]:
+    """Return the cached constructor for ``model``, building it on first use."""
+    build = _BUILDERS.get(model)
+    if build is None:
+        # built lazily so self-referencing models don't recurse here
+        build = _BUILDERS[model] = _builder(model)
+    return build
+
+
+def construct_model(model: Type[M], data: Dict[str, Any]) -> M:
+    """
+    Build a model from trusted data without validation.
+
+    Like ``model.model_construct`` but recursive: nested models, lists and
+    dicts of models are constructed too, and fields are read by alias (e.g.
+    ``"24h"`` for ``day``) or by name. Values are not coerced or checked, so
+    only use this for payloads known to match the models.
+
+    Args:
+        model: Model class to build
+        data: Decoded response data
+
+    Returns:
+        An instance of ``model``
+    """
+    return _get_builder(model)(data)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict, Field
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Union
 
 from .base import PaginatedResponse
 
@@ -100,6 +100,32 @@ class OHLCVRecord(BaseModel):
     volume: int = Field(...)
 
 
+class OHLCVGap(BaseModel):
+    """A span of an OHLCV history with no candles."""
+
+    time_start: str = Field(..., description="Open time of the first missing candle")
+    time_end: str = Field(..., description="End of the gap (open time of the next candle, or the range end)")
+    missing: int = Field(..., description="Number of missing candles")
+
+
+class OHLCVWindowError(BaseModel):
+    """A window of an OHLCV history whose request failed."""
+
+    start: str = Field(..., description="Window start")
+    end: str = Field(..., description="Window end")
+    error: Exception = Field(..., description="Exception raised for the window")
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class OHLCVHistoryResponse(BaseModel):
+    """Stitched result of a split OHLCV history lookup."""
+
+    records: List[OHLCVRecord] = Field([], description="Candles sorted by time_open, one per open time")
+    gaps: List[OHLCVGap] = Field([], description="Spans of the range with no candles")
+    errors: List[OHLCVWindowError] = Field([], description="Windows that failed")
+
+
 class Transaction(BaseModel):
     # tx info
     
@@ -1,8 +1,8 @@
 from pydantic import BaseModel, ConfigDict, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional
 
 from .base import PaginatedResponse
-from .pools import TimeIntervalMetrics, Pool
+from .pools import TimeIntervalMetrics
 
 
 class TokenSummary(BaseModel):
@@ -129,4 +129,22 @@ class TokenPrice(BaseModel):
 
     chain: str = Field(...)
     id: str = Field(...)
-    price_usd: Optional[float] = Field(None) 
\ No newline at end of file
+    price_usd: Optional[float] = Field(None)
+
+
+class PriceChunkError(BaseModel):
+    """A batch of addresses whose multi-prices request failed."""
+
+    tokens: List[str] = Field(..., description="Addresses in the failed batch")
+    error: Exception = Field(..., description="Exception raised for the batch")
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class BulkPricesResponse(BaseModel):
+    """Merged result of a chunked multi-prices lookup."""
+
+    prices: List[TokenPrice] = Field([], description="Prices in input order, one per unique address found")
+    errors: List[PriceChunkError] = Field([], description="Batches that failed")
+    missing: List[str] = Field([], description="Addresses the API returned no price for")
+
@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+from fnmatch import fnmatchcase
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+# a rate in requests per second, or (rate, burst)
+RateSpec = Union[float, Tuple[float, float]]
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at ``rate`` tokens per second, holding at most ``burst``.
+
+    Requests reserve tokens instead of waiting for them: the balance may go
+    negative, and the caller is told how long to wait until its token is
+    due. Reserving is non-blocking, so the same bucket works for threads
+    and asyncio tasks alike.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize a new token bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (defaults to one second's worth, at least 1)
+            clock: Monotonic time source
+
+        Raises:
+            ValueError: If rate or burst is not positive
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        burst = max(1.0, rate) if burst is None else burst
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = burst
+        self._updated = clock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket.
+
+        Not synchronized; RateLimiter serializes access.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds to wait before the tokens are due (0 if available now)
+        """
+        self._refill()
+        self._tokens -= tokens
+        return max(0.0, -self._tokens / self.rate)
+
+    def pause(self, delay: float) -> None:
+        """
+        Hold back the next token until ``delay`` seconds from now.
+
+        Args:
+            delay: Seconds before the bucket hands out tokens again
+        """
+        self._refill()
+        self._tokens = min(self._tokens, 1 - delay * self.rate)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class RateLimiter:
+    """
+    Proactive client-side rate limiter: a global bucket plus per-endpoint buckets.
+
+    Endpoint budgets are keyed by glob patterns matched against the request
+    path (e.g. ``"/networks/*/pools/*/ohlcv"``). A request takes a token
+    from the global bucket and from every bucket whose pattern matches it,
+    and waits for the latest of them. One limiter can be shared by any
+    number of threads, asyncio tasks and clients.
+
+    Example:
+        limiter = RateLimiter(10, endpoints={"*/ohlcv": 2, "/search": (1, 5)})
+        client = DexPaprikaClient(rate_limit=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        endpoints: Optional[Dict[str, RateSpec]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a new rate limiter.
+
+        Args:
+            rate: Global requests per second (None for no global limit)
+            burst: Global burst size (defaults to one second's worth)
+            endpoints: Path pattern -> rate or (rate, burst)
+            clock: Monotonic time source
+        """
+        self._lock = threading.Lock()
+        self._global = TokenBucket(rate, burst, clock) if rate is not None else None
+        self._endpoints: List[Tuple[str, TokenBucket]] = []
+        for pattern, spec in (endpoints or {}).items():
+            endpoint_rate, endpoint_burst = spec if isinstance(spec, tuple) else (spec, None)
+            self._endpoints.append((pattern, TokenBucket(endpoint_rate, endpoint_burst, clock)))
+        # pattern matches per path, the same few paths recur constantly
+        self._matches: Dict[str, List[TokenBucket]] = {}
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+
+    def _buckets(self, endpoint: str) -> List[TokenBucket]:
+        buckets = self._matches.get(endpoint)
+        if buckets is None:
+            buckets = [bucket for pattern, bucket in self._endpoints if fnmatchcase(endpoint, pattern)]
+            if self._global is not None:
+                buckets.append(self._global)
+            if len(self._matches) < 10000:
+                self._matches[endpoint] = buckets
+        return buckets
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        Reserve a request slot for an endpoint.
+
+        Args:
+            endpoint: Request path, without base URL or query string
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._lock:
+            delay = 0.0
+            for bucket in self._buckets(endpoint):
+                delay = max(delay, bucket.reserve())
+            if delay > 0:
+                self.throttled += 1
+                self.throttled_seconds += delay
+            return delay
+
+    def pause(self, endpoint: str, delay: float) -> None:
+        """
+        Stop handing out slots for an endpoint for a while (e.g. after a 429).
+
+        Pauses the global bucket and every bucket matching the endpoint, so
+        all threads and tasks sharing this limiter hold off, not just the
+        request that was throttled.
+
+        Args:
+            endpoint: Request path that was throttled
+            delay: Seconds to pause, typically the Retry-After value
+        """
+        with self._lock:
+            for bucket in self._buckets(endpoint):
+                bucket.pause(delay)
+
+    def acquire(self, endpoint: str) -> None:
+        """Block the calling thread until a request to ``endpoint`` may be sent."""
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, endpoint: str) -> None:
+        """Wait (without blocking the event loop) until a request to ``endpoint`` may be sent."""
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            await asyncio.sleep(delay)
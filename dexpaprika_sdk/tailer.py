@@ -0,0 +1,358 @@
+import asyncio
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from .models.pools import Transaction, TransactionsResponse
+
+if TYPE_CHECKING:
+    from .api.pools import AsyncPoolsAPI, PoolsAPI
+
+PoolKey = Tuple[str, str]
+TxKey = Tuple[str, int]
+
+
+class _PoolState:
+    """Tailing state for a single pool."""
+
+    def __init__(self, network_id: str, pool_address: str, interval: float):
+        self.network_id = network_id
+        self.pool_address = pool_address
+        self.interval = interval
+        self.next_poll_at = 0.0
+        self.last_poll_ts: Optional[float] = None
+        self.high_water_block: Optional[int] = None
+        self.seen: Dict[TxKey, int] = {}
+        self.primed = False
+        self.last_error: Optional[Exception] = None
+
+
+class TransactionTailer:
+    """
+    Follow new swaps on many pools from a single worker.
+
+    Each pool keeps a high-water mark (the newest block seen) and the ids of
+    the transactions near it. A poll asks only for transactions since the
+    previous poll (``from_timestamp`` minus a small overlap), walks pages
+    newest-first via ``next_cursor`` until it reaches data it has already
+    seen, and emits just the unseen records, deduplicated on
+    ``(id, log_index)`` and in chronological order.
+
+    Poll intervals adapt per pool: they shrink towards ``min_interval`` while
+    a pool is active and grow towards ``max_interval`` while it is quiet, so
+    hundreds of mostly idle pools cost few requests.
+
+    Example:
+        tailer = client.pools.tail_transactions([("ethereum", pool_a), ("solana", pool_b)])
+        for tx in tailer:
+            handle(tx)
+    """
+
+    def __init__(
+        self,
+        pools_api: "PoolsAPI",
+        pools: Iterable[PoolKey] = (),
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        page_limit: int = 100,
+        max_pages: int = 10,
+        overlap: int = 60,
+        block_margin: int = 5,
+        include_existing: bool = False,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize a new tailer.
+
+        Args:
+            pools_api: The client's pools service
+            pools: (network_id, pool_address) pairs to follow
+            min_interval: Shortest delay between polls of an active pool (seconds)
+            max_interval: Longest delay between polls of a quiet pool (seconds)
+            page_limit: Transactions requested per page
+            max_pages: Most pages walked per poll before giving up on catching up
+            overlap: Seconds subtracted from the previous poll time in from_timestamp
+            block_margin: Blocks below the high-water mark still checked for
+                late-arriving transactions
+            include_existing: Emit the transactions returned by the first poll
+                instead of only recording them as seen (otherwise the first
+                poll fetches a single page, to set the high-water mark)
+            sleep: Function used to wait between polls
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        if min_interval < 0 or max_interval < min_interval:
+            raise ValueError("intervals must satisfy 0 <= min_interval <= max_interval")
+        if not 1 <= page_limit <= 100:
+            raise ValueError("page_limit must be between 1 and 100")
+        if max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+
+        self.pools_api = pools_api
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.page_limit = page_limit
+        self.max_pages = max_pages
+        self.overlap = overlap
+        self.block_margin = block_margin
+        self.include_existing = include_existing
+        self._sleep = sleep
+        self._pools: Dict[PoolKey, _PoolState] = {}
+        for network_id, pool_address in pools:
+            self.add_pool(network_id, pool_address)
+
+    def add_pool(self, network_id: str, pool_address: str) -> None:
+        """
+        Start following a pool. Adding a pool twice has no effect.
+
+        Args:
+            network_id: Network ID (e.g., "ethereum", "solana")
+            pool_address: Pool address or identifier
+        """
+        key = (network_id, pool_address)
+        if key not in self._pools:
+            self._pools[key] = _PoolState(network_id, pool_address, self.min_interval)
+
+    def remove_pool(self, network_id: str, pool_address: str) -> None:
+        """
+        Stop following a pool and forget its state.
+
+        Args:
+            network_id: Network ID
+            pool_address: Pool address or identifier
+        """
+        self._pools.pop((network_id, pool_address), None)
+
+    def high_water_mark(self, network_id: str, pool_address: str) -> Optional[int]:
+        """
+        Get the newest block seen for a pool.
+
+        Args:
+            network_id: Network ID
+            pool_address: Pool address or identifier
+
+        Returns:
+            The block number, or None if nothing has been seen yet
+        """
+        return self._pools[(network_id, pool_address)].high_water_block
+
+    @property
+    def errors(self) -> Dict[PoolKey, Exception]:
+        """Most recent poll error of each pool whose last poll failed."""
+        return {key: state.last_error for key, state in self._pools.items() if state.last_error is not None}
+
+    def poll(self, force: bool = False) -> List[Transaction]:
+        """
+        Poll every pool that is due and return its new transactions.
+
+        A failing pool does not stop the others; its error is kept in
+        ``errors`` and it is retried after ``max_interval``.
+
+        Args:
+            force: Poll every pool now, ignoring their schedules
+
+        Returns:
+            New transactions, grouped by pool and oldest first within a pool
+        """
+        now = time.monotonic()
+        new: List[Transaction] = []
+        for state in list(self._pools.values()):
+            if force or state.next_poll_at <= now:
+                new.extend(self._poll_pool(state))
+        return new
+
+    def __iter__(self) -> Iterator[Transaction]:
+        """Poll forever, sleeping until the next pool is due, yielding new transactions."""
+        while True:
+            for tx in self.poll():
+                yield tx
+            if self._pools:
+                next_due = min(state.next_poll_at for state in self._pools.values())
+                delay = next_due - time.monotonic()
+            else:
+                delay = self.min_interval
+            if delay > 0:
+                self._sleep(delay)
+
+    def _poll_pool(self, state: _PoolState) -> List[Transaction]:
+        started_at = time.time()
+        try:
+            new = self._fetch_new(state)
+        except Exception as e:
+            return self._poll_failed(state, e)
+        return self._poll_done(state, started_at, new)
+
+    def _poll_failed(self, state: _PoolState, error: Exception) -> List[Transaction]:
+        state.last_error = error
+        state.interval = self.max_interval
+        state.next_poll_at = time.monotonic() + state.interval
+        return []
+
+    def _poll_done(self, state: _PoolState, started_at: float, new: List[Transaction]) -> List[Transaction]:
+        state.last_error = None
+        state.last_poll_ts = started_at
+        self._remember(state, new)
+
+        # adapt the interval to how busy the pool is
+        if new:
+            state.interval = max(self.min_interval, state.interval / 2)
+        else:
+            state.interval = min(self.max_interval, max(state.interval * 1.5, self.min_interval))
+        state.next_poll_at = time.monotonic() + state.interval
+
+        first_poll = not state.primed
+        state.primed = True
+        if first_poll and not self.include_existing:
+            return []
+        return new
+
+    def _fetch_new(self, state: _PoolState) -> List[Transaction]:
+        """Walk pages newest-first until reaching transactions already seen."""
+        from_timestamp, floor, max_pages = self._poll_bounds(state)
+        new: Dict[TxKey, Transaction] = {}
+        cursor = None
+        for _ in range(max_pages):
+            response = self.pools_api._poll_transactions(
+                state.network_id, state.pool_address, self.page_limit, cursor, from_timestamp,
+            )
+            cursor = self._collect(state, response, floor, new)
+            if cursor is None:
+                break
+        return self._chronological(new)
+
+    def _poll_bounds(self, state: _PoolState) -> Tuple[Optional[int], Optional[int], int]:
+        """Get a poll's from_timestamp, lowest block still checked and page budget."""
+        from_timestamp = None
+        if state.last_poll_ts is not None:
+            from_timestamp = int(state.last_poll_ts) - self.overlap
+        floor = None
+        if state.high_water_block is not None:
+            floor = state.high_water_block - self.block_margin
+        # priming only records the newest transactions, one page sets the mark
+        max_pages = self.max_pages if state.primed or self.include_existing else 1
+        return from_timestamp, floor, max_pages
+
+    @staticmethod
+    def _collect(state: _PoolState, response: TransactionsResponse, floor: Optional[int],
+                 new: Dict[TxKey, Transaction]) -> Optional[str]:
+        """Add a page's unseen transactions to ``new``; return the cursor to continue with, if any."""
+        reached_known = False
+        for tx in response.transactions:
+            key = (tx.id, tx.log_index)
+            if key in state.seen or (floor is not None and tx.created_at_block_number < floor):
+                reached_known = True
+                continue
+            new.setdefault(key, tx)
+
+        cursor = response.page_info.next_cursor if response.page_info else None
+        if reached_known or not cursor or not response.transactions:
+            return None
+        return cursor
+
+    @staticmethod
+    def _chronological(new: Dict[TxKey, Transaction]) -> List[Transaction]:
+        return sorted(
+            new.values(),
+            key=lambda tx: (tx.created_at_block_number, tx.transaction_index, tx.log_index),
+        )
+
+    def _remember(self, state: _PoolState, new: List[Transaction]) -> None:
+        for tx in new:
+            state.seen[(tx.id, tx.log_index)] = tx.created_at_block_number
+            if state.high_water_block is None or tx.created_at_block_number > state.high_water_block:
+                state.high_water_block = tx.created_at_block_number
+
+        # only ids near the high-water mark are needed for deduplication
+        if state.high_water_block is not None:
+            floor = state.high_water_block - self.block_margin
+            state.seen = {key: block for key, block in state.seen.items() if block >= floor}
+
+
+class AsyncTransactionTailer(TransactionTailer):
+    """
+    Asyncio counterpart of TransactionTailer.
+
+    Polls run as coroutines, pools that are due at the same time are polled
+    concurrently, and waits use ``asyncio.sleep``.
+
+    Example:
+        tailer = client.pools.tail_transactions([("ethereum", pool_a), ("solana", pool_b)])
+        async for tx in tailer:
+            handle(tx)
+    """
+
+    # iterate with ``async for``
+    __iter__ = None  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        pools_api: "AsyncPoolsAPI",
+        pools: Iterable[PoolKey] = (),
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        **options,
+    ):
+        """
+        Initialize a new async tailer.
+
+        Args:
+            pools_api: The async client's pools service
+            pools: (network_id, pool_address) pairs to follow
+            sleep: Coroutine function used to wait between polls
+            **options: Any other argument accepted by TransactionTailer
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        super().__init__(pools_api, pools, sleep=sleep, **options)
+
+    async def poll(self, force: bool = False) -> List[Transaction]:
+        """
+        Poll every pool that is due and return its new transactions (see TransactionTailer.poll).
+
+        Args:
+            force: Poll every pool now, ignoring their schedules
+
+        Returns:
+            New transactions, grouped by pool and oldest first within a pool
+        """
+        now = time.monotonic()
+        due = [state for state in list(self._pools.values()) if force or state.next_poll_at <= now]
+        new: List[Transaction] = []
+        for transactions in await asyncio.gather(*(self._poll_pool(state) for state in due)):
+            new.extend(transactions)
+        return new
+
+    async def __aiter__(self) -> AsyncIterator[Transaction]:
+        """Poll forever, sleeping until the next pool is due, yielding new transactions."""
+        while True:
+            for tx in await self.poll():
+                yield tx
+            if self._pools:
+                next_due = min(state.next_poll_at for state in self._pools.values())
+                delay = next_due - time.monotonic()
+            else:
+                delay = self.min_interval
+            if delay > 0:
+                await self._sleep(delay)
+
+    async def _poll_pool(self, state: _PoolState) -> List[Transaction]:
+        started_at = time.time()
+        try:
+            new = await self._fetch_new(state)
+        except Exception as e:
+            return self._poll_failed(state, e)
+        return self._poll_done(state, started_at, new)
+
+    async def _fetch_new(self, state: _PoolState) -> List[Transaction]:
+        """Walk pages newest-first until reaching transactions already seen."""
+        from_timestamp, floor, max_pages = self._poll_bounds(state)
+        new: Dict[TxKey, Transaction] = {}
+        cursor = None
+        for _ in range(max_pages):
+            response = await self.pools_api._poll_transactions(
+                state.network_id, state.pool_address, self.page_limit, cursor, from_timestamp,
+            )
+            cursor = self._collect(state, response, floor, new)
+            if cursor is None:
+                break
+        return self._chronological(new)
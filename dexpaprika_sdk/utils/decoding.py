@@ -0,0 +1,72 @@
+import json
+from typing import Any, Callable, Dict, Union
+
+JSONDecoder = Callable[[bytes], Any]
+
+
+def _orjson_decoder() -> JSONDecoder:
+    import orjson
+    return orjson.loads
+
+
+def _msgspec_decoder() -> JSONDecoder:
+    import msgspec
+    return msgspec.json.Decoder().decode
+
+
+def _stdlib_decoder() -> JSONDecoder:
+    return json.loads
+
+
+# fastest first; "auto" picks the first one that imports
+_BACKENDS: Dict[str, Callable[[], JSONDecoder]] = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": _stdlib_decoder,
+}
+
+
+def get_decoder(backend: Union[str, JSONDecoder] = "auto") -> JSONDecoder:
+    """
+    Resolve a JSON decoding backend.
+
+    Args:
+        backend: "auto" (orjson, then msgspec, then the standard library),
+            "orjson", "msgspec", "json", or a callable taking the raw
+            response body (bytes) and returning the decoded value
+
+    Returns:
+        A function decoding a response body
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If the requested backend is not installed
+    """
+    if callable(backend):
+        return backend
+    if backend == "auto":
+        for factory in _BACKENDS.values():
+            try:
+                return factory()
+            except ImportError:
+                continue
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown JSON backend {backend!r}, expected one of: auto, {', '.join(_BACKENDS)}")
+    return _BACKENDS[backend]()
+
+
+def available_backends() -> list:
+    """
+    List the JSON backends that can be imported in this environment.
+
+    Returns:
+        Backend names, fastest first
+    """
+    names = []
+    for name, factory in _BACKENDS.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
@@ -1,15 +1,46 @@
+import inspect
+import threading
 import time
 from functools import wraps
 from typing import Dict, Any, Callable, Optional
 
-# perf tracking dict
+# perf tracking dict, guarded by _perf_lock (calls come from many threads)
 _perf_stats = {}
+_perf_lock = threading.Lock()
+
+def _record(func_name: str, elapsed: float) -> None:
+    """add one timing sample"""
+    with _perf_lock:
+        stats = _perf_stats.get(func_name)
+        if stats is None:
+            stats = _perf_stats[func_name] = {
+                'calls': 0,
+                'total_time': 0,
+                'min_time': float('inf'),
+                'max_time': 0
+            }
+        
+        stats['calls'] += 1
+        stats['total_time'] += elapsed
+        stats['min_time'] = min(stats['min_time'], elapsed)
+        stats['max_time'] = max(stats['max_time'], elapsed)
 
 def track_perf(func=None, *, name: Optional[str] = None):
-    """tracking decorator for api calls"""
+    """tracking decorator for api calls (sync or async)"""
     def decorator(f):
         func_name = name or f.__name__
         
+        if inspect.iscoroutinefunction(f):
+            @wraps(f)
+            async def async_wrapper(*args, **kwargs):
+                # time the awaited call, not coroutine creation
+                start = time.time()
+                result = await f(*args, **kwargs)
+                _record(func_name, time.time() - start)
+                return result
+            
+            return async_wrapper
+        
         @wraps(f)
         def wrapper(*args, **kwargs):
             # track time
@@ -18,20 +49,7 @@ def track_perf(func=None, *, name: Optional[str] = None):
             end = time.time()
             
             # update stats
-            if func_name not in _perf_stats:
-                _perf_stats[func_name] = {
-                    'calls': 0,
-                    'total_time': 0,
-                    'min_time': float('inf'),
-                    'max_time': 0
-                }
-            
-            elapsed = end - start
-            stats = _perf_stats[func_name]
-            stats['calls'] += 1
-            stats['total_time'] += elapsed
-            stats['min_time'] = min(stats['min_time'], elapsed)
-            stats['max_time'] = max(stats['max_time'], elapsed)
+            _record(func_name, end - start)
             
             return result
         
@@ -43,16 +61,16 @@ def track_perf(func=None, *, name: Optional[str] = None):
 
 def get_perf_stats() -> Dict[str, Any]:
     """get current perf stats"""
-    # add avg time
-    stats = {}
-    for name, data in _perf_stats.items():
-        stats[name] = {**data}
+    # consistent snapshot, then add avg time
+    with _perf_lock:
+        stats = {name: {**data} for name, data in _perf_stats.items()}
+    for data in stats.values():
         if data['calls'] > 0:
-            stats[name]['avg_time'] = data['total_time'] / data['calls']
+            data['avg_time'] = data['total_time'] / data['calls']
     
     return stats
 
 def reset_perf_stats() -> None:
     """reset stats"""
-    global _perf_stats
-    _perf_stats = {} 
\ No newline at end of file
+    with _perf_lock:
+        _perf_stats.clear() 
\ No newline at end of file
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark the response cache hit path.
+
+Times cache key generation and cache hits for raw responses (``_get``),
+cached models (``_get_model``) and a full service call
+(``pools.list_by_network``), with and without query parameters. Every
+call is served from the cache; no network access needed.
+
+    python examples/benchmark_cache.py [iterations]
+"""
+
+import json
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+# Add the parent directory to the path so we can import the package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dexpaprika_sdk import DexPaprikaClient, PoolsResponse
+
+
+PARAMS = {"page": 0, "limit": 10, "sort": "desc", "order_by": "volume_usd"}
+POOLS = {"pools": [], "page_info": {"limit": 10, "page": 0, "total_items": 0, "total_pages": 0}}
+
+
+def bench(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    client = DexPaprikaClient()
+    pools = client.pools
+
+    with patch("requests.Session.request", return_value=MagicMock(content=json.dumps(POOLS).encode())):
+        pools._get("/networks")
+        pools._get("/networks/ethereum/pools", PARAMS)
+        pools._get_model("/networks/ethereum/pools", PARAMS, PoolsResponse)
+        pools.list_by_network("ethereum", limit=10)
+
+    cases = [
+        ("cache key, no params", lambda: pools._get_cache_key("/networks")),
+        ("cache key, 4 params", lambda: pools._get_cache_key("/networks/ethereum/pools", PARAMS)),
+        ("_get hit, no params", lambda: pools._get("/networks")),
+        ("_get hit, 4 params", lambda: pools._get("/networks/ethereum/pools", PARAMS)),
+        ("_get_model hit, 4 params", lambda: pools._get_model("/networks/ethereum/pools", PARAMS, PoolsResponse)),
+        ("pools.list_by_network hit", lambda: pools.list_by_network("ethereum", limit=10)),
+    ]
+
+    print(f"Cache hit path ({iterations} iterations)\n")
+    print(f"{'case':<30}{'ns/call':>12}")
+    # every call must be a hit, or this measures the mock instead
+    with patch("requests.Session.request", side_effect=AssertionError("cache miss")):
+        for name, fn in cases:
+            print(f"{name:<30}{bench(fn, iterations):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON decoding and model validation per backend.
+
+Times decode, decode + validate and decode + trusted construction
+(validation="trusted") for 100-item pages of the hot response types
+(PoolsResponse, TransactionsResponse, TopTokensResponse) with every JSON
+backend installed (orjson, msgspec, stdlib json). No network access needed.
+
+    python examples/benchmark_decoding.py [iterations]
+"""
+
+import json
+import os
+import sys
+import time
+
+# Add the parent directory to the path so we can import the package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dexpaprika_sdk.models import PoolsResponse, TransactionsResponse, TopTokensResponse
+from dexpaprika_sdk.models.base import construct_model
+from dexpaprika_sdk.utils.decoding import available_backends, get_decoder
+
+
+PAGE_INFO = {"limit": 100, "page": 0, "total_items": 10000, "total_pages": 100}
+
+
+def pools_page():
+    token = {"id": "0x" + "a" * 40, "name": "Token", "symbol": "TKN", "chain": "ethereum",
+             "decimals": 18, "added_at": "2024-01-01T00:00:00Z"}
+    return {
+        "pools": [{
+            "id": f"0x{i:040x}", "dex_id": "uniswap_v3", "dex_name": "Uniswap V3", "chain": "ethereum",
+            "volume_usd": 123456.789, "created_at": "2024-01-01T00:00:00Z", "created_at_block_number": 19000000,
+            "transactions": 4321, "price_usd": 1.2345, "last_price_change_usd_5m": 0.1,
+            "last_price_change_usd_1h": -0.5, "last_price_change_usd_24h": 2.5, "fee": 0.003,
+            "tokens": [token, dict(token, id="0x" + "b" * 40)],
+        } for i in range(100)],
+        "page_info": PAGE_INFO,
+    }
+
+
+def transactions_page():
+    return {
+        "transactions": [{
+            "id": f"0x{i:064x}", "log_index": i, "transaction_index": i, "pool_id": "0x" + "c" * 40,
+            "sender": "0x" + "d" * 40, "recipient": "0x" + "e" * 40, "token_0": "0x" + "a" * 40,
+            "token_1": "0x" + "b" * 40, "amount_0": "1234.5678", "amount_1": "-0.98765",
+            "created_at_block_number": 19000000 + i,
+        } for i in range(100)],
+        "page_info": dict(PAGE_INFO, next_cursor="abc"),
+    }
+
+
+def top_tokens_page():
+    metrics = {"volume_usd": 1e6, "txns": 1000, "last_price_usd_change": 1.5, "buys": 600, "sells": 400}
+    return {
+        "tokens": [{
+            "address": f"0x{i:040x}", "name": "Token", "symbol": "TKN", "chain": "ethereum", "decimals": 18,
+            "has_image": True, "price_usd": 1.01, "fdv": 1e9, "liquidity_usd": 5e6, "pools": 12,
+            "24h": metrics, "1h": metrics, "5m": metrics,
+        } for i in range(100)],
+        "page_info": PAGE_INFO,
+    }
+
+
+CASES = [
+    ("PoolsResponse", PoolsResponse, pools_page()),
+    ("TransactionsResponse", TransactionsResponse, transactions_page()),
+    ("TopTokensResponse", TopTokensResponse, top_tokens_page()),
+]
+
+
+def bench(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    backends = available_backends()
+    print(f"Backends installed: {', '.join(backends)} ({iterations} iterations, 100 items per page)\n")
+    print(f"{'response':<22}{'backend':<10}{'decode ms':>12}{'decode+validate ms':>22}{'decode+trusted ms':>20}")
+
+    for name, model, payload in CASES:
+        body = json.dumps(payload).encode()
+        for backend in backends:
+            decode = get_decoder(backend)
+            decode_ms = bench(lambda: decode(body), iterations)
+            total_ms = bench(lambda: model(**decode(body)), iterations)
+            trusted_ms = bench(lambda: construct_model(model, decode(body)), iterations)
+            print(f"{name:<22}{backend:<10}{decode_ms:>12.3f}{total_ms:>22.3f}{trusted_ms:>20.3f}")
+
+
+if __name__ == "__main__":
+    main()
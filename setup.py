@@ -21,6 +21,15 @@ setup(
         "pydantic>=2.0.0",
     ],
     extras_require={
+        "async": [
+            "httpx>=0.23.0",
+        ],
+        "numpy": [
+            "numpy>=1.23.0",
+        ],
+        "fast": [
+            "orjson>=3.6.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
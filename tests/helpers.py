@@ -0,0 +1,61 @@
+"""
+Shared helpers for the OHLCV tests.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+
+def fmt(value):
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class FakeOHLCV:
+    """
+    Fake OHLCV endpoint serving one candle per step, except for ``holes``.
+
+    Like the real endpoint, it includes the candle opening at ``end``
+    (``include_end``) and never serves candles opening after now.
+    Requests starting at one of ``failing_starts`` raise.
+    """
+
+    def __init__(self, step=timedelta(hours=1), holes=(), failing_starts=(), include_end=True):
+        self.step = step
+        self.holes = set(holes)
+        self.failing_starts = set(failing_starts)
+        self.include_end = include_end
+        self.calls = []
+
+    def candle(self, t):
+        return {
+            "time_open": fmt(t), "time_close": fmt(t + self.step),
+            "open": 1.0, "high": 2.0, "low": 0.5, "close": t.hour, "volume": 10,
+        }
+
+    def __call__(self, method=None, url=None, params=None, **kwargs):
+        self.calls.append(dict(params))
+        start = parse(params["start"])
+        end = parse(params["end"]) if "end" in params else start + params["limit"] * self.step
+        if start in self.failing_starts:
+            raise ValueError("boom")
+        assert params["limit"] <= 366
+        assert end - start <= timedelta(days=365)
+
+        now = datetime.now(timezone.utc)
+        candles = []
+        t = start
+        while t < end and t < now and len(candles) < params["limit"]:
+            if t not in self.holes:
+                candles.append(self.candle(t))
+            t += self.step
+        if self.include_end and end < now and end not in self.holes:
+            candles.append(self.candle(end))
+        response = MagicMock()
+        response.json.return_value = candles
+        response.content = json.dumps(response.json.return_value).encode()
+        return response
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the asyncio client in the DexPaprika SDK.
+"""
+
+import asyncio
+import time
+import unittest
+from unittest.mock import patch, AsyncMock
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from dexpaprika_sdk import AsyncDexPaprikaClient, AsyncNotFoundError, BatchCall, NotFoundError
+from dexpaprika_sdk.models import PoolsResponse, Network
+
+
+def make_response(payload, status_code=200):
+    """Build an httpx response for the mocked transport."""
+    request = httpx.Request("GET", "https://api.dexpaprika.com/test")
+    return httpx.Response(status_code, json=payload, request=request)
+
+
+POOLS_PAYLOAD = {
+    "pools": [],
+    "page_info": {"limit": 10, "page": 0, "total_items": 0, "total_pages": 0},
+}
+
+
+class TestAsyncClient(unittest.TestCase):
+    """Test suite for AsyncDexPaprikaClient."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.client = AsyncDexPaprikaClient(max_retries=2, backoff_times=[0.01, 0.02])
+
+    def test_aclose_stops_refresher(self):
+        """Test that aclose shuts down refresh workers and the connection pool."""
+        async def run():
+            async with self.client as client:
+                client._submit_refresh(lambda: None)
+                refresher = client._refresher
+            return refresher
+
+        refresher = asyncio.run(run())
+        self.assertTrue(refresher._shutdown)
+        self.assertIsNone(self.client._refresher)
+        self.assertTrue(self.client.session.is_closed)
+        with self.assertRaises(TypeError):
+            with self.client:
+                pass
+
+    def test_aclose_cancels_refresh_tasks(self):
+        """Test that aclose cancels background revalidations before closing the session."""
+        async def run():
+            networks = [{"id": "ethereum", "display_name": "Ethereum"}]
+            with patch.object(httpx.AsyncClient, "request", new=AsyncMock(return_value=make_response(networks))):
+                await self.client.networks._get("/networks")
+            cache = self.client.networks._cache
+            entry = cache[cache.keys()[0]]
+            entry.expires_at = time.monotonic() - 1
+
+            session_closed = []
+
+            async def slow_request(*args, **kwargs):
+                await asyncio.sleep(10)
+                session_closed.append(self.client.session.is_closed)
+                return make_response(networks)
+
+            with patch.object(httpx.AsyncClient, "request", side_effect=slow_request):
+                await self.client.networks._get("/networks")
+                tasks = set(self.client.networks._refresh_tasks)
+                await asyncio.sleep(0)
+                await self.client.aclose()
+            return tasks, entry, session_closed
+
+        tasks, entry, session_closed = asyncio.run(run())
+        self.assertEqual(len(tasks), 1)
+        self.assertTrue(all(task.cancelled() for task in tasks))
+        self.assertEqual(self.client.networks._refresh_tasks, set())
+        self.assertFalse(entry.refreshing)
+        self.assertEqual(session_closed, [])
+        self.assertTrue(self.client.session.is_closed)
+
+    def test_service_call(self):
+        """Test that async service methods fetch and parse models."""
+        async def run():
+            with patch.object(httpx.AsyncClient, "request", new=AsyncMock(return_value=make_response(POOLS_PAYLOAD))):
+                return await self.client.pools.list_by_network("ethereum")
+
+        result = asyncio.run(run())
+        self.assertIsInstance(result, PoolsResponse)
+
+    def test_validation_shared(self):
+        """Test that async methods run the same validation as the sync client."""
+        with self.assertRaises(ValueError) as context:
+            asyncio.run(self.client.pools.list_by_network("ethereum", limit=101))
+        self.assertIn("limit must be at most 100", str(context.exception))
+
+    def test_caching(self):
+        """Test that async responses are cached and reused."""
+        async def run():
+            mock_request = AsyncMock(return_value=make_response([{"id": "ethereum", "display_name": "Ethereum"}]))
+            with patch.object(httpx.AsyncClient, "request", new=mock_request):
+                first = await self.client.networks.list()
+                second = await self.client.networks.list()
+            return mock_request.call_count, first, second
+
+        call_count, first, second = asyncio.run(run())
+        self.assertEqual(call_count, 1)
+        self.assertIsInstance(first[0], Network)
+        self.assertEqual(first, second)
+
+    def test_stale_while_revalidate(self):
+        """Test that an expired response is served while a task refreshes it."""
+        async def run():
+            networks = [{"id": "ethereum", "display_name": "Ethereum"}]
+            with patch.object(httpx.AsyncClient, "request", new=AsyncMock(return_value=make_response(networks))):
+                await self.client.networks._get("/networks")
+            cache = self.client.networks._cache
+            entry = cache[cache.keys()[0]]
+            entry.expires_at = time.monotonic() - 1
+
+            refreshed = [{"id": "solana", "display_name": "Solana"}]
+            mock_request = AsyncMock(return_value=make_response(refreshed))
+            with patch.object(httpx.AsyncClient, "request", new=mock_request):
+                stale = await self.client.networks._get("/networks")
+                await asyncio.gather(*self.client.networks._refresh_tasks)
+                fresh = await self.client.networks._get("/networks")
+            return stale, fresh, mock_request.call_count
+
+        stale, fresh, call_count = asyncio.run(run())
+        self.assertEqual(stale[0]["id"], "ethereum")
+        self.assertEqual(fresh[0]["id"], "solana")
+        self.assertEqual(call_count, 1)
+
+    def test_batch(self):
+        """Test that batches run service calls and coroutine functions as tasks."""
+        async def double(value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        def fail():
+            raise RuntimeError("boom")
+
+        async def run():
+            with patch.object(httpx.AsyncClient, "request", new=AsyncMock(return_value=make_response(POOLS_PAYLOAD))):
+                return await self.client.batch([
+                    BatchCall("pools.list_by_network", "ethereum"),
+                    BatchCall(double, 21),
+                    (fail, ()),
+                ], max_concurrency=2)
+
+        pools, doubled, error = asyncio.run(run())
+        self.assertIsInstance(pools, PoolsResponse)
+        self.assertEqual(doubled, 42)
+        self.assertIsInstance(error, RuntimeError)
+
+    def test_attempt_timeout(self):
+        """Test that attempts pass an httpx timeout derived from timeout and deadline."""
+        async def run():
+            mock_request = AsyncMock(return_value=make_response({}))
+            with patch.object(httpx.AsyncClient, "request", new=mock_request):
+                await self.client.get("/test_endpoint")
+                with self.client.call_options(timeout=(1, 4), deadline=2):
+                    await self.client.get("/test_endpoint")
+            return [c.kwargs["timeout"] for c in mock_request.call_args_list]
+
+        default, limited = asyncio.run(run())
+        self.assertEqual((default.connect, default.read), (10.0, 30.0))
+        self.assertEqual(limited.connect, 1)
+        self.assertLessEqual(limited.read, 2)
+
+    def test_retry_uses_asyncio_sleep(self):
+        """Test that retries back off with asyncio.sleep instead of time.sleep."""
+        async def run():
+            mock_request = AsyncMock(side_effect=[
+                httpx.ConnectError("Connection refused"),
+                make_response({"success": True}),
+            ])
+            with patch.object(httpx.AsyncClient, "request", new=mock_request), \
+                 patch("dexpaprika_sdk.async_client.asyncio.sleep", new=AsyncMock()) as mock_sleep, \
+                 patch("time.sleep") as mock_time_sleep:
+                result = await self.client.get("/test_endpoint")
+            return result, mock_request.call_count, mock_sleep.call_count, mock_time_sleep.call_count
+
+        result, calls, async_sleeps, time_sleeps = asyncio.run(run())
+        self.assertEqual(result, {"success": True})
+        self.assertEqual(calls, 2)
+        self.assertEqual(async_sleeps, 1)
+        self.assertEqual(time_sleeps, 0)
+
+    def test_no_retry_on_client_error(self):
+        """Test that client errors (4xx) are not retried."""
+        async def run():
+            mock_request = AsyncMock(return_value=make_response({}, status_code=404))
+            with patch.object(httpx.AsyncClient, "request", new=mock_request):
+                with self.assertRaises(httpx.HTTPStatusError):
+                    await self.client.get("/test_endpoint")
+            return mock_request.call_count
+
+        self.assertEqual(asyncio.run(run()), 1)
+
+    def test_concurrent_requests(self):
+        """Test that many lookups can run concurrently on one loop."""
+        async def run():
+            mock_request = AsyncMock(return_value=make_response(POOLS_PAYLOAD))
+            with patch.object(httpx.AsyncClient, "request", new=mock_request):
+                results = await asyncio.gather(
+                    *(self.client.pools.list_by_network("ethereum", page=i) for i in range(50))
+                )
+            return results, mock_request.call_count
+
+        results, calls = asyncio.run(run())
+        self.assertEqual(len(results), 50)
+        self.assertEqual(calls, 50)
+
+    def test_identical_requests_coalesced(self):
+        """Test that concurrent identical lookups share one in-flight fetch."""
+        async def slow_request(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return make_response(POOLS_PAYLOAD)
+
+        async def run():
+            mock_request = AsyncMock(side_effect=slow_request)
+            with patch.object(httpx.AsyncClient, "request", new=mock_request):
+                results = await asyncio.gather(
+                    *(self.client.pools.list_by_network("ethereum") for _ in range(20))
+                )
+            return results, mock_request.call_count
+
+        results, calls = asyncio.run(run())
+        self.assertEqual(calls, 1)
+        self.assertEqual(len(results), 20)
+
+    def test_not_found_cached(self):
+        """Test that a missing pool raises NotFoundError and is not looked up again."""
+        async def run():
+            mock_request = AsyncMock(return_value=make_response({}, status_code=404))
+            with patch.object(httpx.AsyncClient, "request", new=mock_request):
+                for _ in range(3):
+                    with self.assertRaises(NotFoundError) as raised:
+                        await self.client.pools.get_details("ethereum", "0xmissing")
+            return raised.exception, mock_request.call_count
+
+        error, calls = asyncio.run(run())
+        self.assertEqual(calls, 1)
+        self.assertEqual(error.response.status_code, 404)
+        # existing httpx handlers keep catching it
+        self.assertIsInstance(error, httpx.HTTPStatusError)
+        self.assertIsInstance(error, AsyncNotFoundError)
+        self.assertIsInstance(error.__cause__, httpx.HTTPStatusError)
+
+    def test_not_found_without_request(self):
+        """Test that NotFoundError accepts an httpx response that has no request attached."""
+        error = NotFoundError("pool", "ethereum", "0xmissing", response=httpx.Response(404))
+        self.assertEqual(error.response.status_code, 404)
+        self.assertIn("0xmissing", str(error))
+
+    def test_coalesced_waiters_share_exception(self):
+        """Test that coalesced waiters all receive the fetch's exception."""
+        async def failing_request(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return make_response({}, status_code=404)
+
+        async def run():
+            mock_request = AsyncMock(side_effect=failing_request)
+            with patch.object(httpx.AsyncClient, "request", new=mock_request):
+                results = await asyncio.gather(
+                    *(self.client.pools._get("/networks/ethereum/pools/0xabc") for _ in range(5)),
+                    return_exceptions=True,
+                )
+            return results, mock_request.call_count
+
+        results, calls = asyncio.run(run())
+        self.assertEqual(calls, 1)
+        self.assertTrue(all(isinstance(r, httpx.HTTPStatusError) for r in results))
+
+    def test_cancelled_leader_keeps_fetch(self):
+        """Test that cancelling the first caller doesn't cancel the fetch other callers await."""
+        async def slow_request(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return make_response(POOLS_PAYLOAD)
+
+        async def run():
+            mock_request = AsyncMock(side_effect=slow_request)
+            with patch.object(httpx.AsyncClient, "request", new=mock_request):
+                leader = asyncio.ensure_future(self.client.pools.list_by_network("ethereum"))
+                await asyncio.sleep(0)
+                followers = [asyncio.ensure_future(self.client.pools.list_by_network("ethereum")) for _ in range(3)]
+                await asyncio.sleep(0.01)
+                leader.cancel()
+                results = await asyncio.gather(*followers)
+            return leader, followers, results, mock_request.call_count
+
+        leader, followers, results, calls = asyncio.run(run())
+        self.assertTrue(leader.cancelled())
+        self.assertFalse(any(follower.cancelled() for follower in followers))
+        self.assertTrue(all(isinstance(result, PoolsResponse) for result in results))
+        self.assertEqual(calls, 1)
+
+    def test_multi_prices_bulk(self):
+        """Test that async bulk pricing batches requests and keeps input order."""
+        tokens = [f"0x{i:040x}" for i in range(25)]
+
+        async def fake_request(method, url, params=None, **kwargs):
+            return make_response([
+                {"chain": "ethereum", "id": address, "price_usd": 1.0}
+                for address in params["tokens"].split(",")
+            ])
+
+        async def run():
+            mock_request = AsyncMock(side_effect=fake_request)
+            with patch.object(httpx.AsyncClient, "request", new=mock_request):
+                result = await self.client.tokens.get_multi_prices_bulk("ethereum", tokens, max_concurrency=2)
+            return result, mock_request.call_count
+
+        result, calls = asyncio.run(run())
+        self.assertEqual(calls, 3)
+        self.assertEqual([p.id for p in result.prices], tokens)
+
+
+if __name__ == "__main__":
+    unittest.main()
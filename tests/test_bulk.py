@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Test script to verify bulk and batched calls in the DexPaprika SDK.
+"""
+
+import json
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+import requests
+from requests.exceptions import HTTPError
+
+from dexpaprika_sdk import DexPaprikaClient, BatchCall, PoolDetails, TokenDetails
+
+
+def prices_response(method=None, url=None, params=None, **kwargs):
+    """Fake multi-prices endpoint echoing a price for each requested address."""
+    addresses = params["tokens"].split(",")
+    response = MagicMock()
+    response.json.return_value = [
+        {"chain": "ethereum", "id": address, "price_usd": float(len(address))}
+        for address in addresses
+        if not address.startswith("unknown")
+    ]
+    response.content = json.dumps(response.json.return_value).encode()
+    return response
+
+
+class TestBulkPrices(unittest.TestCase):
+    """Test suite for TokensAPI.get_multi_prices_bulk."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.client = DexPaprikaClient(max_retries=0)
+
+    def test_chunks_and_preserves_order(self):
+        """Test that large lists are split into batches of 10 and kept in order."""
+        tokens = [f"0x{i:040x}" for i in range(35)]
+        with patch('requests.Session.request', side_effect=prices_response) as mock_request:
+            result = self.client.tokens.get_multi_prices_bulk("ethereum", tokens, max_concurrency=4)
+
+        self.assertEqual(mock_request.call_count, 4)
+        for call in mock_request.call_args_list:
+            self.assertLessEqual(len(call.kwargs["params"]["tokens"].split(",")), 10)
+        self.assertEqual([p.id for p in result.prices], tokens)
+        self.assertEqual(result.errors, [])
+
+    def test_dedupes_addresses(self):
+        """Test that duplicate addresses are only requested once."""
+        tokens = ["0xa", "0xb", "0xa", "0xc", "0xb"]
+        with patch('requests.Session.request', side_effect=prices_response) as mock_request:
+            result = self.client.tokens.get_multi_prices_bulk("ethereum", tokens)
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(mock_request.call_args.kwargs["params"]["tokens"], "0xa,0xb,0xc")
+        self.assertEqual([p.id for p in result.prices], ["0xa", "0xb", "0xc"])
+
+    def test_partial_failure(self):
+        """Test that a failing batch is reported without failing the call."""
+        tokens = [f"0x{i:040x}" for i in range(20)]
+        error_response = requests.Response()
+        error_response.status_code = 400
+
+        def flaky(method=None, url=None, params=None, **kwargs):
+            if params["tokens"].startswith(tokens[10]):
+                return MagicMock(raise_for_status=MagicMock(side_effect=HTTPError("400", response=error_response)))
+            return prices_response(params=params)
+
+        with patch('requests.Session.request', side_effect=flaky):
+            result = self.client.tokens.get_multi_prices_bulk("ethereum", tokens, max_concurrency=1)
+
+        self.assertEqual([p.id for p in result.prices], tokens[:10])
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(result.errors[0].tokens, tokens[10:])
+        self.assertIsInstance(result.errors[0].error, HTTPError)
+
+    def test_missing_addresses(self):
+        """Test that addresses without a returned price are listed as missing."""
+        with patch('requests.Session.request', side_effect=prices_response):
+            result = self.client.tokens.get_multi_prices_bulk("ethereum", ["0xa", "unknown1"])
+
+        self.assertEqual([p.id for p in result.prices], ["0xa"])
+        self.assertEqual(result.missing, ["unknown1"])
+
+    def test_rows_without_id_skipped(self):
+        """Test that unvalidated price rows without an id don't fail the call."""
+        client = DexPaprikaClient(max_retries=0, validation="none")
+
+        def with_null_id(method=None, url=None, params=None, **kwargs):
+            response = prices_response(params=params)
+            rows = json.loads(response.content) + [{"chain": "ethereum", "id": None, "price_usd": 1.0}]
+            response.content = json.dumps(rows).encode()
+            return response
+
+        with patch('requests.Session.request', side_effect=with_null_id):
+            result = client.tokens.get_multi_prices_bulk("ethereum", ["0xa", "0xb"])
+
+        self.assertEqual([p.id for p in result.prices], ["0xa", "0xb"])
+        self.assertEqual(result.errors, [])
+
+    def test_validation(self):
+        """Test validation of bulk price parameters."""
+        with self.assertRaises(ValueError):
+            self.client.tokens.get_multi_prices_bulk("ethereum", [])
+        with self.assertRaises(ValueError):
+            self.client.tokens.get_multi_prices_bulk("ethereum", ["0xa"], max_concurrency=0)
+
+
+def details_response(method=None, url=None, params=None, **kwargs):
+    """Fake pool/token details endpoints, failing for addresses starting with "bad"."""
+    parts = url.split("/")
+    kind, address = parts[-2], parts[-1]
+    response = MagicMock()
+    if address.startswith("bad"):
+        response.status_code = 404
+        response.raise_for_status.side_effect = HTTPError("404 Not Found", response=response)
+        return response
+    if kind == "pools":
+        payload = {"id": address, "created_at_block_number": 1, "chain": "ethereum", "created_at": "2024-01-01",
+                   "factory_id": "f", "dex_id": "d", "dex_name": "D", "tokens": [], "last_price": 1.0,
+                   "last_price_usd": 1.0, "price_time": "2024-01-01",
+                   "24h": {"last_price_usd_change": 0.0, "volume_usd": 1.0, "buy_usd": 1.0, "sell_usd": 0.0,
+                           "sells": 0, "buys": 1, "txns": 1}}
+    else:
+        payload = {"id": address, "name": "T", "symbol": "T", "chain": "ethereum", "decimals": 18,
+                   "added_at": "2024-01-01"}
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+class TestClientBatch(unittest.TestCase):
+    """Test suite for DexPaprikaClient.batch."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.client = DexPaprikaClient(max_retries=0)
+
+    def test_mixed_calls_in_order(self):
+        """Test that heterogeneous calls return results in input order with per-item errors."""
+        calls = [
+            BatchCall("pools.get_details", "ethereum", "0xpool1"),
+            ("tokens.get_details", ("ethereum", "0xtoken1")),
+            BatchCall("pools.get_details", "ethereum", "bad-pool"),
+            ("pools.get_details", ["ethereum", "0xpool2"], {"inversed": True}),
+        ]
+        with patch('requests.Session.request', side_effect=details_response):
+            results = self.client.batch(calls, max_concurrency=3)
+
+        self.assertIsInstance(results[0], PoolDetails)
+        self.assertEqual(results[0].id, "0xpool1")
+        self.assertIsInstance(results[1], TokenDetails)
+        self.assertIsInstance(results[2], HTTPError)
+        self.assertEqual(results[3].id, "0xpool2")
+
+    def test_bounded_concurrency(self):
+        """Test that no more than max_concurrency calls run at once."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow(value):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return value * 2
+
+        results = self.client.batch([BatchCall(slow, i) for i in range(20)], max_concurrency=4)
+        self.assertEqual(results, [i * 2 for i in range(20)])
+        self.assertLessEqual(peak, 4)
+        self.assertGreater(peak, 1)
+
+    def test_shares_cache(self):
+        """Test that repeated calls in a batch are served by one request."""
+        with patch('requests.Session.request', side_effect=details_response) as mock_request:
+            results = self.client.batch([BatchCall("tokens.get_details", "ethereum", "0xabc")] * 10)
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertTrue(all(result.id == "0xabc" for result in results))
+
+    def test_invalid_specs(self):
+        """Test that bad specs are rejected before any request is made."""
+        with patch('requests.Session.request') as mock_request:
+            for spec in [BatchCall("pools.nope"), BatchCall("pools._get", "/x"), BatchCall("session.close"),
+                         ("pools.get_details",), "pools.get_details"]:
+                with self.assertRaises(ValueError):
+                    self.client.batch([BatchCall("tokens.get_details", "ethereum", "0xabc"), spec])
+        mock_request.assert_not_called()
+        with self.assertRaises(ValueError):
+            self.client.batch([], max_concurrency=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
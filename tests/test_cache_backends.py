@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the shared cache backends in the DexPaprika SDK.
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import timedelta
+from fnmatch import fnmatchcase
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from dexpaprika_sdk import DexPaprikaClient, SQLiteCacheBackend, KeyValueCacheBackend, CacheBackend
+from dexpaprika_sdk.cache_backends import StoredResponse
+
+
+class FakeKeyValueStore:
+    """In-memory stand-in for a Redis client."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, name):
+        value, expires = self.values.get(name, (None, None))
+        if expires is not None and time.time() >= expires:
+            return None
+        return value
+
+    def set(self, name, value, ex=None):
+        self.values[name] = (value, time.time() + ex if ex else None)
+
+    def delete(self, *names):
+        for name in names:
+            self.values.pop(name, None)
+
+    def scan_iter(self, match=None):
+        # Redis MATCH patterns are globs with backslash escapes
+        pattern = (match or "*").replace("\\[", "[[]").replace("\\?", "[?]").replace("\\*", "[*]")
+        return [name for name in list(self.values) if fnmatchcase(name, pattern)]
+
+
+class BrokenBackend(CacheBackend):
+    """Backend whose store is unreachable."""
+
+    def get(self, key):
+        raise ConnectionError("cache is down")
+
+    def set(self, key, response):
+        raise ConnectionError("cache is down")
+
+    def clear(self, prefix=None):
+        raise ConnectionError("cache is down")
+
+
+def respond_with(payload):
+    return MagicMock(content=json.dumps(payload).encode())
+
+
+def stored(body=b"{}", ttl=60.0):
+    now = time.time()
+    return StoredResponse(body, now + ttl, now + ttl, now + ttl)
+
+
+class TestSQLiteCacheBackend(unittest.TestCase):
+    """Test suite for SQLiteCacheBackend."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.db")
+        self.backend = SQLiteCacheBackend(self.path)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.backend.close()
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """Test that responses are stored with their expiry times and can be replaced."""
+        response = stored(b'{"a":1}')
+        self.backend.set("/networks", response)
+        self.assertEqual(self.backend.get("/networks"), response)
+
+        self.backend.set("/networks", stored(b'{"a":2}'))
+        self.assertEqual(self.backend.get("/networks").body, b'{"a":2}')
+        self.assertIsNone(self.backend.get("/missing"))
+
+        self.backend.delete("/networks")
+        self.assertIsNone(self.backend.get("/networks"))
+
+    def test_wal_mode(self):
+        """Test that the database is opened in WAL mode for concurrent processes."""
+        self.assertEqual(self.backend._connection().execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_dead_responses(self):
+        """Test that responses past their stale window are hidden and purged."""
+        self.backend.set("/old", stored(ttl=-1))
+        self.backend.set("/new", stored())
+        self.assertIsNone(self.backend.get("/old"))
+        self.assertEqual(self.backend.purge_expired(), 1)
+        self.assertEqual(len(self.backend), 1)
+
+    def test_clear_prefix(self):
+        """Test that clear() removes exactly the keys under a prefix."""
+        for key in ("/networks", "/networks/ethereum", "/networks/ethereum/pools",
+                    "/networks/ethereum/pools?{\"page\":1}", "/networks/ethereum-classic/pools",
+                    "/networks/solana/pools", "/search?{\"query\":\"eth\"}"):
+            self.backend.set(key, stored())
+        self.backend.clear("/networks/ethereum/")
+        self.assertEqual(len(self.backend), 4)
+        self.assertIsNotNone(self.backend.get("/networks/ethereum-classic/pools"))
+        self.assertIsNotNone(self.backend.get("/networks/solana/pools"))
+        self.backend.clear()
+        self.assertEqual(len(self.backend), 0)
+
+    def test_shared_across_processes(self):
+        """Test that a response written by another process is read back."""
+        script = (
+            "import sys, time; sys.path.insert(0, sys.argv[1]);"
+            "from dexpaprika_sdk.cache_backends import SQLiteCacheBackend, StoredResponse;"
+            "now = time.time();"
+            "SQLiteCacheBackend(sys.argv[2]).set('/stats', StoredResponse(b'{\"chains\":3}', now + 60, now + 60, now + 60))"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", script, root, self.path], check=True, timeout=60)
+
+        client = DexPaprikaClient(cache_backend=self.backend)
+        with patch('requests.Session.request') as mock_request:
+            self.assertEqual(client.utils._get("/stats"), {"chains": 3})
+        mock_request.assert_not_called()
+
+
+class TestClientCacheBackend(unittest.TestCase):
+    """Test suite for clients sharing a cache backend."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.backend = KeyValueCacheBackend(FakeKeyValueStore(), namespace="test:")
+
+    def test_shared_between_clients(self):
+        """Test that a response fetched by one client is served to another with the same expiry."""
+        first = DexPaprikaClient(cache_backend=self.backend)
+        second = DexPaprikaClient(cache_backend=self.backend)
+
+        with patch('requests.Session.request', return_value=respond_with({"v": 1})) as mock_request:
+            self.assertEqual(first.pools._get("/networks/ethereum/pools", params={"page": 1}), {"v": 1})
+            self.assertEqual(second.pools._get("/networks/ethereum/pools", params={"page": 1}), {"v": 1})
+            # and by other services, the key is the request itself
+            self.assertEqual(second.dexes._get("/networks/ethereum/pools", params={"page": 1}), {"v": 1})
+        self.assertEqual(mock_request.call_count, 1)
+
+        key = first.pools._get_cache_key("/networks/ethereum/pools", {"page": 1})
+        self.assertAlmostEqual(first.pools._cache[key].expires_at, second.pools._cache[key].expires_at, places=3)
+
+    def test_expired_response_refetched(self):
+        """Test that TTLs carry over: an expired shared response is not served as fresh."""
+        client = DexPaprikaClient(cache_backend=self.backend, serve_stale=False)
+        with patch('requests.Session.request', return_value=respond_with({"v": 1})):
+            client.networks._get("/networks", ttl=timedelta(seconds=-1))
+
+        other = DexPaprikaClient(cache_backend=self.backend, serve_stale=False)
+        with patch('requests.Session.request', return_value=respond_with({"v": 2})) as mock_request:
+            self.assertEqual(other.networks._get("/networks"), {"v": 2})
+        self.assertEqual(mock_request.call_count, 1)
+
+    def test_clear_cache(self):
+        """Test that clearing a prefix removes it from the backend too."""
+        client = DexPaprikaClient(cache_backend=self.backend)
+        with patch('requests.Session.request', return_value=respond_with({"v": 1})):
+            client.pools._get("/networks/ethereum/pools", params={"page": 1})
+            client.pools._get("/networks/ethereum-classic/pools")
+            client.pools._get("/networks/solana/pools")
+        client.clear_cache("/networks/ethereum")
+        self.assertIsNone(self.backend.get('/networks/ethereum/pools?{"page":1}'))
+        self.assertIsNotNone(self.backend.get("/networks/ethereum-classic/pools"))
+        self.assertIsNotNone(self.backend.get("/networks/solana/pools"))
+
+    def test_backend_errors_are_misses(self):
+        """Test that an unreachable backend doesn't fail requests."""
+        backend = BrokenBackend()
+        client = DexPaprikaClient(cache_backend=backend)
+        with patch('requests.Session.request', return_value=respond_with({"v": 1})) as mock_request:
+            self.assertEqual(client.networks._get("/networks"), {"v": 1})
+            self.assertEqual(client.networks._get("/networks"), {"v": 1})
+            client.clear_cache()
+        self.assertEqual(mock_request.call_count, 1)
+        # lookup and re-check by the fetching caller, write, clear
+        self.assertEqual(backend.errors, 4)
+
+    def test_async_backend_io_off_loop(self):
+        """Test that the async client reads and writes the backend on worker threads."""
+        httpx = pytest.importorskip("httpx")
+        from dexpaprika_sdk import AsyncDexPaprikaClient
+
+        threads = []
+        backend_get, backend_set = self.backend.get, self.backend.set
+        self.backend.get = lambda key: threads.append(threading.get_ident()) or backend_get(key)
+        self.backend.set = lambda key, response: threads.append(threading.get_ident()) or backend_set(key, response)
+
+        async def fake_request(method, url, **kwargs):
+            return httpx.Response(200, json={"v": 1}, request=httpx.Request(method, url))
+
+        async def run():
+            async with AsyncDexPaprikaClient(cache_backend=self.backend) as client:
+                with patch.object(httpx.AsyncClient, "request", side_effect=fake_request):
+                    await client.networks._get("/networks")
+            # a new client (no memory cache) is served from the backend
+            async with AsyncDexPaprikaClient(cache_backend=self.backend) as client:
+                return await client.networks._get("/networks"), threading.get_ident()
+
+        result, loop_thread = asyncio.run(run())
+        self.assertEqual(result, {"v": 1})
+        # lookup and re-check by the fetching task, write, lookup
+        self.assertEqual(len(threads), 4)
+        self.assertNotIn(loop_thread, threads)
+
+    def test_path_creates_sqlite_backend(self):
+        """Test that a path is opened as a SQLiteCacheBackend."""
+        with tempfile.TemporaryDirectory() as directory:
+            client = DexPaprikaClient(cache_backend=os.path.join(directory, "cache.db"))
+            self.assertIsInstance(client.cache_backend, SQLiteCacheBackend)
+            client.cache_backend.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
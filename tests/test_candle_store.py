@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the persistent OHLCV candle store in the DexPaprika SDK.
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from dexpaprika_sdk import DexPaprikaClient, CandleStore
+
+from helpers import FakeOHLCV, fmt, parse
+
+
+class TestCandleStore(unittest.TestCase):
+    """Test suite for CandleStore and its use by get_ohlcv."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "candles.db")
+        self.fake = FakeOHLCV(include_end=False)
+
+    def tearDown(self):
+        """Clean up the temporary database."""
+        self.directory.cleanup()
+
+    def get_ohlcv(self, client, start, limit, end=None):
+        with patch('requests.Session.request', side_effect=self.fake):
+            return client.pools.get_ohlcv("ethereum", "0xabc", fmt(start), fmt(end) if end else None,
+                                          limit=limit, interval="1h")
+
+    def test_persists_across_clients(self):
+        """Test that candles synced by one client are served to the next without requests."""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        first = self.get_ohlcv(DexPaprikaClient(candle_store=self.path), start, 48)
+        self.assertEqual(len(self.fake.calls), 1)
+
+        # a new client (as after a restart) reads from the same file
+        client = DexPaprikaClient(candle_store=self.path)
+        second = self.get_ohlcv(client, start, 48)
+        self.assertEqual(len(self.fake.calls), 1)
+        self.assertEqual(first, second)
+        self.assertEqual(len(second), 48)
+
+    def test_fetches_only_missing_tail(self):
+        """Test that extending a synced range requests only the new part."""
+        client = DexPaprikaClient(candle_store=self.path)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.get_ohlcv(client, start, 24)
+        records = self.get_ohlcv(client, start, 72)
+
+        self.assertEqual(len(records), 72)
+        self.assertEqual(len(self.fake.calls), 2)
+        self.assertEqual(self.fake.calls[1]["start"], fmt(start + timedelta(hours=24)))
+        self.assertEqual(self.fake.calls[1]["limit"], 48)
+
+    def test_open_candles_not_stored(self):
+        """Test that candles that have not closed yet are refetched."""
+        client = DexPaprikaClient(candle_store=CandleStore())
+        start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) - timedelta(hours=3)
+
+        first = self.get_ohlcv(client, start, 10)
+        client.clear_cache()
+        self.get_ohlcv(client, start, 10)
+
+        self.assertEqual(len(first), 4)
+        self.assertEqual(len(self.fake.calls), 2)
+        # only the still-open part of the range is requested again
+        self.assertGreater(parse(self.fake.calls[1]["start"]), start)
+
+    def test_empty_spans_not_refetched(self):
+        """Test that a synced span with no trades is not requested again."""
+        store = CandleStore()
+        series = ("ethereum", "0xabc", "1h", False)
+        store.add(series, [], 0, 3600 * 10)
+
+        self.assertEqual(store.missing(series, 0, 3600 * 10), [])
+        self.assertEqual(store.missing(series, 3600 * 5, 3600 * 20), [(3600 * 10, 3600 * 20)])
+
+    def test_synced_spans_merge(self):
+        """Test that adjacent and overlapping synced spans are merged."""
+        store = CandleStore()
+        series = ("ethereum", "0xabc", "1h", False)
+        store.add(series, [], 0, 10)
+        store.add(series, [], 20, 30)
+        self.assertEqual(store.missing(series, 0, 40), [(10, 20), (30, 40)])
+
+        store.add(series, [], 10, 20)
+        self.assertEqual(store.missing(series, 0, 40), [(30, 40)])
+        self.assertEqual(store._synced(series), [(0, 30)])
+
+    def test_series_are_separate(self):
+        """Test that intervals and inversed prices are stored separately."""
+        client = DexPaprikaClient(candle_store=CandleStore())
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        with patch('requests.Session.request', side_effect=self.fake):
+            client.pools.get_ohlcv("ethereum", "0xabc", fmt(start), limit=5, interval="1h")
+            client.pools.get_ohlcv("ethereum", "0xabc", fmt(start), limit=5, interval="1h", inversed=True)
+
+        self.assertEqual(len(self.fake.calls), 2)
+
+    def test_clear(self):
+        """Test that clearing a pool forgets its candles and sync state."""
+        client = DexPaprikaClient(candle_store=CandleStore())
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.get_ohlcv(client, start, 5)
+        client.candle_store.clear("ethereum", "0xabc")
+        client.clear_cache()
+        self.get_ohlcv(client, start, 5)
+
+        self.assertEqual(len(self.fake.calls), 2)
+
+    def test_async_fetches_missing_spans_concurrently(self):
+        """Test that the async client requests several missing spans at once."""
+        httpx = pytest.importorskip("httpx")
+        from dexpaprika_sdk import AsyncDexPaprikaClient
+
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        store = CandleStore()
+        # leave holes before and after the synced middle
+        self.get_ohlcv(DexPaprikaClient(candle_store=store), start + timedelta(hours=24), 24)
+        running = []
+        peak = []
+
+        async def fake_request(method, url, params=None, **kwargs):
+            running.append(url)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            payload = self.fake(params=params).json.return_value
+            return httpx.Response(200, json=payload, request=httpx.Request(method, url))
+
+        async def run():
+            client = AsyncDexPaprikaClient(candle_store=store)
+            try:
+                with patch.object(httpx.AsyncClient, "request", side_effect=fake_request):
+                    return await client.pools.get_ohlcv("ethereum", "0xabc", fmt(start), limit=72, interval="1h")
+            finally:
+                await client.aclose()
+
+        records = asyncio.run(run())
+        self.assertEqual(len(records), 72)
+        self.assertEqual(len(self.fake.calls), 3)
+        self.assertEqual(max(peak), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
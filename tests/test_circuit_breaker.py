@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the per endpoint family circuit breaker in the DexPaprika SDK.
+"""
+
+import json
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+import requests
+from requests.exceptions import ConnectionError, HTTPError
+
+from dexpaprika_sdk import DexPaprikaClient, CircuitBreaker, CircuitOpenError
+
+
+OHLCV = "/networks/ethereum/pools/0xabc/ohlcv"
+DETAILS = "/networks/ethereum/pools/0xabc"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test suite for CircuitBreaker state transitions."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_rate=0.5, min_calls=4, window=60, open_for=30, clock=self.clock)
+
+    def fail_calls(self, endpoint, times):
+        for _ in range(times):
+            self.breaker.allow(endpoint)
+            self.breaker.record(endpoint, False)
+
+    def test_families(self):
+        """Test that endpoints are grouped into families, most specific pattern first."""
+        self.assertEqual(self.breaker.family(OHLCV), "ohlcv")
+        self.assertEqual(self.breaker.family(DETAILS), "pools")
+        self.assertEqual(self.breaker.family("/networks/solana/tokens/top"), "tokens")
+        self.assertEqual(self.breaker.family("/networks"), "networks")
+        self.assertEqual(self.breaker.family("/something/else"), "something")
+
+    def test_families_match_per_segment(self):
+        """Test that pools nested under a token or dex are not claimed by the pools family."""
+        self.assertEqual(self.breaker.family("/networks/ethereum/pools/filter"), "pools")
+        self.assertEqual(self.breaker.family("/networks/ethereum/tokens/0xabc/pools"), "tokens")
+        self.assertEqual(self.breaker.family("/networks/ethereum/dexes/uniswap_v3/pools"), "dexes")
+
+        breaker = CircuitBreaker(families={"pool": "/networks/*/pools/*", "rest": "/networks/**"})
+        self.assertEqual(breaker.family("/networks/ethereum/pools/0xabc"), "pool")
+        self.assertEqual(breaker.family("/networks/ethereum/pools/0xabc/ohlcv"), "rest")
+
+    def test_opens_at_failure_rate(self):
+        """Test that a family opens once enough calls failed, leaving others closed."""
+        self.breaker.record(OHLCV, True)
+        self.fail_calls(OHLCV, 2)
+        self.assertEqual(self.breaker.state("ohlcv"), CircuitBreaker.CLOSED)
+        self.fail_calls(OHLCV, 1)
+        self.assertEqual(self.breaker.state("ohlcv"), CircuitBreaker.OPEN)
+
+        with self.assertRaises(CircuitOpenError) as context:
+            self.breaker.allow(OHLCV)
+        self.assertEqual(context.exception.family, "ohlcv")
+        self.assertEqual(context.exception.retry_in, 30)
+        self.breaker.allow(DETAILS)
+
+    def test_min_calls_and_window(self):
+        """Test that a few failures, or old ones, don't open the circuit."""
+        self.fail_calls(OHLCV, 3)
+        self.clock.now = 61
+        self.fail_calls(OHLCV, 3)
+        self.assertEqual(self.breaker.state("ohlcv"), CircuitBreaker.CLOSED)
+
+    def test_half_open_probe_closes(self):
+        """Test that after open_for one probe is let through and its success closes the circuit."""
+        self.fail_calls(OHLCV, 4)
+        self.clock.now = 30
+        self.assertEqual(self.breaker.state("ohlcv"), CircuitBreaker.HALF_OPEN)
+
+        self.breaker.allow(OHLCV)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.allow(OHLCV)
+        self.breaker.record(OHLCV, True)
+        self.assertEqual(self.breaker.state("ohlcv"), CircuitBreaker.CLOSED)
+        self.breaker.allow(OHLCV)
+
+    def test_half_open_probe_failure_reopens(self):
+        """Test that a failed probe opens the circuit for another open_for."""
+        self.fail_calls(OHLCV, 4)
+        self.clock.now = 30
+        self.fail_calls(OHLCV, 1)
+        self.assertEqual(self.breaker.state("ohlcv"), CircuitBreaker.OPEN)
+        self.clock.now = 59
+        self.assertEqual(self.breaker.state("ohlcv"), CircuitBreaker.OPEN)
+
+    def test_lost_probe_does_not_block(self):
+        """Test that a probe that never reports back frees its slot after open_for."""
+        self.fail_calls(OHLCV, 4)
+        self.clock.now = 30
+        self.breaker.allow(OHLCV)
+        self.clock.now = 60
+        self.breaker.allow(OHLCV)
+
+
+class TestClientCircuitBreaker(unittest.TestCase):
+    """Test suite for the circuit breaker in DexPaprikaClient."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.clock = FakeClock()
+
+    def client(self, **options):
+        breaker = CircuitBreaker(min_calls=3, clock=self.clock, **options)
+        return DexPaprikaClient(max_retries=1, backoff_times=[0], circuit_breaker=breaker)
+
+    def test_fails_fast_per_family(self):
+        """Test that a failing family stops sending requests while others keep working."""
+        client = self.client()
+
+        def upstream(method=None, url=None, **kwargs):
+            if url.endswith("/ohlcv"):
+                raise ConnectionError("ohlcv is down")
+            return MagicMock(content=b"{}")
+
+        with patch('requests.Session.request', side_effect=upstream) as mock_request:
+            for _ in range(2):
+                with self.assertRaises((ConnectionError, CircuitOpenError)):
+                    client.get(OHLCV)
+            calls = mock_request.call_count
+            with self.assertRaises(CircuitOpenError):
+                client.get(OHLCV)
+            self.assertEqual(mock_request.call_count, calls)
+            self.assertEqual(client.get(DETAILS), {})
+
+    def test_client_errors_do_not_count(self):
+        """Test that 404s and 429s leave the circuit closed."""
+        client = self.client()
+        for status in (404, 429, 404, 404):
+            response = requests.Response()
+            response.status_code = status
+            failing = MagicMock(raise_for_status=MagicMock(side_effect=HTTPError(response=response)))
+            with patch('requests.Session.request', return_value=failing), \
+                    patch('dexpaprika_sdk.client.time.sleep'):
+                with self.assertRaises(HTTPError):
+                    client.get(DETAILS)
+        self.assertEqual(client.circuit_breaker.state("pools"), CircuitBreaker.CLOSED)
+
+    def test_serves_stale_cache_while_open(self):
+        """Test that an open circuit falls back to expired cached responses when configured."""
+        client = self.client(stale_for=600)
+        with patch('requests.Session.request', return_value=MagicMock(content=json.dumps({"v": 1}).encode())):
+            self.assertEqual(client.pools._get(DETAILS), {"v": 1})
+
+        # expire the cached response past its stale windows, then take the family down
+        for key in client.pools._cache.keys():
+            client.pools._cache[key].expires_at = time.monotonic() - 8 * 60
+            client.pools._cache[key].revalidate_until = client.pools._cache[key].expires_at
+        for _ in range(3):
+            client.circuit_breaker.record(DETAILS, False)
+
+        with patch('requests.Session.request') as mock_request:
+            self.assertEqual(client.pools._get(DETAILS), {"v": 1})
+            with self.assertRaises(CircuitOpenError):
+                client.pools._get(DETAILS, params={"other": 1})
+        mock_request.assert_not_called()
+
+    def test_true_creates_default_breaker(self):
+        """Test that circuit_breaker=True enables a breaker with default settings."""
+        self.assertIsInstance(DexPaprikaClient(circuit_breaker=True).circuit_breaker, CircuitBreaker)
+        self.assertIsNone(DexPaprikaClient().circuit_breaker)
+
+
+if __name__ == "__main__":
+    unittest.main()
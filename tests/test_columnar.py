@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script to verify columnar NumPy output in the DexPaprika SDK.
+"""
+
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dexpaprika_sdk import DexPaprikaClient, OHLCVRecord
+from dexpaprika_sdk.columnar import ohlcv_arrays, transaction_arrays
+
+
+CANDLES = [
+    {"time_open": "2024-01-01T00:00:00Z", "time_close": "2024-01-01T01:00:00Z",
+     "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 100},
+    {"time_open": "2024-01-01T01:00:00Z", "time_close": "2024-01-01T02:00:00Z",
+     "open": 1.5, "high": 3.0, "low": 1.0, "close": 2.5, "volume": 200},
+]
+
+TRANSACTIONS = {
+    "transactions": [
+        {"id": "0x1", "log_index": 3, "transaction_index": 1, "pool_id": "p", "sender": "s",
+         "recipient": "r", "token_0": "a", "token_1": "b", "amount_0": "1.5", "amount_1": -2,
+         "created_at_block_number": 10},
+        {"id": "0x2", "log_index": 0, "transaction_index": 2, "pool_id": "p", "sender": "s",
+         "recipient": 7, "token_0": "a", "token_1": "b", "amount_0": 3, "amount_1": 4.25,
+         "created_at_block_number": 11},
+    ],
+    "page_info": {"limit": 2, "page": 0, "next_cursor": "c1"},
+}
+
+
+def respond_with(payload):
+    response = MagicMock()
+    response.json.return_value = payload
+    response.content = json.dumps(response.json.return_value).encode()
+    return response
+
+
+class TestColumnar(unittest.TestCase):
+    """Test suite for columnar array output."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.client = DexPaprikaClient(max_retries=0)
+
+    def test_ohlcv_arrays(self):
+        """Test that OHLCV is returned as typed columns."""
+        with patch('requests.Session.request', return_value=respond_with(CANDLES)):
+            columns = self.client.pools.get_ohlcv_arrays("ethereum", "0xabc", "2024-01-01", limit=2, interval="1h")
+
+        self.assertEqual(columns["time_open"].dtype, np.dtype("datetime64[s]"))
+        self.assertEqual(columns["time_open"][1], np.datetime64("2024-01-01T01:00:00"))
+        self.assertEqual(columns["close"].dtype, np.float64)
+        np.testing.assert_array_equal(columns["high"], [2.0, 3.0])
+        self.assertEqual(columns["volume"].dtype, np.int64)
+        np.testing.assert_array_equal(columns["volume"], [100, 200])
+
+    def test_transactions_arrays(self):
+        """Test that transactions are returned as typed columns with page info."""
+        with patch('requests.Session.request', return_value=respond_with(TRANSACTIONS)):
+            columns, page_info = self.client.pools.get_transactions_arrays("ethereum", "0xabc", limit=2)
+
+        self.assertEqual(page_info.next_cursor, "c1")
+        self.assertEqual(list(columns["id"]), ["0x1", "0x2"])
+        self.assertEqual(columns["created_at_block_number"].dtype, np.int64)
+        np.testing.assert_array_equal(columns["amount_0"], [1.5, 3.0])
+        np.testing.assert_array_equal(columns["amount_1"], [-2.0, 4.25])
+
+    def test_transactions_arrays_without_page_info(self):
+        """Test that a page without page_info falls back to the requested page and limit."""
+        payload = {"transactions": TRANSACTIONS["transactions"]}
+        with patch('requests.Session.request', return_value=respond_with(payload)):
+            columns, page_info = self.client.pools.get_transactions_arrays("ethereum", "0xabc", page=3, limit=2)
+
+        self.assertEqual(len(columns["id"]), 2)
+        self.assertEqual((page_info.page, page_info.limit), (3, 2))
+        self.assertIsNone(page_info.next_cursor)
+
+    def test_accepts_models(self):
+        """Test that model lists convert the same way as raw rows."""
+        from_dicts = ohlcv_arrays(CANDLES)
+        from_models = ohlcv_arrays([OHLCVRecord(**c) for c in CANDLES])
+        for name in from_dicts:
+            np.testing.assert_array_equal(from_dicts[name], from_models[name])
+
+    def test_empty(self):
+        """Test that empty responses give empty columns."""
+        self.assertEqual(len(ohlcv_arrays([])["open"]), 0)
+        self.assertEqual(len(transaction_arrays([])["id"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
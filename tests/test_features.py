@@ -3,14 +3,18 @@
 Test script to verify caching and retry behavior in the DexPaprika SDK.
 """
 
+import json
 import unittest
+import threading
 import time
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from unittest.mock import patch, MagicMock
 import requests
-from requests.exceptions import ConnectionError, Timeout, HTTPError
+from requests.exceptions import ConnectionError, HTTPError
 
-from dexpaprika_sdk import DexPaprikaClient
+from dexpaprika_sdk import DexPaprikaClient, NotFoundError, PoolsResponse, RateLimiter
+from dexpaprika_sdk.utils.decoding import get_decoder, available_backends
 
 
 class TestCachingBehavior(unittest.TestCase):
@@ -92,6 +96,476 @@ class TestCachingBehavior(unittest.TestCase):
             # Second request after clearing cache
             self.client.networks._get("/test_endpoint")
             self.assertEqual(mock_request.call_count, 2)
+    
+    def test_hit_path_is_cheap(self):
+        """Test that cache hits don't serialize parameters or read the wall clock."""
+        params = {"page": 1, "limit": 10, "sort": "desc"}
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = MagicMock(content=b'{"test": "data"}')
+            self.client.pools._get("/networks/ethereum/pools", params=params)
+            
+            with patch('dexpaprika_sdk.api.base.json.dumps', side_effect=AssertionError("json key")), \
+                    patch('dexpaprika_sdk.api.cache.time.time', side_effect=AssertionError("wall clock")):
+                for _ in range(3):
+                    self.assertEqual(
+                        self.client.pools._get("/networks/ethereum/pools", params=dict(reversed(params.items()))),
+                        {"test": "data"},
+                    )
+            self.assertEqual(mock_request.call_count, 1)
+    
+    def test_clear_cache_prefix(self):
+        """Test that clear_cache(prefix) removes exactly the endpoints under that path."""
+        endpoints = [
+            ("/networks", None),
+            ("/networks/ethereum/pools", {"page": 1}),
+            ("/networks/ethereum/pools/0xabc", None),
+            ("/networks/ethereum-classic/pools", None),
+            ("/search", {"query": "ethereum"}),
+        ]
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = MagicMock(content=b'{"test": "data"}')
+            for endpoint, params in endpoints:
+                self.client.pools._get(endpoint, params=params)
+            
+            self.client.clear_cache("/networks/ethereum/")
+            self.assertEqual(
+                sorted(key[0] for key in self.client.pools._cache.keys()),
+                ["/networks", "/networks/ethereum-classic/pools", "/search"],
+            )
+            
+            for endpoint, params in endpoints:
+                self.client.pools._get(endpoint, params=params)
+            self.assertEqual(mock_request.call_count, len(endpoints) + 2)
+    
+    def test_cache_shared_across_services(self):
+        """Test that services requesting the same URL share one cached response."""
+        dexes = {"dexes": [], "page_info": {"limit": 10, "page": 0, "total_items": 0, "total_pages": 0}}
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = MagicMock(content=json.dumps(dexes).encode())
+            self.client.networks.list_dexes("ethereum")
+            self.client.dexes.list("ethereum")
+            self.assertEqual(mock_request.call_count, 1)
+
+            # other params are another URL
+            self.client.dexes.list("ethereum", limit=20)
+            self.assertEqual(mock_request.call_count, 2)
+
+            # one cache, cleared from any service
+            self.assertIs(self.client.networks._cache, self.client.dexes._cache)
+            self.client.dexes.clear_cache()
+            self.client.networks.list_dexes("ethereum")
+            self.assertEqual(mock_request.call_count, 3)
+
+    def test_cache_stats_per_service(self):
+        """Test that hits and misses are counted per service."""
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = MagicMock(content=b'{"test": "data"}')
+            self.client.networks._get("/networks/ethereum/dexes")
+            self.client.networks._get("/networks/ethereum/dexes")
+            self.client.dexes._get("/networks/ethereum/dexes")
+            self.client.pools._get("/networks/ethereum/pools")
+
+        stats = self.client.get_cache_stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["evictions"], 0)
+        self.assertEqual(stats["services"]["networks"], {"hits": 1, "stale_hits": 0, "misses": 1})
+        self.assertEqual(stats["services"]["dexes"], {"hits": 1, "stale_hits": 0, "misses": 0})
+        self.assertEqual(stats["services"]["pools"], {"hits": 0, "stale_hits": 0, "misses": 1})
+        self.assertEqual(stats["services"]["tokens"], {"hits": 0, "stale_hits": 0, "misses": 0})
+
+        self.client.networks.cache_stats.reset()
+        self.assertEqual(self.client.networks.cache_stats.snapshot()["hits"], 0)
+
+    def test_prefix_index_maintained(self):
+        """Test that the prefix index follows removals, evictions and clears."""
+        client = DexPaprikaClient(cache_max_entries=2)
+        cache = client.networks._cache
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = MagicMock(content=b'{"test": "data"}')
+            client.networks._get("/networks/ethereum/dexes")
+            client.networks._get("/networks/solana/dexes")
+            client.networks._get("/networks/base/dexes")  # evicts ethereum
+        
+        self.assertNotIn("/networks/ethereum", cache._prefixes)
+        self.assertEqual(len(cache._prefixes["/networks"]), 2)
+        self.assertEqual(cache.clear_prefix("/networks/solana"), 1)
+        self.assertEqual(cache.clear_prefix("/networks/solana"), 0)
+        self.assertEqual(cache.clear_prefix("/networks"), 1)
+        self.assertEqual(cache._prefixes, {})
+    
+    def test_lru_eviction(self):
+        """Test that the cache evicts least recently used entries past max_entries."""
+        client = DexPaprikaClient(cache_max_entries=2)
+        with patch('requests.Session.request') as mock_request:
+            mock_response = MagicMock()
+            mock_response.content = b'{"test": "data"}'
+            mock_response.json.return_value = {"test": "data"}
+            mock_request.return_value = mock_response
+            
+            client.networks._get("/a")
+            client.networks._get("/b")
+            client.networks._get("/a")  # /a is now most recently used
+            client.networks._get("/c")  # evicts /b
+            self.assertEqual(len(client.networks._cache), 2)
+            self.assertEqual(mock_request.call_count, 3)
+            
+            client.networks._get("/a")
+            self.assertEqual(mock_request.call_count, 3)
+            client.networks._get("/b")
+            self.assertEqual(mock_request.call_count, 4)
+    
+    def test_max_bytes_eviction(self):
+        """Test that the cache stays within its approximate byte budget."""
+        client = DexPaprikaClient(cache_max_entries=None, cache_max_bytes=100)
+        with patch('requests.Session.request') as mock_request:
+            mock_response = MagicMock()
+            mock_response.content = b'{"blob": "' + b"x" * 30 + b'"}'
+            mock_response.json.return_value = {"blob": "x" * 30}
+            mock_request.return_value = mock_response
+            
+            for i in range(10):
+                client.networks._get(f"/endpoint_{i}")
+            
+            cache = client.networks._cache
+            self.assertLessEqual(cache.total_bytes, 100)
+            self.assertEqual(len(cache), 2)
+            self.assertEqual(cache.evictions, 8)
+    
+    def test_expired_entries_purged(self):
+        """Test that expired entries are swept instead of lingering."""
+        with patch('requests.Session.request') as mock_request:
+            mock_response = MagicMock()
+            mock_response.content = b'{"test": "data"}'
+            mock_response.json.return_value = {"test": "data"}
+            mock_request.return_value = mock_response
+            
+            for i in range(5):
+                self.client.networks._get(f"/endpoint_{i}", ttl=timedelta(hours=-1))
+            self.client.networks._get("/fresh")
+            
+            cache = self.client.networks._cache
+            self.assertEqual(cache.purge_expired(), 5)
+            self.assertEqual(cache.keys(), [self.client.networks._get_cache_key("/fresh")])
+
+
+class TestStaleCache(unittest.TestCase):
+    """Test suite for stale-while-revalidate and stale-if-error caching."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.client = DexPaprikaClient(max_retries=0)
+    
+    def respond(self, payload):
+        return MagicMock(content=json.dumps(payload).encode())
+    
+    def age(self, seconds):
+        """Move every cached response ``seconds`` into the past."""
+        cache = self.client.networks._cache
+        for key in cache.keys():
+            entry = cache[key]
+            entry.expires_at -= seconds
+            entry.revalidate_until -= seconds
+            entry.stale_until -= seconds
+    
+    def test_ttl_classes(self):
+        """Test that endpoints get the TTL of their innermost resource type."""
+        ttls = self.client.networks._cache_ttls
+        get_ttl = self.client.networks._get_ttl
+        self.assertEqual(get_ttl("/networks"), ttls["networks"])
+        self.assertEqual(get_ttl("/networks/ethereum/pools/0xabc"), ttls["pools"])
+        self.assertEqual(get_ttl("/networks/ethereum/pools/0xabc/ohlcv"), ttls["pools"])
+        self.assertEqual(get_ttl("/networks/ethereum/tokens/top"), ttls["tokens"])
+        self.assertEqual(get_ttl("/networks/ethereum/tokens/0xabc/pools"), ttls["pools"])
+        self.assertEqual(get_ttl("/networks/ethereum/multi/prices"), ttls["default"])
+        self.assertEqual(get_ttl("/stats"), ttls["stats"])
+    
+    def test_stale_while_revalidate(self):
+        """Test that a just-expired response is served while one refresh replaces it."""
+        with patch('requests.Session.request', return_value=self.respond({"v": 1})):
+            self.client.networks._get("/test_endpoint")
+        self.age(5 * 60 + 10)
+        
+        refreshing = threading.Event()
+        
+        def slow_response(*args, **kwargs):
+            refreshing.wait(5)
+            return self.respond({"v": 2})
+        
+        with patch('requests.Session.request', side_effect=slow_response) as mock_request:
+            for _ in range(5):
+                self.assertEqual(self.client.networks._get("/test_endpoint"), {"v": 1})
+            refreshing.set()
+            self.client._refresher.shutdown(wait=True)
+            self.assertEqual(self.client.networks._get("/test_endpoint"), {"v": 2})
+        self.assertEqual(mock_request.call_count, 1)
+    
+    def test_stale_if_error(self):
+        """Test that upstream failures fall back to a stale response within its window."""
+        with patch('requests.Session.request', return_value=self.respond({"v": 1})):
+            self.client.networks._get("/test_endpoint")
+        # past stale-while-revalidate, fetched synchronously
+        self.age(5 * 60 + 2 * 60)
+        
+        with patch('requests.Session.request', side_effect=ConnectionError("down")):
+            self.assertEqual(self.client.networks._get("/test_endpoint"), {"v": 1})
+        self.assertEqual(self.client.networks.cache_stats.snapshot(), {"hits": 0, "stale_hits": 1, "misses": 2})
+        
+        not_found = requests.Response()
+        not_found.status_code = 404
+        with patch('requests.Session.request',
+                   return_value=MagicMock(raise_for_status=MagicMock(side_effect=HTTPError(response=not_found)))):
+            with self.assertRaises(HTTPError):
+                self.client.networks._get("/test_endpoint")
+        
+        self.age(4 * 60)
+        with patch('requests.Session.request', side_effect=ConnectionError("down")):
+            with self.assertRaises(ConnectionError):
+                self.client.networks._get("/test_endpoint")
+    
+    def test_serve_stale_disabled(self):
+        """Test that serve_stale=False refetches expired responses synchronously."""
+        self.client = DexPaprikaClient(max_retries=0, serve_stale=False)
+        with patch('requests.Session.request', return_value=self.respond({"v": 1})):
+            self.client.networks._get("/test_endpoint")
+        self.age(5 * 60 + 10)
+        
+        with patch('requests.Session.request', return_value=self.respond({"v": 2})):
+            self.assertEqual(self.client.networks._get("/test_endpoint"), {"v": 2})
+        self.assertIsNone(self.client._refresher)
+    
+    def test_close_stops_refresher(self):
+        """Test that closing the client shuts down the refresh workers and the session."""
+        with patch('requests.Session.request', return_value=self.respond({"v": 1})):
+            self.client.networks._get("/test_endpoint")
+        self.age(5 * 60 + 10)
+        
+        with patch('requests.Session.close') as close_session:
+            with self.client as client:
+                with patch('requests.Session.request', return_value=self.respond({"v": 2})):
+                    client.networks._get("/test_endpoint")
+                refresher = client._refresher
+            
+        self.assertTrue(refresher._shutdown)
+        self.assertIsNone(self.client._refresher)
+        close_session.assert_called_once()
+        self.assertEqual(self.client.networks._get("/test_endpoint"), {"v": 2})
+
+
+class TestNotFoundCaching(unittest.TestCase):
+    """Test suite for negative caching of 404s."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.client = DexPaprikaClient(max_retries=0)
+    
+    def not_found(self, *args, **kwargs):
+        """Build a 404 response."""
+        response = requests.Response()
+        response.status_code = 404
+        return MagicMock(status_code=404, raise_for_status=MagicMock(
+            side_effect=HTTPError("404 Not Found", response=response)))
+    
+    def test_missing_token_cached(self):
+        """Test that a missing token raises NotFoundError and is not looked up again."""
+        with patch('requests.Session.request', side_effect=self.not_found) as mock_request:
+            for _ in range(3):
+                with self.assertRaises(NotFoundError) as raised:
+                    self.client.tokens.get_details("ethereum", "0xmissing")
+            self.assertEqual(mock_request.call_count, 1)
+        
+        error = raised.exception
+        self.assertIsInstance(error, HTTPError)
+        self.assertEqual(error.response.status_code, 404)
+        self.assertEqual((error.resource, error.network_id, error.address), ("token", "ethereum", "0xmissing"))
+        self.assertIsInstance(error.__cause__, HTTPError)
+        self.assertEqual(self.client.tokens.cache_stats.snapshot(), {"hits": 2, "stale_hits": 0, "misses": 1})
+    
+    def test_missing_pool_expires(self):
+        """Test that a cached 404 expires after not_found_ttl."""
+        with patch('requests.Session.request', side_effect=self.not_found) as mock_request:
+            with self.assertRaises(NotFoundError):
+                self.client.pools.get_details("ethereum", "0xmissing", inversed=True)
+            # other params are another lookup
+            with self.assertRaises(NotFoundError):
+                self.client.pools.get_details("ethereum", "0xmissing")
+            self.assertEqual(mock_request.call_count, 2)
+        
+        for key in self.client.pools._cache.keys():
+            entry = self.client.pools._cache[key]
+            # no stale windows: an expired 404 is looked up again
+            self.assertEqual(entry.stale_until, entry.expires_at)
+            entry.expires_at = entry.revalidate_until = entry.stale_until = time.monotonic() - 1
+        
+        pool = {"id": "0xmissing", "created_at_block_number": 1, "chain": "ethereum", "created_at": "2024-01-01",
+                "factory_id": "f", "dex_id": "d", "dex_name": "D", "tokens": [], "last_price": 1.0,
+                "last_price_usd": 1.0, "price_time": "2024-01-01",
+                "24h": {"last_price_usd_change": 0.0, "volume_usd": 1.0, "buy_usd": 1.0, "sell_usd": 0.0,
+                        "sells": 0, "buys": 1, "txns": 1}}
+        with patch('requests.Session.request', return_value=MagicMock(content=json.dumps(pool).encode())):
+            self.assertEqual(self.client.pools.get_details("ethereum", "0xmissing").id, "0xmissing")
+    
+    def test_not_found_ttl_disabled(self):
+        """Test that not_found_ttl=None looks up missing addresses every time."""
+        self.client = DexPaprikaClient(max_retries=0, not_found_ttl=None)
+        with patch('requests.Session.request', side_effect=self.not_found) as mock_request:
+            for _ in range(3):
+                with self.assertRaises(NotFoundError):
+                    self.client.tokens.get_details("ethereum", "0xmissing")
+            self.assertEqual(mock_request.call_count, 3)
+    
+    def test_other_endpoints_not_cached(self):
+        """Test that 404s from endpoints other than get_details are not cached."""
+        with patch('requests.Session.request', side_effect=self.not_found) as mock_request:
+            for _ in range(2):
+                with self.assertRaises(HTTPError) as raised:
+                    self.client.pools._get("/networks/ethereum/pools/0xmissing/transactions")
+                self.assertNotIsInstance(raised.exception, NotFoundError)
+            self.assertEqual(mock_request.call_count, 2)
+    
+    def test_other_errors_not_cached(self):
+        """Test that only 404s are cached, and other errors keep their type."""
+        response = requests.Response()
+        response.status_code = 400
+        bad_request = MagicMock(raise_for_status=MagicMock(side_effect=HTTPError("400", response=response)))
+        with patch('requests.Session.request', return_value=bad_request) as mock_request:
+            for _ in range(2):
+                with self.assertRaises(HTTPError) as raised:
+                    self.client.tokens.get_details("ethereum", "0xbad")
+                self.assertNotIsInstance(raised.exception, NotFoundError)
+            self.assertEqual(mock_request.call_count, 2)
+
+
+class TestModelCaching(unittest.TestCase):
+    """Test suite for caching parsed models with responses."""
+    
+    POOLS = {"page_info": {"limit": 1, "page": 0, "total_pages": 1}}
+    
+    def get_pools(self, client, payload=None):
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = MagicMock(content=json.dumps(payload or self.POOLS).encode())
+            with patch('dexpaprika_sdk.models.PoolsResponse.__init__', autospec=True,
+                       side_effect=PoolsResponse.__init__) as init:
+                first = client.pools.list_by_network("ethereum", limit=1)
+                second = client.pools.list_by_network("ethereum", limit=1)
+        return first, second, init.call_count
+    
+    def test_hit_returns_cached_model(self):
+        """Test that a cache hit returns the parsed model without parsing again."""
+        first, second, parses = self.get_pools(DexPaprikaClient())
+        self.assertIsInstance(first, PoolsResponse)
+        self.assertEqual(first, second)
+        self.assertEqual(parses, 1)
+    
+    def test_callers_get_copies(self):
+        """Test that changing a returned model does not affect the next caller."""
+        payload = dict(self.POOLS, pools=[{"id": "p1", "dex_id": "d", "dex_name": "D", "chain": "ethereum",
+                                           "volume_usd": 1.0, "created_at": "2024-01-01T00:00:00Z",
+                                           "created_at_block_number": 1, "transactions": 1, "price_usd": 1.0,
+                                           "tokens": []}])
+        client = DexPaprikaClient()
+        first, _, _ = self.get_pools(client, payload)
+        first.page_info = None
+        first.pools.clear()
+        
+        _, third, parses = self.get_pools(client, payload)
+        self.assertEqual(parses, 0)
+        self.assertEqual(third.page_info.limit, 1)
+        self.assertEqual([pool.id for pool in third.pools], ["p1"])
+    
+    def test_opt_out(self):
+        """Test that cache_models=False parses a fresh model per call."""
+        first, second, parses = self.get_pools(DexPaprikaClient(cache_models=False))
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+        self.assertEqual(parses, 2)
+    
+    def test_raw_data_not_mutated(self):
+        """Test that filling in missing keys leaves the cached response untouched."""
+        client = DexPaprikaClient()
+        first, _, _ = self.get_pools(client)
+        self.assertEqual(first.pools, [])
+        entry = client.pools._get_cached(client.pools._get_cache_key(
+            "/networks/ethereum/pools", {"page": 0, "limit": 1, "sort": "desc", "order_by": "volume_usd"}))
+        self.assertNotIn("pools", entry.data)
+    
+    def test_validation_none_returns_raw(self):
+        """Test that validation="none" still returns raw data."""
+        first, second, parses = self.get_pools(DexPaprikaClient(validation="none"))
+        self.assertEqual(first, dict(self.POOLS, pools=[]))
+        self.assertEqual(second, first)
+        self.assertEqual(parses, 0)
+
+    def test_validation_none_callers_get_copies(self):
+        """Test that changing returned raw data does not affect the next caller."""
+        client = DexPaprikaClient(validation="none")
+        first, _, _ = self.get_pools(client)
+        first["page_info"]["limit"] = 0
+        first["pools"].append({"id": "p1"})
+        first.pop("page_info")
+
+        _, third, _ = self.get_pools(client)
+        self.assertEqual(third, dict(self.POOLS, pools=[]))
+
+
+class TestRequestCoalescing(unittest.TestCase):
+    """Test suite for single-flight deduplication of concurrent GETs."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.client = DexPaprikaClient(max_retries=0)
+    
+    def _run_threads(self, count, target):
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
+    def test_concurrent_identical_requests_share_one_fetch(self):
+        """Test that concurrent identical GETs trigger a single HTTP call."""
+        def slow_request(*args, **kwargs):
+            time.sleep(0.1)
+            return MagicMock(content=b'{"id":"pool"}', json=lambda: {"id": "pool"})
+        
+        results = []
+        with patch('requests.Session.request', side_effect=slow_request) as mock_request:
+            self._run_threads(10, lambda: results.append(self.client.pools._get("/networks/ethereum/pools/0xabc")))
+        
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(results, [{"id": "pool"}] * 10)
+    
+    def test_waiters_receive_same_exception(self):
+        """Test that every waiter gets the leader's exception."""
+        def failing_request(*args, **kwargs):
+            time.sleep(0.1)
+            raise ConnectionError("Connection refused")
+        
+        errors = []
+        
+        def call():
+            try:
+                self.client.pools._get("/networks/ethereum/pools/0xabc")
+            except ConnectionError as e:
+                errors.append(e)
+        
+        with patch('requests.Session.request', side_effect=failing_request) as mock_request:
+            self._run_threads(5, call)
+        
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(len(errors), 5)
+        self.assertTrue(all(e is errors[0] for e in errors))
+    
+    def test_different_keys_not_coalesced(self):
+        """Test that requests with different params are fetched separately."""
+        def slow_request(*args, **kwargs):
+            time.sleep(0.05)
+            return MagicMock(content=b'{}', json=lambda: {})
+        
+        counter = iter(range(4))
+        with patch('requests.Session.request', side_effect=slow_request) as mock_request:
+            self._run_threads(4, lambda: self.client.pools._get("/pools", params={"page": next(counter)}))
+        
+        self.assertEqual(mock_request.call_count, 4)
 
 
 class TestRetryBehavior(unittest.TestCase):
@@ -176,6 +650,171 @@ class TestRetryBehavior(unittest.TestCase):
             
             # Should be called 3 times (initial + 2 retries)
             self.assertEqual(mock_request.call_count, 3)
+    
+    @staticmethod
+    def throttled_error(retry_after=None):
+        """Build a 429 Too Many Requests error."""
+        error_response = requests.Response()
+        error_response.status_code = 429
+        if retry_after is not None:
+            error_response.headers["Retry-After"] = retry_after
+        return HTTPError("429 Too Many Requests", response=error_response)
+    
+    def throttled(self, retry_after=None):
+        """Build a response failing with 429 Too Many Requests."""
+        return MagicMock(raise_for_status=MagicMock(side_effect=self.throttled_error(retry_after)))
+    
+    def test_429_retried_after_retry_after_seconds(self):
+        """Test that 429 is retried after the delay the server asks for."""
+        ok = MagicMock(content=b'{"success":true}')
+        with patch('requests.Session.request', side_effect=[self.throttled("3"), ok]) as mock_request, \
+                patch('dexpaprika_sdk.client.time.sleep') as mock_sleep:
+            result = self.client.get("/test_endpoint")
+        
+        self.assertEqual(result, {"success": True})
+        self.assertEqual(mock_request.call_count, 2)
+        mock_sleep.assert_called_once_with(3.0)
+    
+    def test_retry_after_http_date(self):
+        """Test that an HTTP-date Retry-After is converted to a delay."""
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        delay = DexPaprikaClient._retry_after(self.throttled_error(retry_at))
+        self.assertTrue(28 <= delay <= 30)
+        self.assertIsNone(DexPaprikaClient._retry_after(self.throttled_error("soon")))
+        self.assertIsNone(DexPaprikaClient._retry_after(self.throttled_error()))
+    
+    def test_retry_after_pauses_rate_limiter(self):
+        """Test that Retry-After holds back every request sharing the rate limiter."""
+        limiter = RateLimiter(100)
+        client = DexPaprikaClient(max_retries=1, rate_limit=limiter)
+        ok = MagicMock(content=b'{}')
+        with patch('requests.Session.request', side_effect=[self.throttled("2"), ok]), \
+                patch('dexpaprika_sdk.client.time.sleep'):
+            client.get("/test_endpoint")
+        # the pause outlasts the retry, since sleep was mocked out
+        self.assertGreater(limiter.reserve("/other"), 1.5)
+    
+    def test_deadline_caps_retries(self):
+        """Test that retries stop when the next wait would pass the deadline."""
+        client = DexPaprikaClient(max_retries=None, deadline=10, backoff_times=[1.0])
+        with patch('requests.Session.request', side_effect=[self.throttled(), self.throttled("60")]) as mock_request, \
+                patch('dexpaprika_sdk.client.time.sleep') as mock_sleep:
+            with self.assertRaises(HTTPError):
+                client.get("/test_endpoint")
+        
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_sleep.call_count, 1)
+    
+    def test_unbounded_retries_require_deadline(self):
+        """Test that max_retries=None without a deadline is rejected."""
+        with self.assertRaises(ValueError):
+            DexPaprikaClient(max_retries=None)
+
+
+
+class TestTimeouts(unittest.TestCase):
+    """Test suite for attempt timeouts and per-call deadlines."""
+    
+    OK = MagicMock(content=b'{}')
+    
+    def timeouts(self, mock_request):
+        return [c.kwargs["timeout"] for c in mock_request.call_args_list]
+    
+    def test_default_and_per_call_timeout(self):
+        """Test that every attempt gets a connect/read timeout, overridable per call."""
+        client = DexPaprikaClient()
+        with patch('requests.Session.request', return_value=self.OK) as mock_request:
+            client.get("/test_endpoint")
+            client.request("GET", "/test_endpoint", timeout=2)
+            with client.call_options(timeout=(1, 4)):
+                client.networks._get("/other", skip_cache=True)
+        
+        self.assertEqual(self.timeouts(mock_request), [(10.0, 30.0), (2, 2), (1, 4)])
+    
+    def test_deadline_caps_attempt_timeout(self):
+        """Test that an attempt never waits on the socket past the deadline."""
+        client = DexPaprikaClient(timeout=(5, 60))
+        with patch('requests.Session.request', return_value=self.OK) as mock_request:
+            client.request("GET", "/test_endpoint", deadline=3)
+        
+        for value in self.timeouts(mock_request)[0]:
+            self.assertLessEqual(value, 3)
+            self.assertGreater(value, 2.5)
+    
+    def test_backoff_truncated_to_budget(self):
+        """Test that backoff sleeps are cut to fit the remaining budget."""
+        client = DexPaprikaClient(max_retries=1, backoff_times=[5.0])
+        with patch('requests.Session.request', side_effect=[ConnectionError("down"), self.OK]) as mock_request, \
+                patch('dexpaprika_sdk.client.time.sleep') as mock_sleep:
+            with client.call_options(deadline=2):
+                client.get("/test_endpoint")
+        
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertLessEqual(mock_sleep.call_args.args[0], 1.0)
+    
+    def test_deadline_exceeded_raises_last_error(self):
+        """Test that running out of budget reports the failure, not a generic timeout."""
+        client = DexPaprikaClient(max_retries=None, deadline=0.05, backoff_times=[0.01])
+        with patch('requests.Session.request', side_effect=ConnectionError("down")) as mock_request:
+            with self.assertRaises(ConnectionError):
+                client.get("/test_endpoint")
+        self.assertGreater(mock_request.call_count, 1)
+    
+    def test_call_options_reach_batch_workers(self):
+        """Test that call_options apply to calls run by batch worker threads."""
+        client = DexPaprikaClient()
+        with patch('requests.Session.request', return_value=self.OK) as mock_request:
+            with client.call_options(timeout=7):
+                client.batch([(client.get, (f"/endpoint/{i}",)) for i in range(4)], max_concurrency=4)
+        
+        self.assertEqual(self.timeouts(mock_request), [(7, 7)] * 4)
+    
+    def test_options_are_per_client(self):
+        """Test that one client's call_options don't leak into another client."""
+        first, second = DexPaprikaClient(), DexPaprikaClient()
+        with patch('requests.Session.request', return_value=self.OK) as mock_request:
+            with first.call_options(timeout=1):
+                second.get("/test_endpoint")
+        
+        self.assertEqual(self.timeouts(mock_request), [(10.0, 30.0)])
+
+
+class TestJSONDecoding(unittest.TestCase):
+    """Test suite for pluggable JSON decoding."""
+    
+    def test_stdlib_backend(self):
+        """Test that the json backend decodes response bodies."""
+        client = DexPaprikaClient(json_decoder="json")
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = MagicMock(content=b'{"pools": [1, 2]}')
+            self.assertEqual(client.get("/test_endpoint"), {"pools": [1, 2]})
+    
+    def test_auto_prefers_fast_backend(self):
+        """Test that auto picks the fastest installed backend."""
+        backends = available_backends()
+        self.assertEqual(backends[-1], "json")
+        if backends[0] == "orjson":
+            import orjson
+            self.assertIs(get_decoder("auto"), orjson.loads)
+    
+    def test_custom_decoder(self):
+        """Test that a callable decoder receives the raw body."""
+        bodies = []
+        
+        def decode(body):
+            bodies.append(body)
+            return {"decoded": True}
+        
+        client = DexPaprikaClient(json_decoder=decode)
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = MagicMock(content=b'{"x": 1}')
+            self.assertEqual(client.get("/test_endpoint"), {"decoded": True})
+        self.assertEqual(bodies, [b'{"x": 1}'])
+    
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected."""
+        with self.assertRaises(ValueError):
+            DexPaprikaClient(json_decoder="simplejson")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test script to verify split OHLCV history fetching in the DexPaprika SDK.
+"""
+
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from dexpaprika_sdk import DexPaprikaClient, OHLCVHistoryResponse
+
+from helpers import FakeOHLCV, fmt
+
+
+class TestOHLCVHistory(unittest.TestCase):
+    """Test suite for PoolsAPI.get_ohlcv_history."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.client = DexPaprikaClient(max_retries=0)
+        self.start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def test_splits_into_legal_windows(self):
+        """Test that a month of 1m candles is fetched in 366-candle windows and stitched."""
+        step = timedelta(minutes=1)
+        end = self.start + timedelta(days=30)
+        fake = FakeOHLCV(step)
+
+        with patch('requests.Session.request', side_effect=fake):
+            result = self.client.pools.get_ohlcv_history(
+                "ethereum", "0xabc", self.start, end, interval="1m", max_concurrency=8,
+            )
+
+        expected = 30 * 24 * 60
+        self.assertIsInstance(result, OHLCVHistoryResponse)
+        self.assertEqual(len(fake.calls), -(-expected // 366))
+        self.assertEqual(len(result.records), expected)
+        self.assertEqual(result.records[0].time_open, "2024-01-01T00:00:00Z")
+        self.assertEqual(result.records[-1].time_open, fmt(end - step))
+        self.assertEqual(result.gaps, [])
+        self.assertEqual(result.errors, [])
+
+    def test_daily_windows_respect_one_year_span(self):
+        """Test that 24h candles over several years use windows of at most a year."""
+        fake = FakeOHLCV(timedelta(days=1))
+
+        with patch('requests.Session.request', side_effect=fake):
+            result = self.client.pools.get_ohlcv_history("ethereum", "0xabc", "2021-01-01", "2024-03-01")
+
+        self.assertEqual(len(fake.calls), 4)
+        self.assertEqual(len(result.records), (datetime(2024, 3, 1) - datetime(2021, 1, 1)).days)
+
+    def test_reports_gaps(self):
+        """Test that missing candles are reported as gaps."""
+        step = timedelta(hours=1)
+        holes = [self.start + 5 * step, self.start + 6 * step, self.start + 23 * step]
+        fake = FakeOHLCV(step, holes=holes)
+
+        with patch('requests.Session.request', side_effect=fake):
+            result = self.client.pools.get_ohlcv_history(
+                "ethereum", "0xabc", self.start, self.start + timedelta(days=1), interval="1h",
+            )
+
+        self.assertEqual(len(result.records), 21)
+        self.assertEqual(
+            [(g.time_start, g.time_end, g.missing) for g in result.gaps],
+            [
+                ("2024-01-01T05:00:00Z", "2024-01-01T07:00:00Z", 2),
+                ("2024-01-01T23:00:00Z", "2024-01-02T00:00:00Z", 1),
+            ],
+        )
+
+    def test_failed_window_reported(self):
+        """Test that a failing window is reported without failing the others."""
+        step = timedelta(minutes=1)
+        failing = self.start + 366 * step
+        fake = FakeOHLCV(step, failing_starts=[failing])
+
+        with patch('requests.Session.request', side_effect=fake):
+            result = self.client.pools.get_ohlcv_history(
+                "ethereum", "0xabc", self.start, self.start + 1000 * step, interval="1m",
+            )
+
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(result.errors[0].start, fmt(failing))
+        # the previous window's boundary candle covers the failed window's first minute
+        self.assertEqual(len(result.records), 1000 - 365)
+        self.assertEqual([g.missing for g in result.gaps], [365])
+
+    def test_backfill_leaves_cache_empty(self):
+        """Test that history windows bypass the response and model caches."""
+        fake = FakeOHLCV(timedelta(hours=1))
+
+        with patch('requests.Session.request', side_effect=fake):
+            self.client.pools.get_ohlcv_history(
+                "ethereum", "0xabc", self.start, self.start + timedelta(days=30), interval="1h",
+            )
+
+        self.assertEqual(len(fake.calls), 2)
+        self.assertEqual(len(self.client.pools._cache), 0)
+
+    def test_async_backfill_leaves_cache_empty(self):
+        """Test that the async client's history windows bypass the cache too."""
+        httpx = pytest.importorskip("httpx")
+        from dexpaprika_sdk import AsyncDexPaprikaClient
+
+        fake = FakeOHLCV(timedelta(hours=1))
+
+        async def fake_request(method, url, params=None, **kwargs):
+            payload = fake(params=params).json.return_value
+            return httpx.Response(200, json=payload, request=httpx.Request(method, url))
+
+        async def run():
+            client = AsyncDexPaprikaClient(max_retries=0)
+            try:
+                with patch.object(httpx.AsyncClient, "request", side_effect=fake_request):
+                    result = await client.pools.get_ohlcv_history(
+                        "ethereum", "0xabc", self.start, self.start + timedelta(days=30), interval="1h",
+                    )
+                return result, len(client.pools._cache)
+            finally:
+                await client.aclose()
+
+        result, cached = asyncio.run(run())
+        self.assertEqual(len(result.records), 30 * 24)
+        self.assertEqual(cached, 0)
+
+    def test_validation(self):
+        """Test that invalid arguments raise ValueError."""
+        with self.assertRaises(ValueError):
+            self.client.pools.get_ohlcv_history("ethereum", "0xabc", "2024-01-02", "2024-01-01")
+        with self.assertRaises(ValueError):
+            self.client.pools.get_ohlcv_history("ethereum", "0xabc", "2024-01-01", interval="2h")
+        with self.assertRaises(ValueError):
+            self.client.pools.get_ohlcv_history("ethereum", "", "2024-01-01")
+
+
+if __name__ == "__main__":
+    unittest.main()
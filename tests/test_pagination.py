@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Test script to verify auto-paginating iterators in the DexPaprika SDK.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from dexpaprika_sdk import DexPaprikaClient
+
+
+TOKEN = {"id": "t", "name": "T", "symbol": "T", "chain": "ethereum", "decimals": 18, "added_at": "2024-01-01"}
+
+
+def make_pool(pool_id):
+    return {
+        "id": pool_id, "dex_id": "uniswap_v3", "dex_name": "Uniswap V3", "chain": "ethereum",
+        "volume_usd": 1.0, "created_at": "2024-01-01", "created_at_block_number": 1,
+        "transactions": 1, "price_usd": 1.0, "tokens": [TOKEN],
+    }
+
+
+def make_tx(tx_id):
+    return {
+        "id": tx_id, "log_index": 0, "transaction_index": 0, "pool_id": "p", "sender": "s",
+        "recipient": "r", "token_0": "a", "token_1": "b", "amount_0": 1, "amount_1": 2,
+        "created_at_block_number": 1,
+    }
+
+
+def pools_pages(total_items, limit, total_pages=True):
+    """Fake /pools endpoint serving ``total_items`` pools in pages of ``limit``."""
+    def respond(method=None, url=None, params=None, **kwargs):
+        page = params["page"]
+        start = page * limit
+        ids = [f"pool_{i}" for i in range(start, min(start + limit, total_items))]
+        page_info = {"limit": limit, "page": page}
+        if total_pages:
+            page_info["total_pages"] = -(-total_items // limit)
+        response = MagicMock()
+        response.json.return_value = {"pools": [make_pool(i) for i in ids], "page_info": page_info}
+        response.content = json.dumps(response.json.return_value).encode()
+        return response
+    return respond
+
+
+class TestPagination(unittest.TestCase):
+    """Test suite for iter_* streaming methods."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.client = DexPaprikaClient(max_retries=0)
+
+    def test_iterates_all_pages(self):
+        """Test that iteration walks every page reported by total_pages."""
+        with patch('requests.Session.request', side_effect=pools_pages(25, 10)) as mock_request:
+            ids = [pool.id for pool in self.client.pools.iter_list_by_network("ethereum", limit=10)]
+
+        self.assertEqual(ids, [f"pool_{i}" for i in range(25)])
+        self.assertEqual(mock_request.call_count, 3)
+
+    def test_is_lazy(self):
+        """Test that pages are only fetched as items are consumed."""
+        with patch('requests.Session.request', side_effect=pools_pages(25, 10)) as mock_request:
+            iterator = self.client.pools.iter_list_by_network("ethereum", limit=10)
+            self.assertEqual(mock_request.call_count, 0)
+            next(iterator)
+            self.assertEqual(mock_request.call_count, 1)
+
+    def test_max_items(self):
+        """Test that max_items stops iteration without fetching further pages."""
+        with patch('requests.Session.request', side_effect=pools_pages(100, 10)) as mock_request:
+            pools = list(self.client.pools.iter_list_by_network("ethereum", limit=10, max_items=15))
+
+        self.assertEqual(len(pools), 15)
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_prefetch(self):
+        """Test that prefetching yields the same items in the same order."""
+        with patch('requests.Session.request', side_effect=pools_pages(45, 10)) as mock_request:
+            ids = [p.id for p in self.client.pools.iter_list_by_dex("ethereum", "uniswap_v3", limit=10, prefetch=True)]
+
+        self.assertEqual(ids, [f"pool_{i}" for i in range(45)])
+        self.assertEqual(mock_request.call_count, 5)
+
+    def test_sweep_bypasses_cache(self):
+        """Test that sweeps keep cache size flat instead of storing every page."""
+        cache = self.client.pools._cache
+        with patch('requests.Session.request', side_effect=pools_pages(500, 10)):
+            self.client.pools.list_by_network("ethereum", limit=10)
+            sizes = set()
+            for count, _ in enumerate(self.client.pools.iter_list_by_network("ethereum", limit=10, window=4)):
+                if count % 10 == 0:
+                    sizes.add(len(cache))
+
+        self.assertEqual(count, 499)
+        self.assertEqual(sizes, {1})
+        self.assertEqual(len(cache), 1)
+
+    def test_start_page_stops_at_last_page(self):
+        """Test that iterating from a later page stops at the feed's last page."""
+        with patch('requests.Session.request', side_effect=pools_pages(50, 10)) as mock_request:
+            ids = [p.id for p in self.client.pools.iter_list_by_network("ethereum", limit=10, start_page=3)]
+
+        self.assertEqual(ids, [f"pool_{i}" for i in range(30, 50)])
+        self.assertEqual([call.kwargs["params"]["page"] for call in mock_request.call_args_list], [3, 4])
+
+    def test_one_based_start_page(self):
+        """Test that endpoints numbering pages from 1 stop at their last page."""
+        requested = []
+
+        def fetch_page(page, cursor):
+            requested.append(page)
+            return {"items": [page], "page_info": {"limit": 1, "page": page, "total_pages": 5}}
+
+        items = list(self.client.pools._iter_items(fetch_page, "items", 3, base_page=1))
+        self.assertEqual(items, [3, 4, 5])
+        self.assertEqual(requested, [3, 4, 5])
+
+    def test_stops_on_short_page_without_totals(self):
+        """Test that iteration stops on a short page when total_pages is missing."""
+        with patch('requests.Session.request', side_effect=pools_pages(23, 10, total_pages=False)) as mock_request:
+            pools = list(self.client.pools.iter_list_by_network("ethereum", limit=10))
+
+        self.assertEqual(len(pools), 23)
+        self.assertEqual(mock_request.call_count, 3)
+
+    def test_follows_next_cursor(self):
+        """Test that transaction iteration follows next_cursor."""
+        pages = {
+            None: (["tx_0", "tx_1"], "c1"),
+            "c1": (["tx_2", "tx_3"], "c2"),
+            "c2": (["tx_4"], None),
+        }
+
+        def respond(method=None, url=None, params=None, **kwargs):
+            ids, next_cursor = pages[params.get("cursor")]
+            response = MagicMock()
+            response.json.return_value = {
+                "transactions": [make_tx(i) for i in ids],
+                "page_info": {"limit": 2, "page": 0, "next_cursor": next_cursor},
+            }
+            response.content = json.dumps(response.json.return_value).encode()
+            return response
+
+        with patch('requests.Session.request', side_effect=respond):
+            ids = [tx.id for tx in self.client.pools.iter_transactions("ethereum", "0xabc", limit=2)]
+
+        self.assertEqual(ids, ["tx_0", "tx_1", "tx_2", "tx_3", "tx_4"])
+
+    def test_validation_is_eager(self):
+        """Test that invalid arguments raise before iteration starts."""
+        with self.assertRaises(ValueError):
+            self.client.pools.iter_list_by_network("ethereum", limit=101)
+        with self.assertRaises(ValueError):
+            self.client.tokens.iter_top("")
+
+
+class TestSweep(unittest.TestCase):
+    """Test suite for windowed parallel page fetching."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.client = DexPaprikaClient(max_retries=0)
+
+    def test_window_fetches_concurrently_in_order(self):
+        """Test that pages are fetched in parallel but yielded in page order."""
+        serve = pools_pages(200, 10)
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def respond(*args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            # later pages finish first to check ordering
+            time.sleep(0.02 * (1 + (20 - kwargs["params"]["page"]) % 3))
+            with lock:
+                in_flight[0] -= 1
+            return serve(**kwargs)
+
+        with patch('requests.Session.request', side_effect=respond) as mock_request:
+            ids = [p.id for p in self.client.pools.iter_list_by_network("ethereum", limit=10, window=4)]
+
+        self.assertEqual(ids, [f"pool_{i}" for i in range(200)])
+        self.assertEqual(mock_request.call_count, 20)
+        self.assertGreater(peak[0], 1)
+        self.assertLessEqual(peak[0], 4)
+
+    def test_stops_on_empty_page(self):
+        """Test that the sweep stops issuing requests after an empty page."""
+        serve = pools_pages(30, 10)
+
+        def respond(method=None, url=None, params=None, **kwargs):
+            response = serve(params=params)
+            # server claims 100 pages but only 3 have data
+            response.json.return_value["page_info"]["total_pages"] = 100
+            response.content = json.dumps(response.json.return_value).encode()
+            response.content = json.dumps(response.json.return_value).encode()
+            return response
+
+        with patch('requests.Session.request', side_effect=respond) as mock_request:
+            pools = list(self.client.pools.iter_list_by_network("ethereum", limit=10, window=3))
+
+        self.assertEqual(len(pools), 30)
+        # first page + at most one window of requests past the empty page
+        self.assertLessEqual(mock_request.call_count, 1 + 3 + 3)
+
+    def test_start_page_sweep_stops_at_last_page(self):
+        """Test that a sweep from a later page requests no pages past the feed's end."""
+        with patch('requests.Session.request', side_effect=pools_pages(50, 10)) as mock_request:
+            ids = [p.id for p in self.client.pools.iter_list_by_network("ethereum", limit=10, start_page=3, window=3)]
+
+        self.assertEqual(ids, [f"pool_{i}" for i in range(30, 50)])
+        self.assertEqual(sorted(call.kwargs["params"]["page"] for call in mock_request.call_args_list), [3, 4])
+
+        requested = []
+
+        def fetch_page(page, cursor):
+            requested.append(page)
+            return {"items": [page], "page_info": {"limit": 1, "page": page, "total_pages": 5}}
+
+        # endpoints numbering pages from 1
+        self.assertEqual(list(self.client.pools._iter_items(fetch_page, "items", 2, window=3, base_page=1)),
+                         [2, 3, 4, 5])
+        self.assertEqual(sorted(requested), [2, 3, 4, 5])
+
+    def test_window_validation(self):
+        """Test that window must be at least 1."""
+        with self.assertRaises(ValueError):
+            self.client.pools.iter_list_by_network("ethereum", window=0)
+
+
+class TestAsyncPagination(unittest.TestCase):
+    """Test suite for async iter_* methods."""
+
+    def test_async_iteration(self):
+        """Test that async iterators stream all pages, with prefetch."""
+        httpx = pytest.importorskip("httpx")
+        from dexpaprika_sdk import AsyncDexPaprikaClient
+
+        respond = pools_pages(25, 10)
+
+        async def fake_request(method, url, params=None, **kwargs):
+            payload = respond(params=params).json.return_value
+            return httpx.Response(200, json=payload, request=httpx.Request(method, url))
+
+        async def run():
+            client = AsyncDexPaprikaClient(max_retries=0)
+            with patch.object(httpx.AsyncClient, "request", side_effect=fake_request):
+                return [p.id async for p in client.pools.iter_list_by_network("ethereum", limit=10, prefetch=True)]
+
+        self.assertEqual(asyncio.run(run()), [f"pool_{i}" for i in range(25)])
+
+    def test_async_start_page(self):
+        """Test that async iteration from a later page stops at the feed's last page."""
+        httpx = pytest.importorskip("httpx")
+        from dexpaprika_sdk import AsyncDexPaprikaClient
+
+        respond = pools_pages(50, 10)
+        requested = []
+
+        async def fake_request(method, url, params=None, **kwargs):
+            requested.append(params["page"])
+            payload = respond(params=params).json.return_value
+            return httpx.Response(200, json=payload, request=httpx.Request(method, url))
+
+        async def run():
+            client = AsyncDexPaprikaClient(max_retries=0)
+            with patch.object(httpx.AsyncClient, "request", side_effect=fake_request):
+                return [p.id async for p in client.pools.iter_list_by_network("ethereum", limit=10, start_page=3)]
+
+        self.assertEqual(asyncio.run(run()), [f"pool_{i}" for i in range(30, 50)])
+        self.assertEqual(requested, [3, 4])
+
+    def test_async_sweep(self):
+        """Test that the async sweep yields every page in order."""
+        httpx = pytest.importorskip("httpx")
+        from dexpaprika_sdk import AsyncDexPaprikaClient
+
+        respond = pools_pages(95, 10)
+
+        async def fake_request(method, url, params=None, **kwargs):
+            await asyncio.sleep(0.01 * (params["page"] % 3))
+            payload = respond(params=params).json.return_value
+            return httpx.Response(200, json=payload, request=httpx.Request(method, url))
+
+        async def run():
+            client = AsyncDexPaprikaClient(max_retries=0)
+            with patch.object(httpx.AsyncClient, "request", side_effect=fake_request):
+                return [p.id async for p in client.pools.iter_list_by_network("ethereum", limit=10, window=5)]
+
+        self.assertEqual(asyncio.run(run()), [f"pool_{i}" for i in range(95)])
+
+
+    def test_async_start_page_sweep(self):
+        """Test that an async sweep from a later page stops at the feed's last page."""
+        httpx = pytest.importorskip("httpx")
+        from dexpaprika_sdk import AsyncDexPaprikaClient
+
+        respond = pools_pages(50, 10)
+        requested = []
+
+        async def fake_request(method, url, params=None, **kwargs):
+            requested.append(params["page"])
+            payload = respond(params=params).json.return_value
+            return httpx.Response(200, json=payload, request=httpx.Request(method, url))
+
+        async def run():
+            client = AsyncDexPaprikaClient(max_retries=0)
+            with patch.object(httpx.AsyncClient, "request", side_effect=fake_request):
+                return [p.id async for p in client.pools.iter_list_by_network(
+                    "ethereum", limit=10, start_page=3, window=3)]
+
+        self.assertEqual(asyncio.run(run()), [f"pool_{i}" for i in range(30, 50)])
+        self.assertEqual(sorted(requested), [3, 4])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test script to verify client-side rate limiting in the DexPaprika SDK.
+"""
+
+import asyncio
+import json
+import threading
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+from dexpaprika_sdk import DexPaprikaClient, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test suite for TokenBucket."""
+
+    def test_burst_then_rate(self):
+        """Test that a full bucket allows a burst, then spaces requests by 1/rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0])
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+        clock.now = 10.0
+        # refilled, but never above the burst size
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0])
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+
+    def test_invalid(self):
+        """Test that non-positive rates are rejected."""
+        with self.assertRaises(ValueError):
+            TokenBucket(0)
+        with self.assertRaises(ValueError):
+            TokenBucket(1, burst=0.5)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test suite for RateLimiter."""
+
+    def test_endpoint_patterns(self):
+        """Test that endpoint budgets apply only to matching paths, on top of the global one."""
+        clock = FakeClock()
+        limiter = RateLimiter(100, endpoints={"/networks/*/pools/*/ohlcv": (1, 1)}, clock=clock)
+        ohlcv = "/networks/ethereum/pools/0xabc/ohlcv"
+
+        self.assertEqual(limiter.reserve(ohlcv), 0)
+        self.assertAlmostEqual(limiter.reserve(ohlcv), 1.0)
+        self.assertEqual(limiter.reserve("/networks/ethereum/pools/0xabc"), 0)
+        self.assertEqual(limiter.throttled, 1)
+
+    def test_global_limit_shared_across_threads(self):
+        """Test that concurrent reservations never overbook the bucket."""
+        clock = FakeClock()
+        limiter = RateLimiter(10, burst=10, clock=clock)
+        delays = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(25):
+                delay = limiter.reserve("/networks")
+                with lock:
+                    delays.append(delay)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 200 requests at 10/s after a burst of 10: slots are unique and evenly spaced
+        self.assertEqual(sorted(round(d, 6) for d in delays),
+                         [0.0] * 10 + [round(i / 10, 6) for i in range(1, 191)])
+
+
+class TestClientRateLimit(unittest.TestCase):
+    """Test suite for rate limiting in DexPaprikaClient.request."""
+
+    def respond(self, *args, **kwargs):
+        return MagicMock(content=json.dumps({"ok": True}).encode())
+
+    def test_requests_wait_for_slot(self):
+        """Test that requests beyond the burst sleep until their slot."""
+        limiter = RateLimiter(5, burst=2, clock=FakeClock())
+        client = DexPaprikaClient(rate_limit=limiter)
+        with patch('requests.Session.request', side_effect=self.respond), \
+                patch('dexpaprika_sdk.ratelimit.time.sleep') as sleep:
+            for _ in range(4):
+                client.get("/stats")
+
+        self.assertEqual([round(c.args[0], 6) for c in sleep.call_args_list], [0.2, 0.4])
+
+    def test_float_shorthand(self):
+        """Test that a number creates a global limiter."""
+        client = DexPaprikaClient(rate_limit=20)
+        self.assertIsInstance(client.rate_limiter, RateLimiter)
+        self.assertIsNone(DexPaprikaClient().rate_limiter)
+
+    def test_async_acquire(self):
+        """Test that async acquisition sleeps on the event loop."""
+        limiter = RateLimiter(1, burst=1, clock=FakeClock())
+
+        async def run():
+            with patch('dexpaprika_sdk.ratelimit.asyncio.sleep', new_callable=AsyncMock) as sleep:
+                await limiter.acquire_async("/stats")
+                await limiter.acquire_async("/stats")
+                return [c.args[0] for c in sleep.call_args_list]
+
+        self.assertEqual(asyncio.run(run()), [1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
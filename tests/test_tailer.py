@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the transaction tailer in the DexPaprika SDK.
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from dexpaprika_sdk import DexPaprikaClient, TransactionTailer, AsyncTransactionTailer
+
+
+def make_tx(tx_id, block, log_index=0):
+    return {
+        "id": tx_id, "log_index": log_index, "transaction_index": 0, "pool_id": "p", "sender": "s",
+        "recipient": "r", "token_0": "a", "token_1": "b", "amount_0": 1, "amount_1": 2,
+        "created_at_block_number": block,
+    }
+
+
+class FakeFeed:
+    """Fake transactions endpoint serving a growing, newest-first feed per pool."""
+
+    def __init__(self, page_size=2):
+        self.page_size = page_size
+        self.feeds = {}
+        self.calls = []
+        self.failing = set()
+
+    def add(self, pool, *txs):
+        self.feeds.setdefault(pool, [])[:0] = list(reversed(txs))
+
+    def __call__(self, method=None, url=None, params=None, **kwargs):
+        pool = url.split("/pools/")[1].split("/")[0]
+        self.calls.append((pool, dict(params)))
+        if pool in self.failing:
+            raise ValueError("boom")
+        feed = self.feeds.get(pool, [])
+        start = int(params.get("cursor") or 0)
+        page = feed[start:start + self.page_size]
+        more = start + self.page_size < len(feed)
+        response = MagicMock()
+        response.json.return_value = {
+            "transactions": page,
+            "page_info": {"limit": self.page_size, "page": 0,
+                          "next_cursor": str(start + self.page_size) if more else None},
+        }
+        response.content = json.dumps(response.json.return_value).encode()
+        return response
+
+
+class TestTransactionTailer(unittest.TestCase):
+    """Test suite for TransactionTailer."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.client = DexPaprikaClient(max_retries=0)
+        self.feed = FakeFeed()
+
+    def tail(self, *pools, **options):
+        return self.client.pools.tail_transactions(list(pools), **options)
+
+    def test_first_poll_primes_without_emitting(self):
+        """Test that existing transactions are recorded but not emitted by default."""
+        self.feed.add("p1", make_tx("a", 1), make_tx("b", 2))
+        tailer = self.tail(("ethereum", "p1"))
+
+        with patch('requests.Session.request', side_effect=self.feed):
+            self.assertEqual(tailer.poll(), [])
+        self.assertEqual(tailer.high_water_mark("ethereum", "p1"), 2)
+
+    def test_priming_fetches_one_page(self):
+        """Test that the first poll only fetches the newest page when not emitting it."""
+        self.feed.add("p1", *(make_tx(f"t{i}", i) for i in range(1, 11)))
+        tailer = self.tail(("ethereum", "p1"))
+
+        with patch('requests.Session.request', side_effect=self.feed):
+            self.assertEqual(tailer.poll(), [])
+            self.assertEqual(len(self.feed.calls), 1)
+            self.assertEqual(tailer.high_water_mark("ethereum", "p1"), 10)
+
+            self.feed.add("p1", make_tx("new", 11))
+            self.assertEqual([tx.id for tx in tailer.poll(force=True)], ["new"])
+
+    def test_include_existing(self):
+        """Test that include_existing emits the first poll, oldest first."""
+        self.feed.add("p1", make_tx("a", 1), make_tx("b", 2), make_tx("c", 3))
+        tailer = self.tail(("ethereum", "p1"), include_existing=True)
+
+        with patch('requests.Session.request', side_effect=self.feed):
+            ids = [tx.id for tx in tailer.poll()]
+        self.assertEqual(ids, ["a", "b", "c"])
+
+    def test_emits_only_new_transactions(self):
+        """Test that later polls emit only unseen transactions, following next_cursor."""
+        self.feed.add("p1", make_tx("a", 1), make_tx("b", 2))
+        tailer = self.tail(("ethereum", "p1"))
+
+        with patch('requests.Session.request', side_effect=self.feed):
+            tailer.poll()
+            self.feed.add("p1", make_tx("c", 3), make_tx("d", 3, log_index=1), make_tx("e", 4))
+            self.feed.calls.clear()
+            first = [tx.id for tx in tailer.poll(force=True)]
+            first_calls = list(self.feed.calls)
+            second = tailer.poll(force=True)
+
+        self.assertEqual(first, ["c", "d", "e"])
+        self.assertEqual(second, [])
+        # three new transactions span two pages of two
+        self.assertEqual(len(first_calls), 2)
+        self.assertIn("from", first_calls[0][1])
+        self.assertEqual(tailer.high_water_mark("ethereum", "p1"), 4)
+
+    def test_dedupes_on_id_and_log_index(self):
+        """Test that one transaction hash with several logs yields each log once."""
+        tailer = self.tail(("ethereum", "p1"))
+        self.feed.add("p1", make_tx("a", 1))
+
+        with patch('requests.Session.request', side_effect=self.feed):
+            tailer.poll()
+            self.feed.add("p1", make_tx("b", 2, log_index=0), make_tx("b", 2, log_index=1))
+            new = tailer.poll(force=True)
+
+        self.assertEqual([(tx.id, tx.log_index) for tx in new], [("b", 0), ("b", 1)])
+
+    def test_failing_pool_does_not_stop_others(self):
+        """Test that one pool's error is recorded while other pools keep polling."""
+        self.feed.add("p1", make_tx("a", 1))
+        self.feed.add("p2", make_tx("x", 1))
+        self.feed.failing.add("p2")
+        tailer = self.tail(("ethereum", "p1"), ("ethereum", "p2"))
+
+        with patch('requests.Session.request', side_effect=self.feed):
+            tailer.poll()
+            self.feed.add("p1", make_tx("b", 2))
+            new = tailer.poll(force=True)
+
+        self.assertEqual([tx.id for tx in new], ["b"])
+        self.assertIn(("ethereum", "p2"), tailer.errors)
+        self.assertNotIn(("ethereum", "p1"), tailer.errors)
+
+    def test_adaptive_interval(self):
+        """Test that quiet pools back off and active pools speed up."""
+        self.feed.add("p1", make_tx("a", 1))
+        tailer = self.tail(("ethereum", "p1"), min_interval=1, max_interval=10)
+        state = tailer._pools[("ethereum", "p1")]
+
+        with patch('requests.Session.request', side_effect=self.feed):
+            tailer.poll()
+            for _ in range(10):
+                tailer.poll(force=True)
+            self.assertEqual(state.interval, 10)
+
+            self.feed.add("p1", make_tx("b", 2))
+            tailer.poll(force=True)
+            self.assertEqual(state.interval, 5)
+
+    def test_only_due_pools_are_polled(self):
+        """Test that poll() skips pools whose next poll is not due yet."""
+        tailer = self.tail(("ethereum", "p1"), min_interval=60, max_interval=60)
+
+        with patch('requests.Session.request', side_effect=self.feed):
+            tailer.poll()
+            tailer.poll()
+
+        self.assertEqual(len(self.feed.calls), 1)
+
+    def test_bypasses_cache(self):
+        """Test that polls always reach the API instead of the response cache."""
+        tailer = self.tail(("ethereum", "p1"))
+
+        with patch('requests.Session.request', side_effect=self.feed):
+            tailer.poll()
+            tailer.poll(force=True)
+
+        self.assertEqual(len(self.feed.calls), 2)
+        self.assertEqual(len(self.client.pools._cache), 0)
+
+    def test_validation(self):
+        """Test that invalid arguments raise ValueError."""
+        with self.assertRaises(ValueError):
+            self.tail(("ethereum", ""))
+        with self.assertRaises(ValueError):
+            self.tail(("ethereum", "p1"), min_interval=10, max_interval=1)
+        with self.assertRaises(ValueError):
+            TransactionTailer(self.client.pools, page_limit=101)
+
+
+class TestAsyncTransactionTailer(unittest.TestCase):
+    """Test suite for AsyncTransactionTailer."""
+
+    def test_async_tailer(self):
+        """Test that the async client's tailer primes, then emits new transactions of every pool."""
+        httpx = pytest.importorskip("httpx")
+        from dexpaprika_sdk import AsyncDexPaprikaClient
+
+        feed = FakeFeed()
+        feed.add("p1", make_tx("a", 1), make_tx("b", 2))
+        feed.add("p2", make_tx("x", 1))
+
+        async def fake_request(method, url, params=None, **kwargs):
+            payload = feed(url=url, params=params).json.return_value
+            return httpx.Response(200, json=payload, request=httpx.Request(method, url))
+
+        async def run():
+            client = AsyncDexPaprikaClient(max_retries=0)
+            tailer = client.pools.tail_transactions([("ethereum", "p1"), ("ethereum", "p2")], min_interval=0)
+            self.assertIsInstance(tailer, AsyncTransactionTailer)
+            with patch.object(httpx.AsyncClient, "request", side_effect=fake_request):
+                primed = await tailer.poll()
+                feed.add("p1", make_tx("c", 3))
+                feed.add("p2", make_tx("y", 2))
+                new = []
+                async for tx in tailer:
+                    new.append(tx.id)
+                    if len(new) == 2:
+                        break
+            return primed, new
+
+        primed, new = asyncio.run(run())
+        self.assertEqual(primed, [])
+        self.assertEqual(sorted(new), ["c", "y"])
+        with self.assertRaises(TypeError):
+            iter(AsyncTransactionTailer(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test script to verify that one DexPaprika client can be shared by many threads.
+"""
+
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+
+from dexpaprika_sdk import DexPaprikaClient
+from dexpaprika_sdk.api.cache import CacheEntry, ResponseCache
+from dexpaprika_sdk.utils.perf import get_perf_stats, reset_perf_stats
+
+THREADS = 64
+
+
+def token(address):
+    return {"id": address, "name": "Token", "symbol": "TKN", "chain": "ethereum",
+            "decimals": 18, "added_at": "2024-01-01T00:00:00Z"}
+
+
+class TestThreadSafety(unittest.TestCase):
+    """Stress tests hammering one client from many threads."""
+
+    def setUp(self):
+        """Set up test environment."""
+        reset_perf_stats()
+        self.requests = []
+        self.requests_lock = threading.Lock()
+
+    def fake_request(self, method=None, url=None, params=None, **kwargs):
+        with self.requests_lock:
+            self.requests.append(url)
+        time.sleep(0.005)
+        return MagicMock(content=json.dumps(token(url.rsplit("/", 1)[1])).encode())
+
+    def hammer(self, client, calls_per_thread, addresses):
+        barrier = threading.Barrier(THREADS)
+
+        def worker(n):
+            barrier.wait()
+            return [client.tokens.get_details("ethereum", addresses[(n + i) % len(addresses)])
+                    for i in range(calls_per_thread)]
+
+        with patch('requests.Session.request', side_effect=self.fake_request):
+            with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                return [r for results in executor.map(worker, range(THREADS)) for r in results]
+
+    def test_shared_client(self):
+        """Test that many threads get correct results, one fetch per key and exact stats."""
+        client = DexPaprikaClient(max_retries=0)
+        addresses = [f"0x{i:040x}" for i in range(16)]
+        results = self.hammer(client, 50, addresses)
+
+        self.assertEqual(len(results), THREADS * 50)
+        for result in results:
+            self.assertIn(result.id, addresses)
+        # concurrent misses are coalesced, hits are served from the cache
+        self.assertEqual(sorted(self.requests), sorted(
+            f"https://api.dexpaprika.com/networks/ethereum/tokens/{a}" for a in addresses))
+        # no samples lost to racing updates
+        self.assertEqual(get_perf_stats()["get_details"]["calls"], THREADS * 50)
+
+    def test_eviction_under_contention(self):
+        """Test that a cache smaller than the working set stays consistent under load."""
+        client = DexPaprikaClient(max_retries=0, cache_max_entries=8, cache_max_bytes=10_000)
+        addresses = [f"0x{i:040x}" for i in range(32)]
+        results = self.hammer(client, 20, addresses)
+
+        self.assertEqual(len(results), THREADS * 20)
+        cache = client.tokens._cache
+        self.assertLessEqual(len(cache), 8)
+        self.assertEqual(cache.total_bytes, sum(cache[key].size for key in cache.keys()))
+
+    def test_cache_operations(self):
+        """Test raw cache operations racing with clears from other threads."""
+        cache = ResponseCache(max_entries=100, max_bytes=50_000, purge_interval=0)
+        stop = threading.Event()
+
+        def writer(n):
+            for i in range(500):
+                key = f"{n}:{i % 150}"
+                cache.set(key, CacheEntry({"value": i}))
+                cache.get(key)
+                cache.discard(f"{n}:{(i + 7) % 150}")
+
+        def clearer():
+            while not stop.is_set():
+                cache.clear()
+                time.sleep(0.001)
+
+        thread = threading.Thread(target=clearer)
+        thread.start()
+        try:
+            with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                list(executor.map(writer, range(THREADS)))
+        finally:
+            stop.set()
+            thread.join()
+
+        self.assertLessEqual(len(cache), 100)
+        self.assertEqual(cache.total_bytes, sum(cache[key].size for key in cache.keys()))
+
+    def test_session_pool_size(self):
+        """Test that the default session pools enough connections for the workers."""
+        client = DexPaprikaClient(max_connections=THREADS)
+        adapter = client.session.get_adapter("https://api.dexpaprika.com")
+        self.assertEqual(adapter._pool_maxsize, THREADS)
+
+
+if __name__ == "__main__":
+    unittest.main()
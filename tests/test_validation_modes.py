@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test script to verify response validation modes in the DexPaprika SDK.
+"""
+
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+from dexpaprika_sdk import DexPaprikaClient, PoolDetails, TopTokensResponse
+from dexpaprika_sdk.models.base import construct_model
+from dexpaprika_sdk.models.pools import PoolsResponse, TransactionsResponse
+from dexpaprika_sdk.models.tokens import TokenDetails
+
+
+TOP_TOKENS = {
+    "tokens": [{
+        "address": "0xabc", "name": "Token", "symbol": "TKN", "chain": "ethereum", "decimals": 18,
+        "price_usd": 1.5, "24h": {"volume_usd": 1000.0, "txns": 10}, "1h": {"volume_usd": 50.0, "txns": 1},
+    }],
+    "page_info": {"limit": 1, "page": 0, "total_pages": 1},
+}
+
+TOKEN = {
+    "id": "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2", "name": "Wrapped Ether", "symbol": "WETH",
+    "chain": "ethereum", "decimals": 18, "added_at": "2024-09-11T02:36:23Z", "fdv": 8062357916.38,
+    "total_supply": 2880375.62, "description": "", "website": "", "explorer": "", "type": "", "status": "",
+    "has_image": True,
+}
+METRICS = {
+    "last_price_usd_change": -1.25, "volume_usd": 1523456.75, "buy_usd": 800000.5, "sell_usd": 723456.25,
+    "sells": 410, "buys": 512, "txns": 922,
+}
+POOLS = {
+    "pools": [{
+        "id": "0x88e6a0c2ddd26feeb64f039a2c41296fcb3f5640", "dex_id": "uniswap_v3", "dex_name": "Uniswap V3",
+        "chain": "ethereum", "volume_usd": 90123456.78, "created_at": "2021-05-05T21:42:11Z",
+        "created_at_block_number": 12376729, "transactions": 41234, "price_usd": 1.0,
+        "last_price_change_usd_5m": 0, "last_price_change_usd_1h": -0.01, "last_price_change_usd_24h": 0.02,
+        "fee": 500, "tokens": [TOKEN, dict(TOKEN, id="0xa0b8", symbol="USDC", decimals=6, fdv=None)],
+    }],
+    "page_info": {"limit": 1, "page": 0, "total_items": 2000, "total_pages": 2000},
+}
+POOL_DETAILS = {
+    "id": "0x88e6a0c2ddd26feeb64f039a2c41296fcb3f5640", "created_at_block_number": 12376729,
+    "chain": "ethereum", "created_at": "2021-05-05T21:42:11Z", "factory_id": "0x1f98431c8ad98523631ae4a59f267346ea31f984",
+    "dex_id": "uniswap_v3", "dex_name": "Uniswap V3", "tokens": [TOKEN], "last_price": 0.000389,
+    "last_price_usd": 1.0001, "fee": 500, "price_time": "2025-01-01T00:00:00Z",
+    "24h": METRICS, "6h": METRICS, "1h": METRICS, "30m": METRICS, "15m": METRICS, "5m": METRICS,
+}
+TRANSACTIONS = {
+    "transactions": [{
+        "id": "0x5f3d", "log_index": 12, "transaction_index": 3, "pool_id": "0x88e6",
+        "sender": "0x3fc9", "recipient": "0x7a25", "token_0": "0xa0b8", "token_1": "0xc02a",
+        "amount_0": "-1500.25", "amount_1": 0.5, "created_at_block_number": 21500000,
+    }],
+    "page_info": {"limit": 1, "page": 0, "total_items": 1, "total_pages": 1},
+}
+TOKEN_DETAILS = {
+    "id": TOKEN["id"], "name": "Wrapped Ether", "symbol": "WETH", "chain": "ethereum", "decimals": 18,
+    "total_supply": 2880375.62, "added_at": "2024-09-11T02:36:23Z", "last_updated": "2025-01-01T00:00:00Z",
+    "summary": {
+        "price_usd": 3412.5, "fdv": 8062357916.38, "liquidity_usd": 912345678.9, "pools": 1542,
+        "24h": METRICS, "6h": METRICS, "1h": METRICS, "30m": METRICS, "15m": METRICS, "5m": METRICS, "1m": METRICS,
+    },
+}
+
+
+def respond_with(payload):
+    return MagicMock(content=json.dumps(payload).encode())
+
+
+class TestValidationModes(unittest.TestCase):
+    """Test suite for the client's validation setting."""
+
+    def get_top(self, validation, payload=TOP_TOKENS):
+        client = DexPaprikaClient(max_retries=0, validation=validation)
+        with patch('requests.Session.request', return_value=respond_with(payload)):
+            return client.tokens.get_top("ethereum", limit=1)
+
+    def test_trusted_matches_full(self):
+        """Test that trusted construction builds the same nested models as validation."""
+        full = self.get_top("full")
+        trusted = self.get_top("trusted")
+
+        self.assertIsInstance(trusted, TopTokensResponse)
+        self.assertEqual(trusted, full)
+        # aliases are honored in nested models
+        self.assertEqual(trusted.tokens[0].day.txns, 10)
+        self.assertEqual(trusted.tokens[0].hour1.volume_usd, 50.0)
+        self.assertIsNone(trusted.tokens[0].minute5)
+        self.assertEqual(trusted.page_info.total_pages, 1)
+
+    def test_trusted_matches_full_on_fixtures(self):
+        """Test that trusted construction matches validation for each response shape."""
+        for model, payload in [
+            (PoolsResponse, POOLS),
+            (PoolDetails, POOL_DETAILS),
+            (TopTokensResponse, TOP_TOKENS),
+            (TransactionsResponse, TRANSACTIONS),
+            (TokenDetails, TOKEN_DETAILS),
+        ]:
+            with self.subTest(model=model.__name__):
+                full = model(**payload)
+                trusted = construct_model(model, payload)
+                self.assertEqual(trusted, full)
+                self.assertEqual(trusted.model_fields_set, full.model_fields_set)
+                self.assertEqual(trusted.model_dump(by_alias=True), full.model_dump(by_alias=True))
+
+    def test_trusted_nested_aliases(self):
+        """Test that aliased nested models are built at every level."""
+        details = construct_model(TokenDetails, TOKEN_DETAILS)
+        self.assertEqual(details.summary.day, PoolDetails(**POOL_DETAILS).day)
+        self.assertEqual(details.summary.minute1.txns, 922)
+        self.assertEqual(details.description, "")
+
+        pools = construct_model(PoolsResponse, POOLS)
+        self.assertEqual(pools.pools[0].tokens[1].symbol, "USDC")
+        self.assertIsNone(pools.pools[0].volume_usd_7d)
+
+    def test_trusted_skips_validation(self):
+        """Test that trusted mode accepts payloads full validation would reject."""
+        bad = json.loads(json.dumps(TOP_TOKENS))
+        bad["tokens"][0]["decimals"] = "not a number"
+
+        with self.assertRaises(Exception):
+            self.get_top("full", bad)
+        self.assertEqual(self.get_top("trusted", bad).tokens[0].decimals, "not a number")
+
+    def test_none_returns_raw_data(self):
+        """Test that validation="none" returns the decoded JSON."""
+        result = self.get_top("none")
+        self.assertEqual(result, TOP_TOKENS)
+
+    def test_none_iterators_yield_dicts(self):
+        """Test that iterators page through raw responses."""
+        client = DexPaprikaClient(max_retries=0, validation="none")
+        with patch('requests.Session.request', return_value=respond_with(TOP_TOKENS)):
+            tokens = list(client.tokens.iter_top("ethereum", limit=1))
+        self.assertEqual(tokens, TOP_TOKENS["tokens"])
+
+    def test_construct_by_field_name(self):
+        """Test that construct_model also accepts field names instead of aliases."""
+        details = construct_model(PoolDetails, {"id": "p", "day": {"volume_usd": 1.0}})
+        self.assertEqual(details.id, "p")
+        self.assertEqual(details.day.volume_usd, 1.0)
+
+    def test_invalid_mode(self):
+        """Test that unknown validation modes are rejected."""
+        with self.assertRaises(ValueError):
+            DexPaprikaClient(validation="partial")
+
+
+if __name__ == "__main__":
+    unittest.main()